@@ -8,7 +8,9 @@
 Tests for fmx-writing
 """
 
-from fedempy.write_fmx import write, read
+from numpy import arange, array_equal
+
+from fedempy.write_fmx import write, read, write_array, read_array, read_blocks
 
 fnam = b"testfil"
 data = [1.0, 2.0, 3.0, 4.0]
@@ -46,5 +48,18 @@ status += read(fnam, 3, new_data)
 for i in range(0, 4):
     if data[i] != new_data[i]:
         status -= 1
+if status < 0:
+    exit(status)
+
+# Write and read a larger stiffness matrix via NumPy, in blocks of 3 columns
+matrix = arange(100.0).reshape((10, 10), order="F")
+status += write_array(fnam, 1, matrix, 3)
+if status < 0:
+    exit(status)
+if not array_equal(read_array(fnam, 1), matrix):
+    status -= 1
+for icol, block in read_blocks(fnam, 1, 10, 4):
+    if not array_equal(block, matrix[:, icol : icol + 4]):
+        status -= 1
 
 exit(status)
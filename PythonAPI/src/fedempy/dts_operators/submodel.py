@@ -7,6 +7,26 @@
 """
 Convenience functions for running FEDEM sub-model simulations as an operator.
 To use, call sub_model_run(df) with input data in df.
+
+Each sub-model folder should either contain a precomputed nodal mapping file
+(`*.map`), or a `fedem_solmap.fco` file with the options for computing it
+(e.g., `-ftlFile`, `-nodeFile`, `-translate`, `-rotate`). In the latter case,
+the computed mapping file is stored in a persistent cache directory, such that
+the point search is performed only once for each combination of the options
+and the content of the FE data- and nodal coordinate files.
+
+Sibling sub-models are independent of each other once the recovery file of
+their parent model exists. They can therefore be solved concurrently, in a pool
+of worker processes, by setting the environment variable FEDEM_SUBMODEL_NPROC
+to the number of processes to use. Each worker solves a complete sub-tree in a
+separate output folder, and returns the strain gauge outputs it computed.
+
+Alternatively, by setting the environment variable FEDEM_SUBMODEL_INCORE=1,
+the global model and its sub-models are solved simultaneously, and the
+sub-model displacements are passed in core instead of via recovery files.
+This requires that all sub-models are bottom-level models, and that their
+`fedem_solmap.fco` file specifies the base ID of the parent FE part (`-partId`).
+Only the translations are then mapped onto the sub-models.
 """
 
 import glob
@@ -14,15 +34,28 @@ import json
 import logging
 import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from multiprocessing import get_context
+from shutil import rmtree
 from subprocess import CalledProcessError, run
 
 import numpy as np
 import pandas as pd
 
+from fedempy.file_utils import atomic_output
 from fedempy.solver import FedemSolver
 
 log = logging.getLogger(__name__)
 
+# Options of the mapping search which refer to input files
+_SEARCH_FILES = ("-ftlFile", "-subFile", "-nodeFile")
+# Options which do not affect the mapping results
+_IGNORED_OPTIONS = ("-mapFile", "-frsFile", "-outFile", "-debug", "-numThreads")
+
+# Mapping file cache keys, with the file states they were computed from
+_map_keys = {}
+
 
 def _common_args(model_dir, out_dir, result_id):
     solver_args = [
@@ -53,6 +86,193 @@ def _recovery_args(out_dir, frs_file):
     ]
 
 
+def _search_options(opt_file):
+    """
+    Returns the mapping search options of a sub-model (one per line),
+    and the absolute paths of the input files they refer to.
+    """
+    model_dir = os.path.dirname(opt_file)
+    options = []
+    in_files = [opt_file]
+    with open(opt_file, "r") as fd:
+        for line in fd:
+            line = line.strip()
+            if not line or line[0] == "#" or line.startswith(_IGNORED_OPTIONS):
+                continue
+            options.append(line)
+            name, _, value = line.partition("=")
+            if name.strip() in _SEARCH_FILES:
+                in_files.append(os.path.join(model_dir, value.strip().strip('"')))
+
+    return options, in_files
+
+
+def _mapping_key(opt_file):
+    """
+    Returns the cache key of the nodal mapping of a sub-model, i.e., a checksum
+    of the mapping search options and the content of the files they refer to.
+    The key is memoized per options file, and is recomputed only if
+    any of the input files have been modified since the last call.
+    """
+    options, in_files = _search_options(opt_file)
+    file_state = tuple((os.stat(f).st_mtime_ns, os.stat(f).st_size) for f in in_files)
+    if opt_file in _map_keys and _map_keys[opt_file][0] == file_state:
+        return _map_keys[opt_file][1]
+
+    hasher = sha256()
+    for option in options:
+        hasher.update(option.encode("utf-8"))
+    for in_file in in_files[1:]:
+        with open(in_file, "rb") as fd:
+            for chunk in iter(lambda: fd.read(1048576), b""):
+                hasher.update(chunk)
+
+    _map_keys[opt_file] = (file_state, hasher.hexdigest())
+    return _map_keys[opt_file][1]
+
+
+def _solmap(solmap_args):
+    """
+    Runs fedem_solmap with the given command-line options.
+    """
+    f_solver = os.path.normpath(os.environ["FEDEM_SOLVER"])
+    f_solmap = os.path.dirname(f_solver) + "/fedem_solmap"
+
+    try:
+        process = run([f_solmap] + solmap_args, capture_output=True, check=True)
+    except CalledProcessError as err:
+        log.exception("fedem_solmap exited with return code: %d", err.returncode)
+        log.debug("fedem_solmap stdout: %r", err.stdout)
+        log.debug("fedem_solmap stderr: %r", err.stderr)
+        raise
+    else:
+        log.debug("fedem_solmap stdout: %r", process.stdout)
+        log.debug("fedem_solmap stderr: %r", process.stderr)
+
+
+def _mapping_file(model_dir, cache_dir):
+    """
+    Returns the nodal mapping file of a sub-model.
+    The nodal mapping is either a precomputed map-file in the sub-model folder,
+    or taken from the mapping cache. If not cached yet, the mapping is computed
+    from the options in fedem_solmap.fco and added to the cache.
+    """
+    map_files = glob.glob(model_dir + "/*.map")
+    if map_files:
+        return map_files[0]
+
+    opt_file = os.path.join(model_dir, "fedem_solmap.fco")
+    if not os.path.isfile(opt_file):
+        raise FileNotFoundError(f"No nodal mapping file or {opt_file} found")
+
+    map_file = os.path.join(cache_dir, _mapping_key(opt_file) + ".map")
+    if os.path.isfile(map_file):
+        log.debug("Reusing nodal mapping %s", map_file)
+        return map_file
+
+    with atomic_output(map_file) as new_map:
+        _solmap(["-cwd=" + model_dir, "-fco=" + opt_file, "-mapFile=" + new_map])
+
+    return map_file
+
+
+def _fco_options(model_dir):
+    """
+    Returns the options in the fedem_solmap.fco file of a sub-model, if any,
+    as a dictionary of option values.
+    """
+    options = {}
+    opt_file = os.path.join(model_dir, "fedem_solmap.fco")
+    if os.path.isfile(opt_file):
+        with open(opt_file, "r") as fd:
+            for line in fd:
+                line = line.strip()
+                if line and line[0] != "#":
+                    name, _, value = line.partition("=")
+                    options[name.strip()] = value.strip()
+
+    return options
+
+
+def _run_solmap(model_dir, parent_frsfile, fnd_file, cache_dir):
+    """
+    Interpolates the parent model displacements onto the sub-model nodes.
+    """
+    solmap_args = [
+        "-frsFile=" + os.path.abspath(parent_frsfile),
+        "-outFile=" + os.path.abspath(fnd_file),
+        "-mapFile=" + _mapping_file(model_dir, cache_dir),
+    ]
+    # Options which affect the extraction of the parent model results
+    for name, value in _fco_options(model_dir).items():
+        if name in ("-partId", "-rotations"):
+            solmap_args.append(name + "=" + value if value else name)
+
+    _solmap(solmap_args)
+
+
+def _read_mapping(map_file):
+    """
+    Reads a nodal mapping file written by fedem_solmap.
+    Returns the sub-model node numbers, the parent model node numbers,
+    the interpolation weight matrix (sub-model nodes x parent model nodes)
+    and the transformation from the sub-model to the parent model system.
+    The file is assumed to be written on a machine with the same byte order.
+    """
+    with open(map_file, "rb") as fd:
+        data = fd.read()
+
+    # The file tag is followed by ";<version>;<number of nodes>;\n"
+    pos = data.find(b";7.", len(b"#FEDEM nodal mapping"))
+    end = data.find(b"\n", pos)
+    if pos < 0 or end < 0:
+        raise ValueError(f"{map_file} is not a FEDEM nodal mapping file")
+    version, n_nodes = data[pos + 1 : end].split(b";")[:2]
+    pos = end + 1
+
+    t_lg = np.identity(3)
+    if float(version) > 7.85:
+        # The transformation matrix is stored column-wise
+        t_lg = np.frombuffer(data, np.float64, 9, pos).reshape(3, 3).T
+        pos += 72
+
+    sub_nodes = np.zeros(int(n_nodes), np.int32)
+    elm_nodes = []
+    weights = []
+    for i in range(sub_nodes.size):
+        ids = np.frombuffer(data, np.int32, 4, pos)
+        sub_nodes[i] = ids[1]
+        nen = ids[3]
+        pos += 16
+        elm_nodes.append(np.frombuffer(data, np.int32, nen, pos))
+        pos += 4 * nen
+        if nen > 1:
+            pos += 24  # Skip the natural element coordinates
+            weights.append(np.frombuffer(data, np.float64, nen, pos))
+            pos += 8 * nen
+        else:  # Coinciding nodes
+            weights.append(np.ones(nen))
+
+    glob_nodes = np.unique(np.concatenate(elm_nodes))
+    weight_mat = np.zeros((sub_nodes.size, glob_nodes.size))
+    for i, nodes in enumerate(elm_nodes):
+        np.add.at(weight_mat[i], np.searchsorted(glob_nodes, nodes), weights[i])
+
+    return sub_nodes, glob_nodes, weight_mat, t_lg
+
+
+def _part_id(model_dir):
+    """
+    Returns the base ID of the parent model FE part a sub-model is mapped onto,
+    as given by the -partId option in its fedem_solmap.fco file.
+    """
+    part_id = _fco_options(model_dir).get("-partId")
+    if not part_id:
+        raise ValueError(f"No -partId option for the in-core mapping of {model_dir}")
+
+    return int(part_id)
+
+
 def _solve_global(model_dir, out_dir, input_data, n_steps, n_funcs):
     """
     Solve top-level global FEDEM model.
@@ -73,37 +293,18 @@ def _solve_global(model_dir, out_dir, input_data, n_steps, n_funcs):
     return result_id
 
 
-def _solve_sub_level(model_dir, out_dir, parent_frsfile, n_steps, conf, output):
+def _solve_sub_level(
+    model_dir, out_dir, parent_frsfile, n_steps, conf, output, cache_dir, num_proc=1
+):
     """
-    Solve sub-level model. Recover strain-gauges if bottom-level
+    Solve sub-level model. Recover strain-gauges if bottom-level.
+    Returns the indices of the output columns that were computed.
     """
     result_id = str(uuid.uuid4())
 
     # Run solmap
-    map_file = glob.glob(model_dir + "/*.map")[0]
     fnd_file = out_dir + "/" + result_id + "_interp.fnd"
-    f_solver = os.path.normpath(os.environ["FEDEM_SOLVER"])
-    f_solmap = os.path.dirname(f_solver) + "/fedem_solmap"
-
-    try:
-        process = run(
-            [
-                f_solmap,
-                "-frsFile=" + parent_frsfile,
-                "-outFile=" + fnd_file,
-                "-mapFile=" + map_file,
-            ],
-            capture_output=True,
-            check=True,
-        )
-    except CalledProcessError as err:
-        log.exception("fedem_solmap exited with return code: %d", err.returncode)
-        log.debug("fedem_solmap stdout: %r", err.stdout)
-        log.debug("fedem_solmap stderr: %r", err.stderr)
-        raise
-    else:
-        log.debug("fedem_solmap stdout: %r", process.stdout)
-        log.debug("fedem_solmap stderr: %r", process.stderr)
+    _run_solmap(model_dir, parent_frsfile, fnd_file, cache_dir)
 
     subfolders = [f.path for f in os.scandir(model_dir) if f.is_dir()]
     # If subfolder(s), recover stress and run sub-levels, if not recover gauges.
@@ -120,10 +321,16 @@ def _solve_sub_level(model_dir, out_dir, parent_frsfile, n_steps, conf, output):
 
         recovery_file_name = glob.glob(out_dir + "/" + result_id + "*Recovery*")[0]
 
-        for sub_folder in subfolders:
-            _solve_sub_level(
-                sub_folder, out_dir, recovery_file_name, n_steps, conf, output
-            )
+        return _solve_sub_levels(
+            subfolders,
+            out_dir,
+            recovery_file_name,
+            n_steps,
+            conf,
+            output,
+            cache_dir,
+            num_proc,
+        )
     else:
         # If a bottom level of submodels is reached, solve strain gauge recovery
         folder_name = os.path.basename(os.path.normpath(model_dir))
@@ -144,11 +351,206 @@ def _solve_sub_level(model_dir, out_dir, parent_frsfile, n_steps, conf, output):
         solver.solver_done()
         del solver
 
+        return [vals[0] for vals in conf[folder_name]]
+
+
+def _solve_sub_tree(model_dir, out_dir, parent_frsfile, n_steps, conf, n_out, cache):
+    """
+    Solve a sub-model tree in a separate output folder (worker process).
+    Returns the indices and values of the output columns that were computed.
+    """
+    tree_dir = os.path.join(out_dir, str(uuid.uuid4()))
+    os.mkdir(tree_dir)
+    output = np.zeros((n_steps, n_out))
+    columns = _solve_sub_level(
+        model_dir, tree_dir, parent_frsfile, n_steps, conf, output, cache
+    )
+    return columns, output[:, columns]
+
+
+def _solve_sub_levels(
+    subfolders, out_dir, parent_frsfile, n_steps, conf, output, cache_dir, num_proc
+):
+    """
+    Solve sibling sub-level models, either one by one in this process,
+    or by dispatching the sub-trees to a pool of worker processes.
+    Returns the indices of the output columns that were computed.
+    """
+    columns = []
+    if min(num_proc, len(subfolders)) < 2:
+        for sub_folder in subfolders:
+            columns.extend(
+                _solve_sub_level(
+                    sub_folder,
+                    out_dir,
+                    parent_frsfile,
+                    n_steps,
+                    conf,
+                    output,
+                    cache_dir,
+                    num_proc,
+                )
+            )
+        return columns
+
+    log.info("Solving %d sub-models using %d processes", len(subfolders), num_proc)
+    with ProcessPoolExecutor(
+        max_workers=min(num_proc, len(subfolders)), mp_context=get_context("spawn")
+    ) as pool:
+        futures = [
+            pool.submit(
+                _solve_sub_tree,
+                sub_folder,
+                out_dir,
+                parent_frsfile,
+                n_steps,
+                conf,
+                output.shape[1],
+                cache_dir,
+            )
+            for sub_folder in subfolders
+        ]
+        for future in futures:
+            tree_columns, values = future.result()
+            output[:, tree_columns] = values
+            columns.extend(tree_columns)
+
+    return columns
+
+
+def _sub_model_worker(conn, model_dir, out_dir, n_steps, outputs):
+    """
+    Solve a bottom-level sub-model in a separate process (worker process),
+    with the prescribed displacements received through a pipe for each step.
+    Sends the computed strain gauge outputs back through the pipe when done.
+    """
+    try:
+        result_id = str(uuid.uuid4())
+        solver_args = _common_args(model_dir, out_dir, result_id)
+        solver_args.extend(
+            [
+                "-recovery=2",
+                "-frs3file=" + out_dir + "/" + result_id + "_Recovery_sub_gage.frs",
+            ]
+        )
+
+        solver = FedemSolver(os.environ["FEDEM_SOLVER"], solver_args)
+        output = np.zeros((n_steps, len(outputs)))
+        for i in range(n_steps):
+            nodes, disp = conn.recv()
+            if not solver.set_prescribed_displacements(nodes, disp):
+                raise RuntimeError(f"Failed to assign displacements in {model_dir}")
+            solver.solve_next()
+            for j, vals in enumerate(outputs):
+                output[i, j] = solver.get_function(vals[1])
+        solver.solver_done()
+        del solver
+    except Exception as err:  # Let the parent process raise it
+        conn.send(err)
+    else:
+        conn.send(output)
+    finally:
+        conn.close()
+
+
+def _worker_result(conn):
+    """
+    Receives the result of a sub-model worker process.
+    Raises the exception the worker failed with, if any.
+    """
+    try:
+        result = conn.recv()
+    except EOFError:
+        raise RuntimeError("Sub-model worker process terminated unexpectedly")
+
+    if isinstance(result, Exception):
+        raise result
+
+    return result
+
+
+def _send_to_worker(conn, data):
+    """
+    Sends the prescribed displacements of next step to a sub-model worker.
+    If the worker has failed, the exception it failed with is raised instead.
+    """
+    if conn.poll():  # The worker only sends something before finished on error
+        _worker_result(conn)
+
+    try:
+        conn.send(data)
+    except BrokenPipeError:
+        _worker_result(conn)
+        raise
+
+
+def _solve_in_core(
+    model_dir, out_dir, input_data, n_steps, n_funcs, conf, output, cache_dir
+):
+    """
+    Solve the global model and its bottom-level sub-models simultaneously.
+    The sub-models are solved in separate worker processes, since only one
+    solver instance can exist in each process. The sub-model displacements are
+    interpolated from the global model in core and sent to the workers through
+    pipes in each time step, such that no recovery or displacement files are
+    needed. Only translations are mapped, and all sub-models must be leaves.
+    """
+    context = get_context("spawn")
+    sub_models = []
+    try:
+        for f in os.scandir(model_dir):
+            if not f.is_dir():
+                continue
+            if any(s.is_dir() for s in os.scandir(f.path)):
+                raise ValueError(f"In-core mapping of nested sub-model {f.path}")
+
+            outputs = conf[f.name]
+            mapping = (_part_id(f.path),) + _read_mapping(
+                _mapping_file(f.path, cache_dir)
+            )
+            conn, child_conn = context.Pipe()
+            worker = context.Process(
+                target=_sub_model_worker,
+                args=(child_conn, f.path, out_dir, n_steps, outputs),
+            )
+            worker.start()
+            child_conn.close()
+            sub_models.append((conn, worker, outputs, mapping))
+
+        input_def = range(1, n_funcs + 1)
+        result_id = str(uuid.uuid4())
+        solver_args = _common_args(model_dir, out_dir, result_id)
+        solver_args.append("-recovery=1")
+
+        solver = FedemSolver(os.environ["FEDEM_SOLVER"], solver_args)
+        for i in range(n_steps):
+            solver.solve_next(input_data[i], input_def)
+            for conn, _, _, mapping in sub_models:
+                base_id, sub_nodes, glob_nodes, weights, t_lg = mapping
+                disp, ok = solver.get_nodal_displacements(base_id, glob_nodes)
+                if not ok:
+                    raise RuntimeError(f"Failed to get displacements of {base_id}")
+                # Interpolate and transform to the local system of the sub-model
+                _send_to_worker(conn, (sub_nodes, (weights @ disp) @ t_lg))
+        solver.solver_done()
+        del solver
+
+        for conn, _, outputs, _ in sub_models:
+            result = _worker_result(conn)
+            for j, vals in enumerate(outputs):
+                output[:, vals[0]] = result[:, j]
+    finally:
+        for conn, worker, _, _ in sub_models:
+            conn.close()
+            worker.join()
+
 
 def sub_model_run(df):
     """
     Run sub-model simulation.
     First solves the global model, then recursively solves the submodels.
+    Sibling submodels are solved concurrently if FEDEM_SUBMODEL_NPROC > 1.
+    All models are solved simultaneously if FEDEM_SUBMODEL_INCORE is set.
     Reads external submodel_config.json file located in lib-folder.
 
     Parameters
@@ -186,7 +588,32 @@ def sub_model_run(df):
     # Clean
     files = glob.glob(fedem_out_dir + "/*")
     for temp_file in files:
-        os.remove(temp_file)
+        if os.path.isdir(temp_file):
+            rmtree(temp_file)  # Output folder of a sub-model worker process
+        else:
+            os.remove(temp_file)
+
+    # Set-up folder for the nodal mapping files, kept between the runs
+    map_cache_dir = lib_dir + "/map_cache"
+    os.makedirs(map_cache_dir, exist_ok=True)
+
+    if os.environ.get("FEDEM_SUBMODEL_INCORE", "0") not in ("0", ""):
+        # Solve global model and sub-models simultaneously
+        _solve_in_core(
+            lib_dir + "/model",
+            fedem_out_dir,
+            global_input,
+            n_steps,
+            n_inputs,
+            conf,
+            output,
+            map_cache_dir,
+        )
+        return pd.DataFrame(
+            output,
+            index=df.index,
+            columns=[output_defs[key] for key in sorted(output_defs)],
+        )
 
     # Solve global model
     result_id_global = _solve_global(
@@ -198,10 +625,16 @@ def sub_model_run(df):
 
     # Solve sublevels recursively
     subfolders = [f.path for f in os.scandir(lib_dir + "/model") if f.is_dir()]
-    for sub_folder in subfolders:
-        _solve_sub_level(
-            sub_folder, fedem_out_dir, recovery_file_name, n_steps, conf, output
-        )
+    _solve_sub_levels(
+        subfolders,
+        fedem_out_dir,
+        recovery_file_name,
+        n_steps,
+        conf,
+        output,
+        map_cache_dir,
+        int(os.environ.get("FEDEM_SUBMODEL_NPROC", 1)),
+    )
 
     # Create output dataframe
     column_names = []
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Utilities for files shared between processes (e.g., cache entries).
+"""
+
+from contextlib import contextmanager
+from hashlib import sha256
+from os import close, path, remove, rename, replace
+from shutil import rmtree
+from tempfile import mkdtemp, mkstemp
+
+
+@contextmanager
+def atomic_output(target, directory=False):
+    """
+    Context manager yielding a temporary path to write the target to.
+
+    The temporary file (or directory) is created next to the target, and is
+    renamed to the target when the context exits normally, such that other
+    processes never see a partially written target. If an exception occurs,
+    the temporary file (or directory) is removed before it is re-raised.
+
+    Parameters
+    ----------
+    target : str
+        Absolute path of the file (or directory) to write
+    directory : bool, default=False
+        If True, a directory is written instead of a file. The rename then
+        fails (OSError) if the target directory already exists and is not empty.
+
+    Yields
+    ------
+    str
+        Absolute path of the temporary file (or directory) to write to
+    """
+    parent = path.dirname(target)
+    if directory:
+        tmp_path = mkdtemp(dir=parent, prefix=".tmp-")
+    else:
+        # Keep the file extension, since some writers append it if missing
+        fd, tmp_path = mkstemp(
+            dir=parent, prefix=".tmp-", suffix=path.splitext(target)[1]
+        )
+        close(fd)
+
+    try:
+        yield tmp_path
+        if directory:
+            rename(tmp_path, target)
+        else:
+            replace(tmp_path, target)
+    except BaseException:
+        if directory:
+            rmtree(tmp_path, ignore_errors=True)
+        elif path.isfile(tmp_path):
+            remove(tmp_path)
+        raise
+
+
+def file_checksum(file_name, hasher=None, chunk_size=1048576):
+    """
+    Updates a sha256 hasher with the content of the specified file.
+
+    Parameters
+    ----------
+    file_name : str
+        Absolute path of the file to compute the checksum of
+    hasher : hashlib.sha256, default=None
+        The hasher to update. If None, a new hasher is created.
+    chunk_size : int, default=1048576
+        Number of bytes to read at a time
+
+    Returns
+    -------
+    hashlib.sha256
+        The updated hasher
+    """
+    if hasher is None:
+        hasher = sha256()
+    with open(file_name, "rb") as fd:
+        for chunk in iter(lambda: fd.read(chunk_size), b""):
+            hasher.update(chunk)
+
+    return hasher
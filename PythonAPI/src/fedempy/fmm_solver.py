@@ -14,8 +14,16 @@ This module relies on the following environment variables:
 | *FEDEM_SOLVER* = Full path to the Fedem dynamics solver shared object library
 | *FEDEM_REDUCER* = Full path to the Fedem reducer shared object library
 | *VIS_EXPORTER* = Full path to the Fedem VTFx exporter shared object library
+| *FEDEM_REDUCER_CACHE* = Full path to a directory of cached reduced FE parts
+| *FEDEM_REDUCER_CACHE_SIZE* = Max size (in MB) of the reduction cache directory
+| *FEDEM_REDUCER_NPROC* = Max number of processes used for FE part reduction
 The third variable is needed only if FE model reduction is to be performed.
 The fourth variable needs to be set only if a VTFx file is to be exported.
+The fifth variable needs to be set only if reduced FE parts are to be shared
+across models and runs, and the sixth one only if the default size limit
+of 10 GB for that cache directory should be changed.
+If the seventh variable is larger than one, the FE parts of a model are reduced
+concurrently by that number of worker processes.
 The first two variables are mandatory.
 
 This module can also be launched directly, to run a specified model,
@@ -32,13 +40,16 @@ those files by launching this module without arguments, i.e.:
 """
 
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
 from ctypes import c_double
-from os import environ, getcwd, path
+from multiprocessing import get_context
+from os import environ, getcwd, listdir, path
 
 from fedempy.exporter import Exporter
 from fedempy.fmm import FedemModel, FmType
 from fedempy.inverse import InverseSolver
 from fedempy.reducer import FedemReducer
+from fedempy.reduction_cache import ReductionCache
 from fedempy.solver import FedemException, FedemProgressBar, FedemSolver
 
 
@@ -62,6 +73,25 @@ def _solver_options(solver, rdbdir="", time_start=None, base_id=None):
     return opts
 
 
+# The FE part reducer instance of a reducer worker process
+_worker_reducer = None
+
+
+def _init_worker(lib_path):
+    """
+    Initializes a reducer worker process with its own reducer library instance.
+    """
+    global _worker_reducer  # pylint: disable=global-statement
+    _worker_reducer = FedemReducer(lib_path)
+
+
+def _run_reducer(rdbdir):
+    """
+    Runs the FE part reducer in a worker process on the specified directory.
+    """
+    return _worker_reducer.run(_solver_options("fedem_reducer", rdbdir))
+
+
 def _count_lines(file_name):
     """
     Counts the number of lines in a file.
@@ -147,7 +177,9 @@ class FmmSolver(FedemSolver):
 
         super().__init__(environ["FEDEM_SOLVER"], None, use_internal_state)
         self._model = FedemModel(environ["FEDEM_MDB"])
+        self._model_file = None
         self._reducer = None
+        self._red_cache = None
         self._vtfx = None
         self._func_map = {}
         self._c_transf = None
@@ -188,7 +220,8 @@ class FmmSolver(FedemSolver):
         Returns
         -------
         int
-            Number of FE parts that was reduced, negative on error
+            Number of FE parts that was reduced (or fetched from the reduction
+            cache), negative on error
         """
 
         num_reduced = 0
@@ -200,21 +233,66 @@ class FmmSolver(FedemSolver):
                 return num_reduced
             self._reducer = FedemReducer(environ["FEDEM_REDUCER"])
 
+        if self._red_cache is None and "FEDEM_REDUCER_CACHE" in environ:
+            self._red_cache = ReductionCache(
+                environ["FEDEM_REDUCER_CACHE"],
+                float(environ.get("FEDEM_REDUCER_CACHE_SIZE", 10240)),
+            )
+
         # Get list (of base Id) of the FE parts in the model
         fe_parts = self._model.fm_get_objects(FmType.FEPART)
+        red_parts = []
         for base_id in fe_parts:
             # Check if this part is reduced and create reducer input files if not
             rdbdir = self._model.fm_write_reducer(base_id)
             if len(rdbdir) > 0:
-                # Run the FE part reducer
                 num_reduced += 1
-                if self._reducer.run(_solver_options("fedem_reducer", rdbdir)) != 0:
-                    print(" *** Reduction failure for FE part", base_id)
-                    _print_res(_get_resfile(rdbdir, "fedem_reducer"))
-                    return -num_reduced
 
-                print("   * FE Part", base_id, "successfully reduced", flush=True)
-                self._model.fm_sync_part(base_id)
+                # Check if this part already has been reduced by another model
+                cache_key = None
+                if self._red_cache is not None:
+                    fem_file = self._model.fm_get_femodel(base_id)[0]
+                    cache_key = self._red_cache.checksum(
+                        fem_file, rdbdir, path.basename(environ["FEDEM_REDUCER"])
+                    )
+                    if self._red_cache.fetch(cache_key, rdbdir):
+                        print("   * FE Part", base_id, "found in cache", flush=True)
+                        self._model.fm_sync_part(base_id)
+                        continue
+
+                red_parts.append((base_id, rdbdir, cache_key, listdir(rdbdir)))
+
+        # Run the FE part reducer, either in this process (one part at a time),
+        # or by dispatching the parts to a pool of reducer worker processes
+        num_proc = min(int(environ.get("FEDEM_REDUCER_NPROC", 1)), len(red_parts))
+        rdbdirs = [rdbdir for _, rdbdir, _, _ in red_parts]
+        if num_proc > 1:
+            print(
+                "   * Reducing", len(rdbdirs), "FE parts using", num_proc, "processes"
+            )
+            with ProcessPoolExecutor(
+                max_workers=num_proc,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(environ["FEDEM_REDUCER"],),
+            ) as pool:
+                status = list(pool.map(_run_reducer, rdbdirs))
+        else:
+            status = (
+                self._reducer.run(_solver_options("fedem_reducer", rdbdir))
+                for rdbdir in rdbdirs
+            )
+
+        for (base_id, rdbdir, cache_key, input_files), ierr in zip(red_parts, status):
+            if ierr != 0:
+                print(" *** Reduction failure for FE part", base_id)
+                _print_res(_get_resfile(rdbdir, "fedem_reducer"))
+                return -num_reduced
+
+            print("   * FE Part", base_id, "successfully reduced", flush=True)
+            if cache_key is not None:
+                self._red_cache.store(cache_key, rdbdir, input_files)
+            self._model.fm_sync_part(base_id)
 
         if num_reduced > 0:
             print("#### FE model reduction done.", flush=True)
@@ -375,6 +453,7 @@ class FmmSolver(FedemSolver):
             print("     in working directory", getcwd())
             return error_exit(-97)
 
+        self._model_file = model_file
         print("   * Model file", model_file, "successfully opened")
         print("     Number of Triads:", self._model.fm_count(FmType.TRIAD))
         print("     Number of Joints:", self._model.fm_count(FmType.JOINT))
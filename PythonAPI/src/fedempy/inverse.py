@@ -11,11 +11,12 @@ Python implementation of inverse solution methods with Fedem.
 from copy import deepcopy
 from os import environ, path
 
-from numpy import array, c_, delete, dot, sqrt, transpose, vstack, zeros
-from numpy.linalg import inv, lstsq, solve
+from numpy import array, c_, dot, sqrt, transpose, zeros
+from numpy.linalg import inv, lstsq, pinv, solve
 
 from fedempy.enums import FmType
 from fedempy.log_conf import get_logger
+from fedempy.mode_cache import ModeCache
 from fedempy.solver import FedemException, FedemProgressBar, FedemSolver
 
 try:
@@ -78,6 +79,8 @@ class InverseSolver:
         Performs the inverse static solution using the internal inverse solver
     run_inverse:
         Performs the inverse solution (static case)
+    compile_inverse:
+        Requests a precomputed influence matrix for linear models
     done_inverse:
         Closes down the dynamics solver after run_inverse()
     """
@@ -108,6 +111,14 @@ class InverseSolver:
         self.internal_force_mat = None  # initial force matrix
         self.loop_nr = 0  # loop number over simulation
 
+        # Precomputed influence matrix (measurements -> RHS forces)
+        # for linear models, see compile_inverse()
+        self.linear = False
+        self.influence_mat = None
+        self.influence_off = None
+        if config is not None and config.get("linear", False):
+            self.compile_inverse()
+
     def _init_equations(self, solver):  # NOSONAR
         """
         Find internal equation number related to triad_id and dof
@@ -174,6 +185,14 @@ class InverseSolver:
         # longer computation time. Therefore, use for smaller systems only.
         self.modes_solver = 0  # 1: DSYGVX, 2: DGGEVX, 3: scipy.linalg.eigh
 
+        # Optional cache of the computed eigenmodes, which may be persisted
+        # across runs (cache directory) and/or updated incrementally between
+        # the time steps by subspace iteration from the previous eigenvectors.
+        # The persisted entries are identified by the "cache_key" of the model
+        # (by default, the checksum of the model file) and the eigensolver
+        # configuration, and by the simulation time if "time_varying" is set.
+        self.mode_cache = None
+
         for item in eq_list:
             if item in self.internal_equations:
                 if item == eq_list[0]:
@@ -195,6 +214,27 @@ class InverseSolver:
                             "SCIPY_EIGH",
                         ].index(self.internal_equations[item]["solver"])
                         logger.info("Using eigensolver: %s" % self.modes_solver)
+                    if isinstance(self.internal_equations[item], dict):
+                        cache_dir = self.internal_equations[item].get("cache")
+                        incremental = self.internal_equations[item].get(
+                            "incremental", False
+                        )
+                        model_key = self.internal_equations[item].get("cache_key")
+                        if cache_dir and not model_key:
+                            model_key = ModeCache.fingerprint(
+                                getattr(solver, "_model_file", None)
+                            )
+                        time_varying = self.internal_equations[item].get(
+                            "time_varying", False
+                        )
+                        if cache_dir or incremental:
+                            self.mode_cache = ModeCache(
+                                cache_dir, incremental, model_key, time_varying
+                            )
+                            logger.info(
+                                "Using eigenmode cache: %s (incremental=%s)"
+                                % (cache_dir, incremental)
+                            )
                 elif item in (eq_list[1], eq_list[2], eq_list[9]):
                     # branch for "unknown_f", "known_x", "known_Fx"
                     item_len = len(self.internal_equations[item])
@@ -668,191 +708,85 @@ class InverseSolver:
         return sensor_id, nr
 
     @staticmethod
-    def _inverse_disp_sensor(dim, x_def, u_vec, lhs, rhs, pos):
+    def _inverse_disp_sensor(x_def, u_vec, lhs, rhs, pos):
         """
         Standard inverse solution for displacement sensor input
         """
-        b_mat = zeros((dim, len(x_def)))
-
-        for idx, val in enumerate(x_def):
-            b_mat[val, idx] = 1
-
-        c_val = dot(b_mat.transpose(), u_vec)
+        n_x = len(x_def)
 
         # remove non-scalable part from the measurements
-        for k in range(len(x_def)):
-            rhs[k] -= c_val[k][-1]
-
-        lhs = vstack([lhs, c_val[:, :-1]])
-        pos += len(x_def)
+        lhs[pos : pos + n_x] = u_vec[x_def, :-1]
+        rhs[pos : pos + n_x] -= u_vec[x_def, -1]
 
-        return lhs, rhs, pos
+        return pos + n_x
 
-    def _inverse_strain_sensor(self, u_vec, lhs, rhs, pos):
+    def _inverse_sensor_response(self, method_name, u_vec, ids, lhs, rhs, pos):
         """
-        Inverse solution for strain sensor input (e.g. strain gage measurements)
+        Evaluates the sensor response for all displacement columns
+        in one native call, and inserts it into the equation system starting at row pos.
+        The last column (constant load part, e.g. gravity) is subtracted from
+        the measurements, the other columns (unit loads) go into the lhs matrix.
         """
-        gage_id, nr_gauges = self._build_sensor_ids("strain")
-
-        n_3c = gage_id.count(-1)  # number of 3 component tensors
-        n_1c = nr_gauges - n_3c  # number of 1 component tensors
-        nr_c = 3 * n_3c + n_1c
-
-        # no. of generalized load cases (without gravity load displacement vector)
-        ng = len(u_vec[0]) - 1
-
-        # gathering unit load strains into a matrix
-        lh = zeros((nr_c, ng))
-
-        # loop over generalized forces
-        for j in range(ng):
-            lh[:, j], ok = self.solver.compute_strains_from_displ(u_vec[:, j], gage_id)
-            if not ok:
-                raise InverseException("compute_strains_from_displ")
-
-        # const force part (e.g. gravity)
-        eps, ok = self.solver.compute_strains_from_displ(u_vec[:, -1], gage_id)
+        resp, ok = getattr(self.solver, method_name)(u_vec, ids)
         if not ok:
-            raise InverseException("compute_strains_from_displ")
+            raise InverseException(method_name)
+
+        n_out = len(resp)
+        if pos + n_out > len(rhs):
+            raise ValueError(
+                f"More sensor equations ({pos + n_out}) than measurements ({len(rhs)})"
+            )
 
-        # update measurements based on strains, subtract constant part
-        for k in range(nr_c):
-            rhs[pos + k] -= eps[k]
+        lhs[pos : pos + n_out] = resp[:, :-1]
+        rhs[pos : pos + n_out] -= resp[:, -1]
 
-        lhs = vstack([lhs, lh])
-        pos += nr_c
+        return pos + n_out
 
-        return lhs, rhs, pos
+    def _inverse_strain_sensor(self, u_vec, lhs, rhs, pos):
+        """
+        Inverse solution for strain sensor input (e.g. strain gage measurements)
+        """
+        gage_id, _ = self._build_sensor_ids("strain")
+        return self._inverse_sensor_response(
+            "compute_strains_from_displ_batch", u_vec, gage_id, lhs, rhs, pos
+        )
 
     def _inverse_section_forces_sensor(self, u_vec, lhs, rhs, pos):
         """
         Inverse solution for section forces (N,Qy,Qz,Mx,My,Mz)
         6 components solution
         """
-        beam_ids, nr_sec = self._build_sensor_ids("section")
-
-        # no. of generalized load cases (without gravity load displacement vector)
-        ng = len(u_vec[0]) - 1
-
-        # gathering sectional forces (from unit loads) into a matrix
-        lh = zeros((nr_sec * 6, ng))
-
-        # loop over generalized forces
-        for j in range(ng):
-            lh[:, j], ok = self.solver.compute_int_forces_from_displ(
-                u_vec[:, j], beam_ids
-            )
-            if not ok:
-                raise InverseException("compute_int_forces_from_displ")
-
-        c_fg, ok = self.solver.compute_int_forces_from_displ(u_vec[:, -1], beam_ids)
-        if not ok:
-            raise InverseException("compute_int_forces_from_displ")
-
-        # remove constant load from unit force matrix
-        # update measurements/calculations based on internal forces
-        for j in range(nr_sec * 6):
-            rhs[pos + j] -= c_fg[j]
-
-        lhs = vstack([lhs, lh])
-        pos += nr_sec * 6
-
-        return lhs, rhs, pos
+        beam_ids, _ = self._build_sensor_ids("section")
+        return self._inverse_sensor_response(
+            "compute_int_forces_from_displ_batch", u_vec, beam_ids, lhs, rhs, pos
+        )
 
     def _inverse_rel_dist_sensor(self, u_vec, lhs, rhs, pos):
         """
         Inverse solution for relative distance change
         """
         eng_ids, _ = self._build_sensor_ids("relative")
-
-        # no. of generalized load cases (without gravity load displacement vector)
-        ng = len(u_vec[0]) - 1
-
-        # define size of the lhs matrix
-        lh = zeros((len(eng_ids), ng))
-
-        # loop over generalized forces (no. of columns)
-        for j in range(ng):
-            lh[:, j], ok = self.solver.compute_rel_dist_from_displ(u_vec[:, j], eng_ids)
-            if not ok:
-                raise InverseException("compute_rel_dist_from_displ")
-
-        # relative displacements from constant loads (e.g. gravity)
-        r_dg, ok = self.solver.compute_rel_dist_from_displ(u_vec[:, -1], eng_ids)
-        if not ok:
-            raise InverseException("compute_rel_dist_from_displ")
-
-        for k in range(len(eng_ids)):
-            rhs[pos + k] -= r_dg[k]
-
-        lhs = vstack([lhs, lh])
-        pos += len(eng_ids)
-
-        return lhs, rhs, pos
+        return self._inverse_sensor_response(
+            "compute_rel_dist_from_displ_batch", u_vec, eng_ids, lhs, rhs, pos
+        )
 
     def _inverse_spring_var(self, u_vec, lhs, rhs, pos, spr_var):
         """
         Inverse solution for spring variables
         """
         ids, _ = self._build_sensor_ids(spr_var)
-
-        # no. of generalized load cases (without gravity load displacement vector)
-        ng = len(u_vec[0]) - 1
-
-        # define size of the lhs matrix
-        lh = zeros((len(ids), ng))
-
-        # loop over generalized forces (no. of columns)
-        for j in range(ng):
-            lh[:, j], ok = self.solver.compute_spring_var_from_displ(u_vec[:, j], ids)
-            if not ok:
-                raise InverseException("compute_spring_var_from_displ")
-
-        # spring forces from constant loads (e.g. gravity)
-        r_dg, ok = self.solver.compute_spring_var_from_displ(u_vec[:, -1], ids)
-        if not ok:
-            raise InverseException("compute_spring_var_from_displ")
-
-        for k in range(len(ids)):
-            rhs[pos + k] -= r_dg[k]
-
-        lhs = vstack([lhs, lh])
-        pos += len(ids)
-
-        return lhs, rhs, pos
+        return self._inverse_sensor_response(
+            "compute_spring_var_from_displ_batch", u_vec, ids, lhs, rhs, pos
+        )
 
     def _inverse_int_force_sensor(self, u_vec, lhs, rhs, pos):
         """
         Inverse solution for known internal force
         """
-        ids, nr_b = self._build_sensor_ids("force")
-
-        # no. of generalized load cases (without gravity load displacement vector)
-        ng = len(u_vec[0]) - 1
-
-        # gathering forces (from unit loads) into a matrix
-        lh = zeros((nr_b, ng))
-
-        # loop over generalized forces
-        for j in range(ng):
-            lh[:, j], ok = self.solver.compute_int_forces_from_displ(u_vec[:, j], ids)
-            if not ok:
-                raise InverseException("compute_int_forces_from_displ")
-
-        # beam forces from const forces (e.g. gravity)
-        c_fg, ok = self.solver.compute_int_forces_from_displ(u_vec[:, -1], ids)
-        if not ok:
-            raise InverseException("compute_int_forces_from_displ")
-
-        # remove constant load from unit force matrix
-        # update measurements/calculations based on internal forces
-        for j in range(nr_b):
-            rhs[pos + j] -= c_fg[j]
-
-        lhs = vstack([lhs, lh])
-        pos += nr_b
-
-        return lhs, rhs, pos
+        ids, _ = self._build_sensor_ids("force")
+        return self._inverse_sensor_response(
+            "compute_int_forces_from_displ_batch", u_vec, ids, lhs, rhs, pos
+        )
 
     @staticmethod
     def _unit_load(dim, g_def):
@@ -925,10 +859,12 @@ class InverseSolver:
         return f_vec
 
     @staticmethod
-    def _mode_load(solver, modes, use_lapack, do_print=False):
+    def _mode_load(solver, modes, use_lapack, do_print=False, mode_cache=None):
         """
         Force vector based on natural frequency shapes.
         New and faster implementation, using Fedem's internal eigenvalue solver.
+        If a mode cache is provided, previously computed eigenmodes are reused
+        when possible, and otherwise used as starting vectors (if incremental).
         """
         # take into account modes up to max mode number in the array modes
         n_modes = max(modes)
@@ -936,16 +872,46 @@ class InverseSolver:
             print("Calculating the modes: ", modes)
         logger.info("Calculate the first %s eigenmodes." % n_modes)
 
-        # calculate natural frequencies (e_val)
-        # and the associated mode shapes (e_vec)
-        e_val, e_vec, ok = solver.solve_modes(n_modes, False, use_lapack)
-        if solver.ierr.value < 0 or not ok:
-            raise InverseException("solve_modes", solver.ierr.value)
-        if e_val is None:
-            print(f"Unable for calculate eigenvalues at t={solver.get_current_time()}")
-            print(f"Terminating dynamics solver ({solver.solver_done(print_res=True)})")
-            print("Please check the fedem_solver.res file content above.")
-            raise InverseException("solve_modes", solver.ierr.value)
+        e_val = e_vec = key = s_vec = n_updates = None
+        if mode_cache is not None:
+            n_updates = solver.get_solver_counters()["updates"]
+            key = mode_cache.checksum(
+                solver.get_current_time(), f"{n_modes}:{use_lapack}", n_updates
+            )
+            e_val, e_vec = mode_cache.fetch(key)
+            if e_vec is not None:
+                logger.info("Using cached eigenmodes")
+            else:
+                s_vec = mode_cache.start_vectors(solver.get_system_size())
+
+        if s_vec is not None:
+            # subspace iteration from the previously computed eigenvectors
+            e_val, e_vec, ok = solver.solve_modes(n_modes, False, use_lapack, s_vec)
+            if solver.ierr.value < 0 or not ok:
+                raise InverseException("solve_modes", solver.ierr.value)
+            if e_val is not None:
+                logger.info("Eigenmodes updated incrementally")
+            else:
+                logger.info("Incremental eigenmode update failed, solving anew")
+
+        if e_vec is None:
+            # calculate natural frequencies (e_val)
+            # and the associated mode shapes (e_vec)
+            e_val, e_vec, ok = solver.solve_modes(n_modes, False, use_lapack)
+            if solver.ierr.value < 0 or not ok:
+                raise InverseException("solve_modes", solver.ierr.value)
+            if e_val is None:
+                print(
+                    f"Unable for calculate eigenvalues at t={solver.get_current_time()}"
+                )
+                print(
+                    f"Terminating dynamics solver ({solver.solver_done(print_res=True)})"
+                )
+                print("Please check the fedem_solver.res file content above.")
+                raise InverseException("solve_modes", solver.ierr.value)
+
+        if mode_cache is not None:
+            mode_cache.store(key, e_val, e_vec, n_updates)
 
         if do_print:
             print("Eigenvalues (low, high):", e_val[0], e_val[-1])
@@ -993,6 +959,11 @@ class InverseSolver:
         if not do_continue:  # Reached the end of simulation
             return None
 
+        if self.influence_mat is not None:
+            # linear model, the RHS forces follow directly from the measurements
+            force = dot(self.influence_mat, inp_data) - self.influence_off
+            return self._inverse_finish_step(force, out_def, do_print)
+
         logger.info("Getting updated stiffness matrix")
         k_mat, ok = self.solver.get_stiffness_matrix()
         if not ok:
@@ -1027,7 +998,11 @@ class InverseSolver:
                     f_vec = self._mode_load_scipy(self.solver, self.modes, do_print)
                 else:
                     f_vec = self._mode_load(
-                        self.solver, self.modes, self.modes_solver, do_print
+                        self.solver,
+                        self.modes,
+                        self.modes_solver,
+                        do_print,
+                        self.mode_cache,
                     )
                 if f_mat is None:
                     f_mat = f_vec
@@ -1051,72 +1026,48 @@ class InverseSolver:
 
         # build rhs vector from measurements (copy)
         logger.info("Building RHS vector on sensor data")
-        rhs = [0.0] * len(inp_data)
-        rhs[:] = inp_data
+        rhs = array(inp_data, dtype=float)
+
+        # preallocate the sensor equation matrix,
+        # one row for each measurement and one column for each unit load
+        lhs = zeros((len(rhs), u_vec.shape[1] - 1))
 
         # position in rhs vector
         pos = 0
 
-        # create a 1xg_def matrix, initialized with 0
-        lhs = [[0] * (len(f_mat[0]) - 1) for _ in range(1)]
-
         # building equation system
         for eq_def in self.eq_list_def:
+            pos0 = pos
             if eq_def in ("known_x", "known_Fx"):
-                lhs, rhs, pos = self._inverse_disp_sensor(
-                    n_dim, x_def, u_vec, lhs, rhs, pos
-                )
-                logger.info(
-                    "Displacement sensor, locations/pos [%s/%s]" % (len(lhs) - 1, pos)
-                )
+                pos = self._inverse_disp_sensor(x_def, u_vec, lhs, rhs, pos)
+                sensor = "Displacement"
             elif eq_def == "known_eps":
-                lhs, rhs, pos = self._inverse_strain_sensor(u_vec, lhs, rhs, pos)
-                logger.info(
-                    "Strain sensor, locations/pos [%s/%s]" % (len(lhs) - 1, pos)
-                )
+                pos = self._inverse_strain_sensor(u_vec, lhs, rhs, pos)
+                sensor = "Strain"
             elif eq_def == "known_secF":
-                lhs, rhs, pos = self._inverse_section_forces_sensor(
-                    u_vec, lhs, rhs, pos
-                )
-                logger.info(
-                    "Section force sensor, locations/pos [%s/%s]" % (len(lhs) - 1, pos)
-                )
+                pos = self._inverse_section_forces_sensor(u_vec, lhs, rhs, pos)
+                sensor = "Section force"
             elif eq_def == "known_relD":
-                lhs, rhs, pos = self._inverse_rel_dist_sensor(u_vec, lhs, rhs, pos)
-                logger.info(
-                    "Rel. dist sensor, locations/pos [%s/%s]" % (len(lhs) - 1, pos)
-                )
+                pos = self._inverse_rel_dist_sensor(u_vec, lhs, rhs, pos)
+                sensor = "Rel. dist"
             elif eq_def == "known_intF":
-                lhs, rhs, pos = self._inverse_int_force_sensor(u_vec, lhs, rhs, pos)
-                logger.info(
-                    "Internal force sensor, locations/pos [%s/%s]" % (len(lhs) - 1, pos)
-                )
+                pos = self._inverse_int_force_sensor(u_vec, lhs, rhs, pos)
+                sensor = "Internal force"
             elif eq_def == "known_sprD":
-                lhs, rhs, pos = self._inverse_spring_var(
-                    u_vec, lhs, rhs, pos, "deflection"
-                )
-                logger.info(
-                    "Spring deflection sensor, locations/pos [%s/%s]"
-                    % (len(lhs) - 1, pos)
-                )
+                pos = self._inverse_spring_var(u_vec, lhs, rhs, pos, "deflection")
+                sensor = "Spring deflection"
             elif eq_def == "known_sprF":
-                lhs, rhs, pos = self._inverse_spring_var(
-                    u_vec, lhs, rhs, pos, "springForce"
-                )
-                logger.info(
-                    "Spring force sensor, locations/pos [%s/%s]" % (len(lhs) - 1, pos)
-                )
-
-        # remove first row from matrix
-        lhs = delete(lhs, (0), axis=0)
+                pos = self._inverse_spring_var(u_vec, lhs, rhs, pos, "springForce")
+                sensor = "Spring force"
+            else:
+                continue
+            logger.info("%s sensor, locations/pos [%s/%s]" % (sensor, pos - pos0, pos))
 
         # check number of equations and pointer position (pos)
-        if len(lhs) != len(rhs) or len(rhs) != pos:
-            print("InCorrect dimension of equation system lhs: ", len(lhs))
-            print("dimension of rhs: ", len(rhs))
-            print("pos of position pointer: ", pos)
-            logger.info(
-                "Equation system has incorrect dimensions: [%s/%s]" % (len(lhs), pos)
+        if len(rhs) != pos:
+            raise ValueError(
+                f"Incorrect dimension of the equation system: {pos} sensor "
+                f"equations, but {len(rhs)} measurements are provided"
             )
 
         if do_print:
@@ -1130,6 +1081,20 @@ class InverseSolver:
             print("scaling factor: ", alpha)
         logger.info("Scaling factors: %s" % alpha)
 
+        if self.linear:
+            # store the mapping from measurements to RHS forces,
+            # force = F*pinv(lhs)*(inp_data - c), where c = inp_data - rhs
+            # is the sensor response to the constant loads
+            logger.info("Storing the influence matrix")
+            self.influence_mat = dot(f_mat[:, :-1], pinv(lhs))
+            self.influence_off = dot(self.influence_mat, inp_data - rhs)
+
+        return self._inverse_finish_step(force, out_def, do_print)
+
+    def _inverse_finish_step(self, force, out_def, do_print):
+        """
+        Applies the identified forces and completes current time step.
+        """
         # update right hand side vector
         logger.info("Setting RHS for Fedem solver")
         if not self.solver.add_rhs_vector(force):
@@ -1155,6 +1120,29 @@ class InverseSolver:
         # return output function values
         return self.solver.get_functions(out_def)
 
+    def compile_inverse(self):
+        """
+        Requests that the inverse problem is compiled into an influence matrix.
+
+        The influence matrix maps the measurements directly to the RHS forces.
+        It is built in the next run_inverse() call, and then used as is in all
+        subsequent steps, such that each step only amounts to a matrix-vector
+        product followed by the equilibrium iterations. This is valid for
+        linear models with constant stiffness and constant external loads only.
+        The eigenmodes are then also computed in the first step only.
+        Invoke this method again to rebuild the influence matrix,
+        e.g., after the model has been changed. The force matrix and the
+        cached eigenmodes are then also recomputed.
+        """
+        if self.internal_force_mat is not None and self.mode_cache is not None:
+            self.mode_cache.invalidate()  # the model may have been changed
+        self.linear = True
+        self.use_initial_eigen_vec = True
+        self.internal_force_mat = None
+        self.influence_mat = None
+        self.influence_off = None
+        logger.info("Using precomputed influence matrix (linear model)")
+
     def done_inverse(self):
         """
         Terminates the dynamics solver.
@@ -0,0 +1,236 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Cache of computed eigenmodes (eigenvalues and eigenvectors).
+
+The eigenmodes are stored in a cache directory which may be shared across
+runs. Each entry is identified by a checksum of some cheap state information,
+i.e., a model fingerprint and the eigensolver configuration, such that a
+repeated analysis of the same model does not need to solve the eigenvalue
+problem again. The system matrices are not part of the key, so the model
+fingerprint (e.g., the checksum of the model file) must change whenever the
+model is modified. For models where the system matrices change over time,
+the current time is also part of the key.
+
+In addition, the most recently computed eigenvectors are kept in memory,
+such that they can be used as starting vectors for the subspace iteration
+eigensolver in the next time step (see FedemSolver.solve_modes),
+instead of solving the eigenvalue problem from scratch.
+"""
+
+from hashlib import sha256
+from os import makedirs, path
+
+from numpy import array, load, savez
+
+from fedempy.file_utils import atomic_output, file_checksum
+
+
+class ModeCache:
+    """
+    This class manages a directory of computed eigenmodes.
+
+    Parameters
+    ----------
+    cache_dir : str, default=None
+        Absolute path to the cache directory, created if it does not exist.
+        If None, the eigenmodes are not persisted.
+    incremental : bool, default=False
+        If True, the most recently stored eigenvectors are provided as
+        starting vectors for the computation of eigenmodes not in the cache
+    model_key : str, default=None
+        Fingerprint of the model the eigenmodes are computed for,
+        see ModeCache.fingerprint. It is required if cache_dir is specified.
+    time_varying : bool, default=False
+        If True, the system matrices change over time, such that the
+        eigenmodes are identified by the simulation time as well
+
+    Methods
+    -------
+    fingerprint:
+        Computes the fingerprint of a model file
+    checksum:
+        Computes the cache key of an eigenvalue problem
+    fetch:
+        Returns the eigenmodes of a cache entry
+    store:
+        Adds computed eigenmodes to the cache
+    start_vectors:
+        Returns the starting vectors for an incremental eigenmode computation
+    invalidate:
+        Invalidates the cached eigenmodes, after the model has been changed
+    """
+
+    def __init__(
+        self, cache_dir=None, incremental=False, model_key=None, time_varying=False
+    ):
+        """
+        Constructor.
+        """
+        if cache_dir is not None and not model_key:
+            raise ValueError("A model_key is required for a persistent mode cache")
+
+        self._root = None if cache_dir is None else path.abspath(cache_dir)
+        self._incremental = incremental
+        self._model_key = model_key or ""
+        self._time_varying = time_varying
+        self._last = None  # Most recently stored key, eigenmodes and updates
+        if self._root is not None:
+            makedirs(self._root, exist_ok=True)
+
+    def _entry(self, key):
+        """
+        Returns the absolute path to the cache entry of the given key.
+        """
+        return path.join(self._root, key + ".npz")
+
+    @staticmethod
+    def fingerprint(model_file):
+        """
+        Computes the fingerprint of a model file, to be used as model_key.
+
+        Parameters
+        ----------
+        model_file : str
+            Absolute path to the model file
+
+        Returns
+        -------
+        str
+            The model fingerprint (hexadecimal digest), None if no model file
+        """
+        if model_file is None or not path.isfile(model_file):
+            return None
+
+        return file_checksum(model_file).hexdigest()
+
+    def checksum(self, time=None, extra=None, n_updates=None):
+        """
+        Computes the cache key of an eigenvalue problem.
+
+        Parameters
+        ----------
+        time : float, default=None
+            Current simulation time, ignored unless the model is time-varying
+        extra : str, default=None
+            Additional data to include in the key (e.g., number of modes)
+        n_updates : int, default=None
+            Number of system matrix updates so far. If the model is
+            time-varying and this equals that of the most recently stored
+            entry, the system has not changed since, and the key of that
+            entry is returned regardless of the time.
+
+        Returns
+        -------
+        str
+            The cache key (hexadecimal digest)
+        """
+        hasher = sha256()
+        if self._time_varying:
+            if n_updates is not None and self._last is not None:
+                if n_updates == self._last[3]:
+                    return self._last[0]  # The system is unchanged
+            hasher.update(f"{self._model_key}:{time!r}".encode("utf-8"))
+        else:
+            hasher.update(self._model_key.encode("utf-8"))
+        if extra:
+            hasher.update(extra.encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def fetch(self, key):
+        """
+        Returns the eigenmodes of a cache entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the eigenvalue problem
+
+        Returns
+        -------
+        numpy.ndarray
+            The eigenfrequencies [Hz], None if the entry was not found
+        numpy.ndarray
+            The eigenvectors (one per row), None if the entry was not found
+        """
+        if self._last is not None and self._last[0] == key:
+            return self._last[1], self._last[2]
+        if self._root is None or not key or not path.isfile(self._entry(key)):
+            return None, None
+
+        try:
+            with load(self._entry(key)) as data:
+                return data["e_val"], data["e_vec"]
+        except (OSError, ValueError, KeyError):
+            return None, None  # Corrupt or partially evicted entry
+
+    def store(self, key, e_val, e_vec, n_updates=None):
+        """
+        Adds computed eigenmodes to the cache.
+        The eigenmodes are also kept in memory, as the most recent entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the eigenvalue problem
+        e_val : list of float
+            The eigenfrequencies [Hz]
+        e_vec : list of list of float
+            The mass-normalized eigenvectors (one per row)
+        n_updates : int, default=None
+            Number of system matrix updates when the eigenmodes were computed
+
+        Returns
+        -------
+        bool
+            True if the entry was added, otherwise False
+        """
+        e_val = array(e_val, dtype=float)
+        e_vec = array(e_vec, dtype=float)
+        self._last = (key, e_val, e_vec, n_updates)
+        if self._root is None or not key or path.isfile(self._entry(key)):
+            return False
+
+        try:
+            with atomic_output(self._entry(key)) as tmp_file:
+                savez(tmp_file, e_val=e_val, e_vec=e_vec)
+        except OSError:
+            return False
+
+        return True
+
+    def start_vectors(self, n_equ):
+        """
+        Returns the starting vectors for an incremental eigenmode computation.
+
+        Parameters
+        ----------
+        n_equ : int
+            Number of equations in the current system
+
+        Returns
+        -------
+        numpy.ndarray
+            The most recently stored eigenvectors (one per row), None if not
+            incremental, no eigenvectors are stored yet or their size differs
+        """
+        if not self._incremental or self._last is None:
+            return None
+        if self._last[2].shape[1] != n_equ:
+            return None  # The system size has changed
+
+        return self._last[2]
+
+    def invalidate(self):
+        """
+        Invalidates the cached eigenmodes, after the model has been changed.
+        The most recent eigenmodes are dropped, and the cache directory is not
+        used anymore, since the model key no longer identifies the model.
+        """
+        self._root = None
+        self._last = None
@@ -14,6 +14,8 @@ and for modifying existing ones.
 from ctypes import POINTER, byref, c_bool, c_char_p, c_double, c_int
 from os import environ, path
 
+from numpy import array, zeros
+
 from fedempy.enums import FmDof, FmDofStat, FmType, FmVar
 from fedempy.fmm import FedemModel, _convert_char, _convert_int, _convert_real
 
@@ -119,6 +121,16 @@ def _extract_polyline(arg):
     return n_, x_, y_, e_
 
 
+def _check_tags(method, tags, count):
+    """
+    Checks that a list of tags has one tag for each object to be created.
+    """
+    if tags is not None and not isinstance(tags, str) and len(tags) != count:
+        raise ValueError(
+            f"{method}: Inconsistent number of tags {len(tags)} (expected {count})"
+        )
+
+
 class FedemModeler(FedemModel):
     """
     This subclass of :class:`fmm.FedemModel` adds some basic modeling methods.
@@ -144,8 +156,12 @@ class FedemModeler(FedemModel):
         Closes the currently open model
     make_triad:
         Creates a triad at specified location or node
+    make_triads:
+        Creates a set of triads at specified locations
     make_beam:
         Creates a string of beam elements
+    make_beams:
+        Creates a set of beam elements between specified triad pairs
     make_beam_section:
         Creates a beam cross section property object
     make_beam_material:
@@ -569,6 +585,86 @@ class FedemModeler(FedemModel):
 
         return triad
 
+    def _tag_objects(self, base_ids, tags):
+        """
+        Tags a set of objects, with a common tag or one tag for each object.
+        """
+        if isinstance(tags, str):
+            self.fm_tag_object(base_ids, tags)
+            return
+
+        # Group the objects by tag, to tag each group with one call
+        groups = {}
+        for base_id, tag in zip(base_ids, tags):
+            if tag is not None:
+                groups.setdefault(tag, []).append(base_id)
+        for tag, ids in groups.items():
+            self.fm_tag_object(ids, tag)
+
+    def make_triads(self, names, positions, rotations=None, on_part=0, tags=None):
+        """
+        Creates a set of triads at specified locations.
+        This is equivalent to invoking make_triad() for each triad,
+        but the argument conversions are performed once for the whole set,
+        which is significantly faster when creating a large number of triads.
+        A ValueError is raised if the number of names, rotations or tags
+        does not match the number of positions.
+
+        Parameters
+        ----------
+        names : str or list of str
+            Common description of the new triads, or one for each triad
+        positions : array_like
+            Global XYZ-coordinates of the new triads (N x 3)
+        rotations : array_like, default=None
+            Global Euler angles giving the orientation of the new triads (N x 3)
+        on_part : int or str, default=0
+            Base Id or tag of the part that the triads should be attached to
+        tags : str or list of str, default=None
+            Common tag to associate the created triads with,
+            or one tag for each triad
+
+        Returns
+        -------
+        list of int
+            Base Ids of the new triads, None if error
+        """
+        pos = array(positions, dtype=float).reshape((-1, 3))
+        if rotations is None:
+            rot = zeros(pos.shape)
+        else:
+            rot = array(rotations, dtype=float).reshape((-1, 3))
+        if len(rot) != len(pos):
+            raise ValueError(
+                f"make_triads: Inconsistent number of rotations {len(rot)}"
+                f" (expected {len(pos)})"
+            )
+        _check_tags("make_triads", tags, len(pos))
+
+        if isinstance(names, str):
+            names_ = [names.encode("utf-8")] * len(pos)
+        elif len(names) == len(pos):
+            names_ = [name.encode("utf-8") for name in names]
+        else:
+            raise ValueError(
+                f"make_triads: Inconsistent number of names {len(names)}"
+                f" (expected {len(pos)})"
+            )
+
+        part_ = self._convert_id(on_part)
+        create_triad = self._fmlib.FmCreateTriad
+        base_ids = []
+        for name_, xyz, euler in zip(names_, pos.tolist(), rot.tolist()):
+            triad = create_triad(name_, *xyz, *euler, part_)
+            if triad < 1:
+                return None
+            base_ids.append(triad)
+
+        if tags is not None:
+            self._tag_objects(base_ids, tags)
+
+        return base_ids
+
     def make_beam(self, name, triads, bprop=None, tag=None):
         """
         Creates a string of beam elements.
@@ -610,6 +706,64 @@ class FedemModeler(FedemModel):
 
         return base_ids
 
+    def make_beams(self, name, triad_pairs, bprop=None, tags=None):
+        """
+        Creates a set of beam elements between specified triad pairs.
+        This is equivalent to invoking make_beam() for each pair of triads,
+        but the argument conversions are performed once for the whole set,
+        which is significantly faster when creating a large number of beams.
+        A ValueError is raised if a triad pair does not have two triads,
+        or if the number of tags does not match the number of triad pairs.
+
+        Parameters
+        ----------
+        name : str
+            Description of the new beams
+        triad_pairs : list of (int, int) or list of (str, str)
+            Base Ids or tags of the two triads connected by each beam
+        bprop : int or str, default=None
+            Base Id or tag of beam property to use
+        tags : str or list of str, default=None
+            Common tag to associate the created beams with,
+            or one tag for each beam
+
+        Returns
+        -------
+        list of int
+            Base Ids of the created beams, None if error
+        """
+        for pair in triad_pairs:
+            if len(pair) != 2:
+                raise ValueError(f"make_beams: Invalid triad pair {pair}")
+        _check_tags("make_beams", tags, len(triad_pairs))
+
+        triad_ids = {}  # Base Ids of the triads specified by tag
+
+        def _triad_id(triad):
+            """
+            Returns the base Id of a triad, looking up each tag only once.
+            """
+            if not isinstance(triad, str):
+                return int(triad)
+            if triad not in triad_ids:
+                triad_ids[triad] = self._convert_id(triad, FmType.TRIAD).value
+            return triad_ids[triad]
+
+        name_ = name.encode("utf-8")
+        bprop_ = self._convert_id(bprop, FmType.BEAM_PROP)
+        create_beam = self._fmlib.FmCreateBeam
+        base_ids = []
+        for triad1, triad2 in triad_pairs:
+            base_id = create_beam(name_, _triad_id(triad1), _triad_id(triad2), bprop_)
+            if base_id < 1:
+                return None
+            base_ids.append(base_id)
+
+        if tags is not None:
+            self._tag_objects(base_ids, tags)
+
+        return base_ids
+
     def make_beam_section(self, name, mat, bprops, tag=None):
         """
         Creates a beam cross section property object.
@@ -0,0 +1,245 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Content-addressed cache of reduced FE parts (superelements).
+
+The reduced matrix files produced by the FE part reducer are stored in a
+cache directory which may be shared across models and runs. Each entry is
+identified by a checksum of the FE data file combined with the reducer
+options and the input files they refer to (e.g., the link file with the
+external node status), such that an FE part that is used in several models
+(or model variants) only needs to be reduced once. The files of a cache entry
+are then copied into the RDB directory of each model using it.
+
+The total disk size of the cache is limited by evicting the least recently
+used entries, when a new entry is added.
+"""
+
+from os import listdir, makedirs, path, utime
+from shutil import copy2, rmtree
+
+from fedempy.file_utils import atomic_output, file_checksum
+
+# Options which do not affect the reduction results,
+# and which therefore are ignored when computing the cache key
+_IGNORED_OPTIONS = ("-cwd", "-terminal", "-resfile")
+
+
+def _normalized_option(line):
+    """
+    Returns a reducer option line with file paths replaced by their base names,
+    such that the option does not depend on the location of the model,
+    and the list of file names referred to by the option.
+    Returns None, [] if the option should be ignored.
+    """
+    line = line.strip()
+    if not line or line[0] == "#" or line.startswith(_IGNORED_OPTIONS):
+        return None, []
+
+    words = line.split('"')
+    for i in range(1, len(words), 2):  # Every second item is a quoted string
+        words[i] = path.basename(words[i])
+
+    return '"'.join(words), words[1::2]
+
+
+def _dir_size(dir_name):
+    """
+    Returns the total size (in bytes) of the files in a directory.
+    """
+    return sum(
+        path.getsize(path.join(dir_name, fname))
+        for fname in listdir(dir_name)
+        if path.isfile(path.join(dir_name, fname))
+    )
+
+
+class ReductionCache:
+    """
+    This class manages a directory of reduced FE part files.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Absolute path to the cache directory, created if it does not exist
+    max_size : float, default=10240
+        Maximum total size (in MB) of the cache directory.
+        If zero or negative, the cache size is unlimited.
+
+    Methods
+    -------
+    checksum:
+        Computes the cache key of an FE part to be reduced
+    fetch:
+        Copies the files of a cache entry into a reducer working directory
+    store:
+        Adds the reduced matrix files of an FE part to the cache
+    evict:
+        Removes the least recently used entries exceeding the size limit
+    """
+
+    def __init__(self, cache_dir, max_size=10240):
+        """
+        Constructor.
+        """
+        self._root = path.abspath(cache_dir)
+        self._max_size = int(max_size * 1048576)
+        makedirs(self._root, exist_ok=True)
+
+    def _entry(self, key):
+        """
+        Returns the absolute path to the cache entry of the given key.
+        """
+        return path.join(self._root, key)
+
+    @staticmethod
+    def checksum(fem_file, rdbdir, extra=None):
+        """
+        Computes the cache key of an FE part to be reduced.
+        The key covers the content of the FE data file, the reducer options,
+        and the content of the files in `rdbdir` the options refer to.
+        It should therefore be computed before the reduction is performed.
+
+        Parameters
+        ----------
+        fem_file : str
+            Absolute path to the FE data file of the part
+        rdbdir : str
+            Absolute path to the reducer working directory,
+            containing the reducer option files
+        extra : str, default=None
+            Additional data to include in the key (e.g., the reducer version)
+
+        Returns
+        -------
+        str
+            The cache key (hexadecimal digest), None if no FE data file
+        """
+        if not path.isfile(fem_file):
+            return None
+
+        hasher = file_checksum(fem_file)
+        for ext in ("fco", "fop", "fao"):
+            option_file = path.join(rdbdir, "fedem_reducer." + ext)
+            if path.isfile(option_file):
+                with open(option_file, "r") as fd:
+                    for line in fd:
+                        option, file_names = _normalized_option(line)
+                        if option is not None:
+                            hasher.update(option.encode("utf-8"))
+                        for file_name in file_names:
+                            in_file = path.join(rdbdir, file_name)
+                            if path.isfile(in_file):
+                                file_checksum(in_file, hasher)
+        if extra:
+            hasher.update(extra.encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def fetch(self, key, rdbdir):
+        """
+        Copies the files of a cache entry into a reducer working directory.
+        The files are copied (not linked) such that any later modification
+        of them in the working directory cannot corrupt the cache entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the FE part
+        rdbdir : str
+            Absolute path to the reducer working directory
+
+        Returns
+        -------
+        bool
+            True if the entry was found, otherwise False
+        """
+        entry = self._entry(key) if key else None
+        if entry is None or not path.isdir(entry):
+            return False
+
+        try:
+            for fname in listdir(entry):
+                copy2(path.join(entry, fname), path.join(rdbdir, fname))
+            utime(entry)  # Mark as recently used
+        except OSError:
+            return False  # Probably evicted by another process
+
+        return True
+
+    def store(self, key, rdbdir, exclude=None):
+        """
+        Adds the reduced matrix files of an FE part to the cache.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the FE part
+        rdbdir : str
+            Absolute path to the reducer working directory
+        exclude : list of str, default=None
+            Names of files in `rdbdir` which should not be stored,
+            typically the files that existed before the reduction
+
+        Returns
+        -------
+        bool
+            True if the entry was added, otherwise False
+        """
+        if not key or path.isdir(self._entry(key)):
+            return False
+
+        # The files are copied (not linked) such that a later reduction
+        # in the same working directory cannot corrupt the cache entry.
+        try:
+            with atomic_output(self._entry(key), directory=True) as tmp_dir:
+                for fname in listdir(rdbdir):
+                    src = path.join(rdbdir, fname)
+                    if path.isfile(src) and (exclude is None or fname not in exclude):
+                        copy2(src, path.join(tmp_dir, fname))
+        except OSError:
+            return False
+
+        self.evict(keep=key)
+        return True
+
+    def evict(self, keep=None):
+        """
+        Removes the least recently used entries exceeding the size limit.
+
+        Parameters
+        ----------
+        keep : str, default=None
+            Key of an entry that should not be evicted
+
+        Returns
+        -------
+        int
+            Number of evicted entries
+        """
+        if self._max_size <= 0:
+            return 0
+
+        entries = []
+        total_size = 0
+        for key in listdir(self._root):
+            entry = self._entry(key)
+            if key[0] != "." and path.isdir(entry):
+                size = _dir_size(entry)
+                entries.append((path.getmtime(entry), size, key))
+                total_size += size
+
+        num_evicted = 0
+        for _, size, key in sorted(entries):
+            if total_size <= self._max_size:
+                break
+            if key != keep:
+                rmtree(self._entry(key), ignore_errors=True)
+                total_size -= size
+                num_evicted += 1
+
+        return num_evicted
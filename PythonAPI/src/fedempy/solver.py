@@ -9,13 +9,68 @@ Python wrapper for the native fedem dynamics solver.
 Used for convenience in order to hide native type convertions.
 """
 
-from ctypes import byref, c_bool, c_char_p, c_double, c_int, cdll
-from os import path
+from ctypes import POINTER, byref, c_bool, c_char_p, c_double, c_int, cdll
+from json import dump, load
+from os import getcwd, path, stat
+from re import DOTALL, MULTILINE, compile as re_compile
 
 from numpy import empty, float64, int32, int64, ndarray, ascontiguousarray
+from numpy import asfortranarray
 from progress.bar import Bar
 
 
+# Regular expressions for extracting the tags of all general functions
+# (&ENGINE records) from the solver input file
+_ENGINE_RECORD = re_compile(r"^\s*&ENGINE\b(.*?)^\s*/", DOTALL | MULTILINE)
+_ENGINE_TAG = re_compile(r"\btag\s*=\s*(['\"])(.*?)\1")
+
+
+def _option_value(args, key):
+    """
+    Returns the value of command-line option `key` in the list `args`,
+    which may be specified either as "-key=value" or as "-key value".
+    """
+    value = None
+    for i, arg in enumerate(args):
+        if arg == "-" + key and i + 1 < len(args):
+            value = args[i + 1]
+        elif arg.startswith("-" + key + "="):
+            value = arg[len(key) + 2 :]
+
+    return value
+
+
+def _fsi_file(options):
+    """
+    Returns the absolute path of the solver input file for the given options,
+    also considering the option files (if any).
+    This function has to be invoked after the solver has been initialized,
+    when the current working directory is that of the solver.
+    """
+    fsi_file = _option_value(options, "fsifile")
+    for ext in ("fao", "fco", "fop"):
+        option_file = _option_value(options, ext)
+        if fsi_file is None and option_file and path.isfile(option_file):
+            with open(option_file, "r") as fd:
+                fsi_file = _option_value(fd.read().split(), "fsifile")
+
+    fsi_file = (fsi_file or "fedem_solver.fsi").strip('"')
+    return path.join(getcwd(), fsi_file)
+
+
+def _engine_tags(fsi):
+    """
+    Returns the tags of all general functions in the given solver input.
+    """
+    tags = []
+    for record in _ENGINE_RECORD.finditer(fsi):
+        tag = _ENGINE_TAG.search(record.group(1))
+        if tag and tag.group(2).strip():
+            tags.append(tag.group(2).strip())
+
+    return tags
+
+
 class FedemProgressBar(Bar):
     """
     Progress bar for the dynamics solver.
@@ -108,6 +163,10 @@ class FedemSolver:
         Stores current transformation state in provided core array
     save_part_state:
         Stores current deformation- and stress states in provided core arrays
+    get_nodal_displacements:
+        Returns total translations for some nodes of an FE part
+    set_prescribed_displacements:
+        Assigns prescribed nodal displacements for the next time step
     solve_next:
         Advances the solution one time/load step forward
     start_step:
@@ -142,12 +201,16 @@ class FedemSolver:
         Evaluates several general functions in the model and returns their value
     get_function_ids:
         Returns a list of user Ids of tagged general functions
+    save_function_ids:
+        Saves the tag -> user Id index of general functions to file
     get_equations:
         Returns the equation numbers associated with the DOFs of an object
     get_system_size:
         Returns the number of equations in the linearized system
     get_system_dofs:
         Returns the number of DOFs in the system
+    get_solver_counters:
+        Returns the accumulated number of steps, iterations and matrix updates
     get_newton_matrix:
         Returns current content of the system Newton matrix
     get_stiffness_matrix:
@@ -176,6 +239,14 @@ class FedemSolver:
         Computes beam section forces in triads for given displacement field
     compute_spring_var_from_displ:
         Computes one of the spring variables for given displacement field
+    compute_strains_from_displ_batch:
+        Computes the strain tensor at gauges for a set of displacement fields
+    compute_rel_dist_from_displ_batch:
+        Computes relative distance at sensors for a set of displacement fields
+    compute_int_forces_from_displ_batch:
+        Computes beam section forces in triads for a set of displacement fields
+    compute_spring_var_from_displ_batch:
+        Computes one of the spring variables for a set of displacement fields
     get_joint_spring_stiffness:
         Returns current joint spring stiffness coefficient(s)
 
@@ -203,11 +274,14 @@ class FedemSolver:
         self._solver.saveTransformationState.restype = c_bool
         self._solver.savePartDeformationState.restype = c_bool
         self._solver.savePartStressState.restype = c_bool
+        self._solver.getNodalDisplacements.restype = c_bool
+        self._solver.setPrescribedDisplacements.restype = c_bool
         self._solver.saveGages.restype = c_bool
         self._solver.solveNext.restype = c_bool
         self._solver.startStep.restype = c_bool
         self._solver.solveIteration.restype = c_bool
         self._solver.solveEigenModes.restype = c_bool
+        self._solver.setEigenStartVectors.restype = c_bool
         self._solver.solveInverse.restype = c_bool
         self._solver.solverDone.restype = c_int
         self._solver.setExtFunc.restype = c_int
@@ -225,6 +299,10 @@ class FedemSolver:
         self._solver.getStrainsFromDisp.restype = c_bool
         self._solver.getRelDisp.restype = c_bool
         self._solver.getRespVars.restype = c_bool
+        self._solver.getStrainsFromDispBatch.restype = c_bool
+        self._solver.getBeamForcesFromDispBatch.restype = c_bool
+        self._solver.getRelDispBatch.restype = c_bool
+        self._solver.getRespVarsBatch.restype = c_bool
         self._solver.getJointSprCoeff.restype = c_bool
 
         # initialize error flag
@@ -236,6 +314,9 @@ class FedemSolver:
         self.state_data = None
         self.gauge_data = None
 
+        # tag -> user Id index of the general functions in the model
+        self._func_ids = {}
+
         # initialize the fedem solver
         status = self.solver_init(solver_options)
         if status < 0:
@@ -417,6 +498,7 @@ class FedemSolver:
             return status  # initialization failure
 
         self.ierr = c_int(0)
+        self._init_func_ids(options, fsi)
         if self.state_size.value < 0:
             return nxin_.value  # not using internal state arrays (no restart)
 
@@ -437,6 +519,65 @@ class FedemSolver:
 
         return nxin_.value
 
+    def _init_func_ids(self, options, fsi=None):
+        """
+        Initializes the tag -> user Id index of the general functions,
+        such that the tag-based methods do not need to resolve tags natively.
+        If the model is defined in a file, the index is persisted in a json-file
+        beside it, and reused as long as the solver input file is not changed.
+        """
+        self._func_ids = {}
+        if isinstance(fsi, str):
+            self.get_function_ids(_engine_tags(fsi))
+            return
+        if fsi is not None or not isinstance(options, list):
+            return
+
+        fsi_file = _fsi_file(options)
+        if not path.isfile(fsi_file):
+            return
+
+        fsi_stat = stat(fsi_file)
+        fsi_key = [fsi_stat.st_size, fsi_stat.st_mtime]
+        index_file = path.splitext(fsi_file)[0] + "_tags.json"
+        if path.isfile(index_file):
+            try:
+                with open(index_file, "r") as fd:
+                    index = load(fd)
+                if index.get("fsi") == fsi_key:
+                    self._func_ids = index["tags"]
+                    return
+            except (OSError, ValueError, KeyError):
+                pass  # Ignore corrupt index file, regenerate it
+
+        with open(fsi_file, "r", errors="replace") as fd:
+            self.get_function_ids(_engine_tags(fd.read()))
+        self.save_function_ids(index_file, fsi_key)
+
+    def save_function_ids(self, file_name, fsi_key=None):
+        """
+        Saves the tag -> user Id index of the general functions to a json-file.
+
+        Parameters
+        ----------
+        file_name : str
+            Path of the json-file to write
+        fsi_key : list, default=None
+            Size and modification time of the solver input file indexed
+
+        Returns
+        -------
+        bool
+            True if the file was written, otherwise False
+        """
+        try:
+            with open(file_name, "w") as fd:
+                dump({"fsi": fsi_key, "tags": self._func_ids}, fd)
+        except OSError:
+            return False  # Probably a read-only directory, no index then
+
+        return True
+
     def restart_from_state(self, state_data, write_to_rdb=2):
         """
         This method re-initializes the mechanism objects with data from the
@@ -676,6 +817,65 @@ class FedemSolver:
         nstr = c_int(len(str_state))
         return self._solver.savePartStressState(bid_, str_state, nstr)
 
+    def get_nodal_displacements(self, base_id, nodes):
+        """
+        This method returns the total translations for some nodes
+        of the specified FE Part, in global directions.
+        It requires that stress recovery is performed for the FE Part.
+
+        Parameters
+        ----------
+        base_id : int
+            Base Id of the FE Part to return displacements for
+        nodes : list of int
+            External node numbers to return displacements for
+
+        Returns
+        -------
+        numpy.ndarray
+            Total nodal translations (n_nodes x 3)
+        bool
+            Always True, unless some nodes were not found
+        """
+        nodes_ = ascontiguousarray(nodes, dtype=int32)
+        disp_ = empty((len(nodes_), 3))
+        success = self._solver.getNodalDisplacements(
+            self._convert_c_int(base_id),
+            nodes_.ctypes.data_as(POINTER(c_int)),
+            disp_.ctypes.data_as(POINTER(c_double)),
+            c_int(len(nodes_)),
+        )
+
+        return disp_, success
+
+    def set_prescribed_displacements(self, nodes, disp):
+        """
+        This method assigns prescribed displacements for the next time step,
+        as an in-core alternative to the -displacementfile option.
+        The values are associated with the prescribed motions of the model
+        through their external node number.
+
+        Parameters
+        ----------
+        nodes : list of int
+            External node numbers of the prescribed displacements
+        disp : numpy.ndarray
+            Prescribed displacements (n_nodes x 3, or n_nodes x 6)
+
+        Returns
+        -------
+        bool
+            Always True, unless the array dimensions are inconsistent
+        """
+        nodes_ = ascontiguousarray(nodes, dtype=int32)
+        disp_ = ascontiguousarray(disp, dtype=float64)
+        return self._solver.setPrescribedDisplacements(
+            nodes_.ctypes.data_as(POINTER(c_int)),
+            disp_.ctypes.data_as(POINTER(c_double)),
+            c_int(len(nodes_)),
+            c_int(disp_.size // max(len(nodes_), 1)),
+        )
+
     def solve_next(self, inp=None, inp_def=None, out_def=None, time_next=None):
         """
         This method advances the solution one time/load step forward.
@@ -791,7 +991,7 @@ class FedemSolver:
         self.__check_error("finish_step")
         return self._solver.solveIteration(byref(self.ierr), c_bool(True))
 
-    def solve_modes(self, n_modes, dof_order=False, use_lapack=0):
+    def solve_modes(self, n_modes, dof_order=False, use_lapack=0, start_vec=None):
         """
         This method solves the eigenvalue problem at current time step,
         and returns the computed eigenvalues and associated eigenvectors.
@@ -806,7 +1006,12 @@ class FedemSolver:
             If True, the eigenvectors are returned in DOF-order
             instead of equation order which is the default
         use_lapack : int, default=0
-            Flag usage of LAPACK eigensolvers (0=No, 1=DSYGVX, 2=DGGEVX)
+            Flag usage of LAPACK eigensolvers (0=No, 1=DSYGVX, 2=DGGEVX),
+            or subspace iteration from the previous eigenvectors (3)
+        start_vec : list of list of float, default=None
+            Starting vectors for the subspace iteration (in equation order),
+            typically eigenvectors of a previous invocation.
+            If given, subspace iteration is used regardless of use_lapack.
 
         Returns
         -------
@@ -824,6 +1029,17 @@ class FedemSolver:
         e_val_ = (c_double * n_modes)()
         e_vec_ = (c_double * (dim * n_modes))()
         doford = c_bool(dof_order)
+        if start_vec is not None:
+            n_vec = len(start_vec)
+            n_equ = self.get_system_size()
+            s_vec_ = (c_double * (n_equ * n_vec))()
+            for i, s_vec in enumerate(start_vec):
+                s_vec_[n_equ * i : n_equ * (i + 1)] = s_vec
+            if not self._solver.setEigenStartVectors(
+                s_vec_, c_int(n_vec), byref(self.ierr)
+            ):
+                return None, None, self.ierr.value >= 0
+            use_lapack = 3
         lapack = c_int(use_lapack)
         success = self._solver.solveEigenModes(
             n_mod_, e_val_, e_vec_, doford, lapack, byref(self.ierr)
@@ -1033,6 +1249,13 @@ class FedemSolver:
         If the specified function could not be evaluated, the self.ierr variable
         is decremented. Otherwise, it is not touched.
         """
+        if tag is not None and not uid:
+            uid = self._get_func_id(tag)
+            if uid > 0:  # The tag was found in the index
+                tag, arg = None, None
+            else:  # Let the native solver report the unknown tag
+                uid = 0
+
         uid_ = self._convert_c_int(uid)
         tag_ = self._convert_c_char(tag)
         arg_ = self._convert_c_double(arg, -1)
@@ -1055,6 +1278,16 @@ class FedemSolver:
 
         return out
 
+    def _get_func_id(self, tag):
+        """
+        Returns the user Id of the (first) general function with the given tag.
+        The tag is resolved natively only if it is not already in the index.
+        """
+        if tag not in self._func_ids:
+            self._func_ids[tag] = self._solver.getFuncId(self._convert_c_char(tag))
+
+        return self._func_ids[tag]
+
     def get_function_ids(self, tags):
         """
         Utility returning a list of user Ids of tagged general functions.
@@ -1062,14 +1295,14 @@ class FedemSolver:
         if tags is None:
             return None
         if isinstance(tags, str):
-            return self._solver.getFuncId(self._convert_c_char(tags))
+            return self._get_func_id(tags)
         if not isinstance(tags, list):
             return None
 
         uids = [0] * len(tags)
         for i, tag in enumerate(tags):
             if isinstance(tag, str):
-                uids[i] = self._solver.getFuncId(self._convert_c_char(tag))
+                uids[i] = self._get_func_id(tag)
             else:
                 uids[i] = self._convert_c_int(tag)
 
@@ -1100,6 +1333,22 @@ class FedemSolver:
         """
         return self._solver.getSystemSize(c_bool(True))
 
+    def get_solver_counters(self):
+        """
+        Utility returning the accumulated solution effort counters.
+
+        Returns
+        -------
+        dict
+            Total number of time steps ("steps"), iterations ("iterations"),
+            system matrix factorizations ("updates"), and time steps started
+            with a reused matrix factorization ("reuses")
+        """
+        counters = (c_double * 4)()
+        self._solver.getSolverCounters(counters)
+        keys = ("steps", "iterations", "updates", "reuses")
+        return {key: int(value) for key, value in zip(keys, counters)}
+
     def __get_system_matrix(self, i_mat):
         """
         Utility returning a system matrix.
@@ -1370,6 +1619,155 @@ class FedemSolver:
 
         return forces, success
 
+    def __compute_from_displ_batch(self, func, disp, ids_, n_ids, n_out):
+        """
+        Utility invoking a native response evaluation function
+        for all columns of a displacement matrix in one call.
+        """
+        disp_ = asfortranarray(disp, dtype=float64)
+        if disp_.ndim == 1:  # a single displacement vector
+            disp_ = disp_.reshape((-1, 1), order="F")
+
+        n_dof, n_vec = disp_.shape
+        resp_ = empty((n_out, n_vec), order="F")
+        success = func(
+            disp_.ctypes.data_as(POINTER(c_double)),
+            ids_,
+            resp_.ctypes.data_as(POINTER(c_double)),
+            c_int(n_dof),
+            c_int(n_ids),
+            c_int(n_vec),
+        )
+
+        return resp_, success
+
+    def compute_strains_from_displ_batch(self, disp, gauge_ids):
+        """
+        This method computes the strain tensor at gauges for a set of
+        displacement fields, e.g., from a set of unit load cases.
+        It is equivalent to invoking compute_strains_from_displ()
+        for each column of the displacement matrix, but with one native call.
+
+        Parameters
+        ----------
+        disp : numpy.ndarray
+            Displacement fields, one per column (n_dof x n_vec)
+        gauge_ids : list of int
+            Array with gauge identification numbers and tensor component
+            indices, as in compute_strains_from_displ()
+
+        Returns
+        -------
+        numpy.ndarray
+            Strain components, one column per displacement field
+        bool
+            Always True, unless the calculation failed
+        """
+        n_gauge = len(gauge_ids) // 2
+        n_gauge_, gauge_ids_ = self._convert_c_int_array(gauge_ids[0::2])
+        eps_, success = self.__compute_from_displ_batch(
+            self._solver.getStrainsFromDispBatch, disp, gauge_ids_, n_gauge, 3 * n_gauge
+        )
+
+        rows = []
+        for i in range(n_gauge):
+            tc_idx = gauge_ids[2 * i + 1]
+            if tc_idx in (0, 1, 2):  # Tensorial component index
+                rows.append(3 * i + tc_idx)
+            else:  # Return all three tensor components
+                rows.extend(range(3 * i, 3 * i + 3))
+
+        return eps_[rows], success
+
+    def compute_rel_dist_from_displ_batch(self, disp, ids):
+        """
+        This method computes the relative distance at sensors for a set of
+        displacement fields, e.g., from a set of unit load cases.
+        It is equivalent to invoking compute_rel_dist_from_displ()
+        for each column of the displacement matrix, but with one native call.
+
+        Parameters
+        ----------
+        disp : numpy.ndarray
+            Displacement fields, one per column (n_dof x n_vec)
+        ids : list of int
+            Array with function identification numbers
+
+        Returns
+        -------
+        numpy.ndarray
+            Displacement components, one column per displacement field
+        bool
+            Always True, unless the calculation failed
+        """
+        n_ids_, ids_ = self._convert_c_int_array(ids)
+        return self.__compute_from_displ_batch(
+            self._solver.getRelDispBatch, disp, ids_, n_ids_.value, n_ids_.value
+        )
+
+    def compute_spring_var_from_displ_batch(self, disp, ids):
+        """
+        This method computes one of the spring variables (length,
+        deflection, force) at sensors for a set of displacement fields.
+        It is equivalent to invoking compute_spring_var_from_displ()
+        for each column of the displacement matrix, but with one native call.
+
+        Parameters
+        ----------
+        disp : numpy.ndarray
+            Displacement fields, one per column (n_dof x n_vec)
+        ids : list of int
+            Array with function identification numbers
+
+        Returns
+        -------
+        numpy.ndarray
+            Spring variables, one column per displacement field
+        bool
+            Always True, unless the calculation failed
+        """
+        n_ids_, ids_ = self._convert_c_int_array(ids)
+        return self.__compute_from_displ_batch(
+            self._solver.getRespVarsBatch, disp, ids_, n_ids_.value, n_ids_.value
+        )
+
+    def compute_int_forces_from_displ_batch(self, disp, ids):
+        """
+        This method computes beam section forces in triads for a set of
+        displacement fields, e.g., from a set of unit load cases.
+        It is equivalent to invoking compute_int_forces_from_displ()
+        for each column of the displacement matrix, but with one native call.
+
+        Parameters
+        ----------
+        disp : numpy.ndarray
+            Displacement fields, one per column (n_dof x n_vec)
+        ids : list of int
+            Array with beam and triad identification numbers and force
+            component indices, as in compute_int_forces_from_displ()
+
+        Returns
+        -------
+        numpy.ndarray
+            Force components, one column per displacement field
+        bool
+            Always True, unless the calculation failed
+        """
+        n_ids_, ids_ = self._convert_c_int_array(ids)
+        n_items = n_ids_.value // 3
+        forces_, success = self.__compute_from_displ_batch(
+            self._solver.getBeamForcesFromDispBatch, disp, ids_, n_items, 6 * n_items
+        )
+
+        rows = []
+        for i, dof in enumerate(ids[2::3]):
+            if dof < 0:  # all 6 force components are requested
+                rows.extend(range(6 * i, 6 * i + 6))
+            else:  # Force component for local dof is requested
+                rows.append(6 * i + dof)
+
+        return forces_[rows], success
+
     def get_joint_spring_stiffness(self, bid):
         """
         Get joint spring stiffness coefficient(s).
@@ -6,11 +6,20 @@
 
 """
 Python wrapper for native FMX-writer library.
+
+The functions `write` and `read` transfer the matrix content through a Python
+list. For large reduced matrices, the functions `write_array`, `read_array`
+and `read_blocks` should be used instead. They operate on NumPy arrays
+directly and access the binary payload of the fmx-file through memory mapping
+or block-wise file IO, such that the whole matrix never needs to be copied
+(or even be in core) at once.
 """
 
 import os
 from ctypes import byref, c_char_p, c_double, c_int, cdll
 
+from numpy import asfortranarray, float32, float64, fromfile, memmap
+
 if "FMXWRITER" in os.environ:
     _lib = cdll.LoadLibrary(os.environ["FMXWRITER"])
     if os.name == "nt":  # Windows
@@ -20,6 +29,17 @@ if "FMXWRITER" in os.environ:
         writeFMX = _lib.writefmx_
         readFMX = _lib.readfmx_
 
+# File name suffix and file tag of each matrix type
+_FMX_TYPES = {
+    1: ("_S.fmx", b"stiffness matrix"),
+    2: ("_M.fmx", b"mass matrix"),
+    3: ("_G.fmx", b"gravity force vectors"),
+    4: ("_B.fmx", b"disk matrix"),
+}
+
+# The file header is terminated by the file version field
+_HEADER_END = b";1.0;\n"
+
 
 def write(fnam, ityp, data):
     """
@@ -76,3 +96,195 @@ def read(fnam, ityp, data):
     ierr = readFMX(cfil, byref(ctyp), cdat, byref(clen), len(fnam))
     data[:] = cdat
     return ierr
+
+
+def fmx_file(fnam, ityp):
+    """
+    Returns the name of the fmx-file of a given matrix type.
+
+    Parameters
+    ----------
+    fnam : str or bytes
+        Absolute path to the fmx-file, without the type suffix
+    ityp : int
+        Type of matrix,
+        1=stiffness matrix, 2=mass matrix, 3=gravity force vectors
+
+    Returns
+    -------
+    str
+        The fmx-file name
+    """
+
+    if isinstance(fnam, bytes):
+        fnam = fnam.decode()
+    return fnam + _FMX_TYPES[ityp][0]
+
+
+def _payload(file_name, ityp):
+    """
+    Returns the byte offset and data type of the matrix content of an fmx-file.
+    The file is assumed to have the same byte order as the current machine.
+    """
+
+    with open(file_name, "rb") as fd:
+        header = fd.read(256)
+
+    tag = b"#FEDEM " + _FMX_TYPES[ityp][1]
+    end = header.find(_HEADER_END)
+    if not header.startswith(tag) or end < len(tag):
+        raise ValueError(f"{file_name} is not a FEDEM {_FMX_TYPES[ityp][1]} file")
+
+    single = header.startswith(tag + b" SP")
+    return end + len(_HEADER_END), float32 if single else float64
+
+
+def _shape(nval, ityp, nrow):
+    """
+    Returns the matrix dimension for the given number of values.
+    Stiffness and mass matrices are square, and there are three
+    gravity force vectors, unless the number of rows is specified.
+    """
+
+    if nrow is None:
+        if ityp == 3:
+            nrow = nval // 3
+        else:
+            nrow = int(round(nval**0.5))
+    if nrow < 1 or nval % nrow:
+        raise ValueError(f"Invalid matrix dimension {nrow} for {nval} values")
+
+    return nrow, nval // nrow
+
+
+def read_array(fnam, ityp, nrow=None, mmap=True):
+    """
+    This function reads a rectangular matrix from a binary FMX-file for FEDEM
+    into a NumPy array. The native FMX-writer library is not used.
+
+    Parameters
+    ----------
+    fnam : str or bytes
+        Absolute path to the fmx-file to be read, without the type suffix
+    ityp : int
+        Type of matrix to read,
+        1=stiffness matrix, 2=mass matrix, 3=gravity force vectors
+    nrow : int, default=None
+        Number of matrix rows. If None, stiffness and mass matrices
+        are assumed square, and the gravity force matrix to have 3 columns
+    mmap : bool, default=True
+        If True, the file is memory-mapped (read-only) instead of read in core
+
+    Returns
+    -------
+    numpy.ndarray
+        Matrix content, as a column-major (Fortran-ordered) array
+    """
+
+    file_name = fmx_file(fnam, ityp)
+    offset, dtype = _payload(file_name, ityp)
+    nval = (os.path.getsize(file_name) - offset) // dtype().itemsize
+    shape = _shape(nval, ityp, nrow)
+    if mmap:
+        return memmap(file_name, dtype, "r", offset, shape, "F")
+
+    with open(file_name, "rb") as fd:
+        fd.seek(offset)
+        return fromfile(fd, dtype, nval).reshape(shape, order="F")
+
+
+def read_blocks(fnam, ityp, nrow=None, ncol=1):
+    """
+    This generator reads a rectangular matrix from a binary FMX-file for FEDEM
+    in blocks of columns, for matrices that are too large to fit in core.
+
+    Parameters
+    ----------
+    fnam : str or bytes
+        Absolute path to the fmx-file to be read, without the type suffix
+    ityp : int
+        Type of matrix to read,
+        1=stiffness matrix, 2=mass matrix, 3=gravity force vectors
+    nrow : int, default=None
+        Number of matrix rows. If None, stiffness and mass matrices
+        are assumed square, and the gravity force matrix to have 3 columns
+    ncol : int, default=1
+        Maximum number of columns in each block
+
+    Yields
+    ------
+    int
+        Zero-based index of the first column in the block
+    numpy.ndarray
+        The matrix columns of the block, as a column-major array
+    """
+
+    file_name = fmx_file(fnam, ityp)
+    offset, dtype = _payload(file_name, ityp)
+    nval = (os.path.getsize(file_name) - offset) // dtype().itemsize
+    nrow, ntot = _shape(nval, ityp, nrow)
+    with open(file_name, "rb") as fd:
+        fd.seek(offset)
+        for icol in range(0, ntot, ncol):
+            nc = min(ncol, ntot - icol)
+            block = fromfile(fd, dtype, nrow * nc).reshape((nrow, nc), order="F")
+            yield icol, block
+
+
+def write_array(fnam, ityp, data, ncol=None):
+    """
+    This function writes a rectangular matrix as a binary FMX-file for FEDEM
+    from a NumPy array, or from a sequence of column blocks.
+
+    The file header is written by the native FMX-writer library,
+    whereas the matrix content is appended block-wise by NumPy,
+    such that it is never copied into a Python list.
+
+    Parameters
+    ----------
+    fnam : str or bytes
+        Absolute path to the fmx-file to be written, without the type suffix
+    ityp : int
+        Type of matrix to write,
+        1=stiffness matrix, 2=mass matrix, 3=gravity force vectors
+    data : numpy.ndarray or iterable of numpy.ndarray
+        Matrix content, either as a single 2D array (which may be memory-mapped)
+        or as a sequence of 2D arrays, each containing consecutive columns
+    ncol : int, default=None
+        Number of columns to write in each block when `data` is a single array.
+        If None, blocks of approximately 64 MB are used.
+
+    Returns
+    -------
+    int
+        Zero on success, otherwise negative
+    """
+
+    if isinstance(fnam, str):
+        fnam = fnam.encode()
+    cfil = c_char_p(fnam)
+    ctyp = c_int(ityp)
+    cdat = (c_double * 1)()
+    clen = c_int(0)
+    ierr = writeFMX(cfil, byref(ctyp), cdat, byref(clen), len(fnam))
+    if ierr < 0:
+        return ierr
+
+    if hasattr(data, "ndim"):
+        if data.ndim < 2:
+            data = data.reshape((-1, 1))
+        if ncol is None:
+            ncol = max(1, 8388608 // max(1, data.shape[0]))
+        blocks = (data[:, i : i + ncol] for i in range(0, data.shape[1], ncol))
+    else:
+        blocks = data
+
+    file_name = fmx_file(fnam, ityp)
+    offset = _payload(file_name, ityp)[0]
+    with open(file_name, "r+b") as fd:
+        fd.seek(offset)
+        fd.truncate()
+        for block in blocks:
+            asfortranarray(block, float64).ravel(order="F").tofile(fd)
+
+    return 0
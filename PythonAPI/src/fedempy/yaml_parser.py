@@ -42,14 +42,30 @@ This module can also be launched directly using the syntax
 
 It will then invoke the method :meth:`yaml_parser.main`
 on the specified input file (`mymodel.yaml`).
+
+With the option ``-p`` (or ``--planned``), the keywords are processed in an
+order determined by their mutual dependencies instead of the order in the
+input file, and the FE data files are pre-read concurrently before the parts
+are created. Triads given by their global position are then created in bulk.
+
+With the option ``-i`` (or ``--incremental``), an existing model file is
+updated with the new objects only, by comparing the input with that of the
+previous incremental build of the same model. A full rebuild is performed
+if an already created object or applied edit has been changed or removed.
+The ``file_exists`` keyword can not be used in incremental builds.
 """
 
 from argparse import ArgumentParser
 from collections import OrderedDict
-from json import dump
-from os import getcwd, makedirs, path
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from hashlib import sha256
+from json import dump, dumps
+from json import load as json_load
+from os import cpu_count, getcwd, makedirs, path, stat
 from pathlib import Path
 from shutil import copy2
+from time import perf_counter
 
 from yaml import FullLoader, load
 
@@ -108,6 +124,153 @@ def _merge(target, source):
     return target
 
 
+# Keywords that need to be processed before each model generation keyword,
+# since the objects created by the latter may refer to the former by tag
+_DEPENDENCIES = {
+    "triads": ("fe_parts",),
+    "triads_from_fe_parts": ("fe_parts",),
+    "beam_sections": ("beam_materials",),
+    "beams": ("triads", "triads_from_fe_parts", "beam_sections"),
+    "joints": ("triads", "triads_from_fe_parts"),
+    "loads": ("triads", "triads_from_fe_parts"),
+    "spring_dampers": ("triads", "triads_from_fe_parts"),
+    "virtual_sensors": (
+        "fe_parts",
+        "triads",
+        "triads_from_fe_parts",
+        "beams",
+        "joints",
+        "loads",
+        "spring_dampers",
+    ),
+}
+
+
+def _plan(keywords):
+    """
+    Returns the given model generation keywords in processing order.
+    Each keyword is placed after the keywords it depends on, but otherwise
+    the original order is kept. The edit-keywords are always placed last.
+    """
+    pending = [key for key in keywords if not key.startswith("edit_")]
+    planned = []
+    while pending:
+        for key in pending:
+            if all(dep not in pending for dep in _DEPENDENCIES.get(key, ())):
+                planned.append(key)
+                pending.remove(key)
+                break
+
+    return planned + [key for key in keywords if key.startswith("edit_")]
+
+
+def _prefetch(file_names, block_size=1048576):
+    """
+    Reads the given files concurrently, such that the subsequent (sequential)
+    FE part creation will read them from the file system cache.
+    Returns the names of the files that could not be read.
+    """
+
+    def _read(file_name):
+        """
+        Reads the given file, discarding the data.
+        """
+        try:
+            with open(file_name, "rb") as fd:
+                while fd.read(block_size):
+                    pass
+        except OSError:
+            return file_name
+        return None
+
+    with ThreadPoolExecutor(min(len(file_names), cpu_count() or 1) or 1) as pool:
+        return [fname for fname in pool.map(_read, file_names) if fname]
+
+
+def _triad_position(values):
+    """
+    Returns the name, position and rotation of a triad defined by its
+    global position, or None if the triad is defined otherwise.
+    """
+    if isinstance(values, list):
+        has_name = len(values) > 0 and isinstance(values[0], str)
+        data = dict(zip(["pos", "rot"], values[1:] if has_name else values))
+        if len(values) - int(has_name) not in (1, 2):
+            return None
+        name = values[0] if has_name else ""
+    elif isinstance(values, dict) and set(values) <= {"name", "pos", "rot"}:
+        data = values
+        name = values.get("name", "")
+    else:
+        return None
+
+    pos = data.get("pos")
+    rot = data.get("rot", [0.0, 0.0, 0.0])
+    if not isinstance(pos, list) or len(pos) != 3:
+        return None
+    if not isinstance(rot, list) or len(rot) != 3:
+        return None
+
+    return name, pos, rot
+
+
+# Cache of parsed YAML files, for reuse by repeated includes of the same file.
+# Each entry is keyed by the absolute file path and contains the
+# modification time and size of the file when it was parsed.
+_yaml_cache = {}
+
+
+def _load_yaml(file_name):
+    """
+    Returns the parsed content of a YAML file,
+    from the cache if the file has not been modified since it was parsed.
+    """
+    file_name = path.abspath(file_name)
+    file_stat = stat(file_name)
+    file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+    if file_name not in _yaml_cache or _yaml_cache[file_name][0] != file_key:
+        with open(file_name) as yml_file:
+            _yaml_cache[file_name] = (file_key, load(yml_file, Loader=FullLoader))
+
+    # Return a copy, since the model generators modify the data
+    return deepcopy(_yaml_cache[file_name][1])
+
+
+def _digest(model_input):
+    """
+    Returns a checksum of each object definition in the model input.
+    """
+    return {
+        section: {
+            key: sha256(dumps(values, sort_keys=True, default=str).encode()).hexdigest()
+            for key, values in entries.items()
+        }
+        for section, entries in model_input.items()
+        if isinstance(entries, dict) and not section.startswith("-")
+    }
+
+
+def _changes(old_digest, new_digest):
+    """
+    Returns the object definitions that are new since a previous build,
+    or None if the model needs to be rebuilt from scratch. This is the case
+    if an already processed definition has been changed or removed, including
+    the edit-keywords, since an applied edit can not be reverted incrementally.
+    """
+    for section, entries in old_digest.items():
+        for key, digest in entries.items():
+            if new_digest.get(section, {}).get(key) != digest:
+                return None
+
+    changes = {}
+    for section, entries in new_digest.items():
+        for key, digest in entries.items():
+            if old_digest.get(section, {}).get(key) != digest:
+                changes.setdefault(section, []).append(key)
+
+    return changes
+
+
 def _process(generator, properties):
     """
     Generic function for invoking the method `generator`
@@ -132,28 +295,35 @@ class ModelYAML:
     ----------
     input_file : str
         Absolute path to the YAML-formated input file
+    incremental : bool, default=False
+        If True, an existing model file is updated with the new object
+        definitions since the previous incremental build only.
+        The file_exists keyword can then not be used, and the source_file
+        can not be the target_file (i.e., amending an existing model).
 
     Methods
     -------
     build:
         Loads and parses all model attributes into the model instance
+    build_planned:
+        Loads all model attributes in dependency order, with timing
     save:
         Saves the model to the input file specified FEDEM model file
     solve:
         Executes the dynamics solver on the created model.
     """
 
-    def __init__(self, input_file):
+    def __init__(self, input_file, incremental=False):
         """
         Constructor.
         """
         self.model_dir = Path(input_file).parent.resolve()
         self.model_file = None
         self.model_input = {}
+        self.digest = None  # Checksums of the object definitions
 
         print("   * Parsing YAML input file", input_file)
-        with open(input_file) as yml_file:
-            self.model_input = load(yml_file, Loader=FullLoader)
+        self.model_input = _load_yaml(input_file)
 
         if self.model_input:
             # Check for inclusion of other yaml-file(s) into parent file
@@ -169,14 +339,26 @@ class ModelYAML:
             def_file = input_file[: input_file.rfind(".")] + ".fmm"
             target_file = self.model_input.pop("target_file", def_file)
             source_file = self.model_input.pop("source_file", None)
-            file_exists = self.model_input.pop("file_exists", "index")
+            file_exists = self.model_input.pop("file_exists", None)
+            if incremental and file_exists is not None:
+                raise FedemException(
+                    f"file_exists: {file_exists} can not be used in incremental builds"
+                )
+            if file_exists is None:
+                file_exists = "index"
             if target_file.startswith("/"):  # Absolute path
                 rel_path = ""
             elif getcwd() == "/":
                 # Necessary for running in docker (start directory is then "/")
                 rel_path = path.join(self.model_dir, rel_path)
             if source_file == rel_path + target_file:
+                if incremental:
+                    raise FedemException(
+                        f"source_file: {source_file} can not be amended in incremental builds"
+                    )
                 file_exists = "USE_IT"  # We are amending an existing model
+            if incremental:
+                file_exists = self._incremental(rel_path + target_file)
             # Assign the resulting target_file to the [self.model_file] variable
             self.model_file = _check_target(rel_path, target_file, file_exists)
             if rel_path not in ("", "./"):
@@ -185,7 +367,7 @@ class ModelYAML:
             if (
                 source_file is not None
                 and path.exists(source_file)
-                and file_exists != "USE IT"
+                and file_exists != "USE_IT"
             ):
                 copy2(source_file, self.model_file)
 
@@ -245,6 +427,123 @@ class ModelYAML:
             print(f"\n********** Processing {method} **************")
             _process(self.model_generators[method], properties)
 
+    def build_planned(self, dump_file=None):
+        """
+        Loads and parses all model attributes into the model instance.
+        Unlike :meth:`build`, the keywords are processed in dependency order,
+        the FE data files are pre-read concurrently, the triads given by
+        their global position are created in bulk, and the time spent on
+        each keyword is printed.
+
+        Parameters
+        ----------
+        dump_file : str, default=None
+            Absolute path to dump the model data dictionary to
+        """
+        if dump_file:
+            with open(dump_file, "w") as d_file:
+                dump(OrderedDict(sorted(self.model_input.items())), d_file, indent=2)
+
+        keywords = []
+        for method in self.model_input.keys():
+            if method.startswith("-"):
+                print("   * Comment line:", method)
+            elif method not in self.model_generators:
+                print("  ** Ignoring unknown keyword:", method)
+            else:
+                keywords.append(method)
+
+        start = perf_counter()
+        if "fe_parts" in keywords:
+            self._prefetch_fe_parts(self.model_input["fe_parts"])
+            print(f"   * Pre-read FE data files in {perf_counter()-start:.3f}s")
+
+        for method in _plan(keywords):
+            tic = perf_counter()
+            print(f"\n********** Processing {method} **************")
+            properties = self.model_input[method]
+            if method in ("triads", "triads_from_fe_parts"):
+                self._make_triads(properties)
+            else:
+                _process(self.model_generators[method], properties)
+            print(f"   * Processed {method} in {perf_counter()-tic:.3f}s")
+
+        print(f"\n   * Model built in {perf_counter()-start:.3f}s")
+
+    def _prefetch_fe_parts(self, properties):
+        """
+        Pre-reads the FE data files of all parts concurrently.
+        """
+        file_names = []
+        for values in properties.values():
+            if isinstance(values, list) and len(values) > 0:
+                file_names.append(self.model_dir / values[0])
+            elif isinstance(values, dict) and "file_name" in values:
+                library_path = Path(values.get("library_path", self.model_dir))
+                file_names.append(library_path / values["file_name"])
+
+        for file_name in _prefetch(file_names):
+            print(f"  ** Could not read FE data file {file_name}")
+
+    def _make_triads(self, properties):
+        """
+        Appends triads to the model, those defined by global position in bulk.
+        """
+        names, positions, rotations, tags = [], [], [], []
+        others = {}
+        for key, values in properties.items():
+            triad = None if key.startswith("-") else _triad_position(values)
+            if triad is None:
+                others[key] = values
+            else:
+                names.append(triad[0])
+                positions.append(triad[1])
+                rotations.append(triad[2])
+                tags.append(key)
+
+        if tags:
+            print(f"\t{len(tags)} triads by position")
+            if self.model.make_triads(names, positions, rotations, tags=tags) is None:
+                raise FedemException("Model generation failure.")
+
+        _process(self._make_triad, others)
+
+    def _build_file(self, model_file=None):
+        """
+        Returns the path to the file with checksums of the previous build.
+        """
+        model_file = model_file or self.model_file
+        return model_file[: model_file.rfind(".")] + "_build.json"
+
+    def _incremental(self, model_file):
+        """
+        Reduces the model input to the new object definitions,
+        if the model file exists and was built incrementally before.
+        Returns how to handle the existing model file.
+        """
+        self.digest = _digest(self.model_input)
+        if not path.isfile(model_file) or not path.isfile(self._build_file(model_file)):
+            return "OVERWRITE!"
+
+        with open(self._build_file(model_file)) as build_file:
+            changes = _changes(json_load(build_file), self.digest)
+        if changes is None:
+            print("   * Existing objects have been changed, rebuilding the model")
+            return "OVERWRITE!"
+
+        for section in list(self.model_input):
+            if section in changes:
+                entries = self.model_input[section]
+                self.model_input[section] = {
+                    key: entries[key] for key in changes[section]
+                }
+            else:
+                del self.model_input[section]
+
+        n_changes = sum(len(keys) for keys in changes.values())
+        print(f"   * Updating existing model with {n_changes} new objects")
+        return "USE_IT"
+
     def save(self, save_as=False):
         """
         Saves the model with the defined file name,
@@ -259,6 +558,11 @@ class ModelYAML:
         if not self.model.save(new_name):
             raise FedemException("Failure saving the Fedem model.")
 
+        if self.digest is not None:
+            # Store the checksums for the next incremental build
+            with open(self._build_file(new_name), "w") as build_file:
+                dump(self.digest, build_file, indent=2)
+
     def solve(self):
         """
         Executes the dynamics solver on the created model.
@@ -285,7 +589,7 @@ class ModelYAML:
             # Parse the included file
             yaml_name = path.join(self.model_dir, included_file)
             print("   *", (" " * level), "Parsing included file", yaml_name)
-            submod = load(open(yaml_name), Loader=FullLoader)
+            submod = _load_yaml(yaml_name)
             # Recursively check for sub-models
             submod = _merge(submod, self._include(submod.pop("include", {}), level + 1))
             # Merge the sub-models.
@@ -634,7 +938,7 @@ class ModelYAML:
         return 1
 
 
-def main(input_file, dump_file=None, solve=False):
+def main(input_file, dump_file=None, solve=False, planned=False, incremental=False):
     """
     Main driver.
 
@@ -646,11 +950,18 @@ def main(input_file, dump_file=None, solve=False):
         Absolute path to json-file for dumping the model data dictionary
     solve : bool, default=False
         If True, the dynamics solver is launched on the created model
+    planned : bool, default=False
+        If True, the model is built in dependency order with timing
+    incremental : bool, default=False
+        If True, an existing model is updated with the changes only
     """
 
-    model = ModelYAML(input_file)
+    model = ModelYAML(input_file, incremental)
 
-    model.build(dump_file)
+    if planned:
+        model.build_planned(dump_file)
+    else:
+        model.build(dump_file)
     model.save()
     model.model.close()
 
@@ -663,4 +974,10 @@ if __name__ == "__main__":
     parser.add_argument("-f", "--input-file", required=True, help="YAML input file")
     parser.add_argument("-d", "--dump-file", help="JSON output file for model dump")
     parser.add_argument("-s", "--solve", action="store_true", help="Solves the model")
+    parser.add_argument(
+        "-p", "--planned", action="store_true", help="Builds in dependency order"
+    )
+    parser.add_argument(
+        "-i", "--incremental", action="store_true", help="Updates existing model"
+    )
     main(**vars(parser.parse_args()))
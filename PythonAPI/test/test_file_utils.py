@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Unit tests for the file utilities.
+"""
+
+from os import listdir, mkdir, path
+
+import pytest
+
+from fedempy.file_utils import atomic_output
+
+
+def test_atomic_file(tmp_path):
+    """
+    The target file should only appear when completely written.
+    """
+    target = str(tmp_path / "entry.map")
+    with atomic_output(target) as tmp_file:
+        assert tmp_file.endswith(".map")
+        with open(tmp_file, "w", encoding="utf-8") as fd:
+            fd.write("data")
+        assert not path.exists(target)
+    assert listdir(tmp_path) == ["entry.map"]
+
+    with pytest.raises(RuntimeError):
+        with atomic_output(target) as tmp_file:
+            raise RuntimeError("write failed")
+    assert listdir(tmp_path) == ["entry.map"]
+
+
+def test_atomic_directory(tmp_path):
+    """
+    An existing non-empty target directory should not be replaced.
+    """
+    target = str(tmp_path / "entry")
+    with atomic_output(target, directory=True) as tmp_dir:
+        mkdir(path.join(tmp_dir, "sub"))
+    assert listdir(target) == ["sub"]
+
+    with pytest.raises(OSError):
+        with atomic_output(target, directory=True) as tmp_dir:
+            mkdir(path.join(tmp_dir, "other"))
+    assert listdir(tmp_path) == ["entry"]
+    assert listdir(target) == ["sub"]
@@ -0,0 +1,231 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Unit tests for the inverse solution methods, using a small synthetic system.
+"""
+
+from ctypes import c_int
+
+import pytest
+from numpy import allclose, array, dot, eye, transpose, vstack, zeros
+from numpy.linalg import eigh
+from numpy.random import default_rng
+
+from fedempy.inverse import InverseSolver
+from fedempy.mode_cache import ModeCache
+
+
+class _FakeSolver:
+    """
+    Mimics the FedemSolver interface used by InverseSolver, for a linear system
+    with strain gages and relative distance sensors as linear functions of the
+    displacements.
+    """
+
+    def __init__(self, n_dim, n_eps, n_rel, seed=1):
+        rng = default_rng(seed)
+        a_mat = rng.standard_normal((n_dim, n_dim))
+        self.k_mat = dot(a_mat, a_mat.T) + n_dim * eye(n_dim)  # SPD
+        self.q_vec = rng.standard_normal(n_dim)
+        self.eps_mat = rng.standard_normal((n_eps, n_dim))
+        self.rel_mat = rng.standard_normal((n_rel, n_dim))
+        self.ierr = c_int(0)
+        self.n_stiff = 0
+        self.forces = []
+
+    def get_system_size(self):
+        return self.k_mat.shape[0]
+
+    def get_current_time(self):
+        return 0.0
+
+    def start_step(self):
+        return True
+
+    def finish_step(self):
+        return True
+
+    def get_stiffness_matrix(self):
+        self.n_stiff += 1
+        return self.k_mat, True
+
+    def get_solver_counters(self):
+        return {"steps": 0, "iterations": 0, "updates": self.n_stiff, "reuses": 0}
+
+    def solve_modes(self, n_modes, dof_order=False, use_lapack=0, start_vec=None):
+        e_val, e_vec = eigh(self.k_mat)  # unit mass matrix
+        return list(e_val[:n_modes]), transpose(e_vec[:, :n_modes]).tolist(), True
+
+    def get_external_force_vector(self):
+        return self.q_vec, True
+
+    def add_rhs_vector(self, force):
+        self.forces.append(array(force))
+        return True
+
+    def get_functions(self, out_def):
+        return [0.0] * len(out_def)
+
+    def compute_strains_from_displ(self, u_vec, ids):
+        return list(dot(self.eps_mat, u_vec)), True
+
+    def compute_rel_dist_from_displ(self, u_vec, ids):
+        return list(dot(self.rel_mat, u_vec)), True
+
+    def compute_strains_from_displ_batch(self, disp, ids):
+        return dot(self.eps_mat, disp), True
+
+    def compute_rel_dist_from_displ_batch(self, disp, ids):
+        return dot(self.rel_mat, disp), True
+
+
+def _inverse_solver(solver, x_eqs, f_eqs, n_eps, n_rel):
+    """
+    Returns an inverse solver with displacement, strain and relative distance
+    sensors, bypassing the model lookup of the equation numbers.
+    """
+    inv = InverseSolver(solver, {"internal_equations": {}}, True)
+    inv.internal_equations = {
+        "unknown_f": [{"eqNum": f_eqs}],
+        "known_x": [{"eqNum": x_eqs}],
+        "known_eps": [{"epsID": 1, "strain": "ex"}] * n_eps,
+        "known_relD": [{"relID": 1}] * n_rel,
+    }
+    inv.eq_list_def = [*inv.internal_equations]
+    inv.strain_tensor_list = inv.internal_equations["known_eps"]
+    inv.rel_dist_list = inv.internal_equations["known_relD"]
+    inv.modes = []
+    inv.modes_solver = 0
+    inv.mode_cache = None
+    inv.use_initial_eigen_vec = False
+    return inv
+
+
+def _stacked_sensor_system(solver, x_def, u_vec, inp_data):
+    """
+    Reference implementation of the sensor equation system, assembled by
+    stacking the rows of each sensor type (the previous implementation).
+    """
+    dim, n_col = u_vec.shape
+    rhs = [0.0] * len(inp_data)
+    rhs[:] = inp_data
+    lhs = [[0] * (n_col - 1) for _ in range(1)]
+
+    b_mat = zeros((dim, len(x_def)))
+    for idx, val in enumerate(x_def):
+        b_mat[val, idx] = 1
+    c_val = dot(b_mat.transpose(), u_vec)
+    for k in range(len(x_def)):
+        rhs[k] -= c_val[k][-1]
+    lhs = vstack([lhs, c_val[:, :-1]])
+    pos = len(x_def)
+
+    for method in (
+        solver.compute_strains_from_displ,
+        solver.compute_rel_dist_from_displ,
+    ):
+        n_row = len(method(u_vec[:, 0], [])[0])
+        lh = zeros((n_row, n_col - 1))
+        for j in range(n_col - 1):
+            lh[:, j] = method(u_vec[:, j], [])[0]
+        c_val = method(u_vec[:, -1], [])[0]
+        for k in range(n_row):
+            rhs[pos + k] -= c_val[k]
+        lhs = vstack([lhs, lh])
+        pos += n_row
+
+    return lhs[1:], array(rhs)
+
+
+def test_sensor_system():
+    """
+    The preallocated sensor equation system should equal the stacked one.
+    """
+    solver = _FakeSolver(8, 3, 2)
+    inv = _inverse_solver(solver, [1, 4, 6], [2, 7], 3, 2)
+    x_def = [0, 3, 5]
+    u_vec = default_rng(2).standard_normal((8, 3))
+    inp_data = default_rng(3).standard_normal(8)
+
+    rhs = array(inp_data)
+    lhs = zeros((len(rhs), u_vec.shape[1] - 1))
+    pos = inv._inverse_disp_sensor(x_def, u_vec, lhs, rhs, 0)
+    pos = inv._inverse_strain_sensor(u_vec, lhs, rhs, pos)
+    pos = inv._inverse_rel_dist_sensor(u_vec, lhs, rhs, pos)
+    assert pos == len(rhs)
+
+    ref_lhs, ref_rhs = _stacked_sensor_system(solver, x_def, u_vec, inp_data)
+    assert allclose(lhs, ref_lhs)
+    assert allclose(rhs, ref_rhs)
+
+
+def test_sensor_dimension():
+    """
+    The number of measurements should match the number of sensor equations.
+    """
+    solver = _FakeSolver(8, 3, 2)
+    inv = _inverse_solver(solver, [1, 4, 6], [2, 7], 3, 2)
+    with pytest.raises(ValueError, match="dimension"):
+        inv.run_inverse(default_rng(3).standard_normal(9), [])
+    assert not solver.forces
+
+
+def test_influence_matrix():
+    """
+    The precomputed influence matrix should give the same RHS forces
+    as the direct solution, without assembling the system in later steps.
+    """
+    n_dim, n_eps, n_rel = 8, 3, 2
+    x_eqs, f_eqs = [1, 4, 6], [2, 5, 7]
+    inp_data = default_rng(4).standard_normal((3, len(x_eqs) + n_eps + n_rel))
+
+    solver = _FakeSolver(n_dim, n_eps, n_rel)
+    inv = _inverse_solver(solver, x_eqs, f_eqs, n_eps, n_rel)
+    for data in inp_data:
+        inv.run_inverse(data, [])
+    direct = solver.forces
+    assert solver.n_stiff == len(inp_data)
+
+    solver = _FakeSolver(n_dim, n_eps, n_rel)
+    inv = _inverse_solver(solver, x_eqs, f_eqs, n_eps, n_rel)
+    inv.compile_inverse()
+    for data in inp_data:
+        inv.run_inverse(data, [])
+    assert solver.n_stiff == 1  # the system is assembled in the first step only
+    assert len(solver.forces) == len(direct) == len(inp_data)
+    for force, ref_force in zip(solver.forces, direct):
+        assert allclose(force, ref_force)
+
+
+def test_influence_rebuild():
+    """
+    A rebuilt influence matrix should reflect a changed stiffness, also for the
+    modal forces, instead of reusing the force matrix and cached eigenmodes.
+    """
+    n_dim, n_eps, n_rel = 8, 3, 2
+    x_eqs, f_eqs = [1, 4, 6], [2, 7]
+    inp_data = default_rng(5).standard_normal((2, len(x_eqs) + n_eps + n_rel))
+
+    def __inverse_solver(solver):
+        inv = _inverse_solver(solver, x_eqs, f_eqs, n_eps, n_rel)
+        inv.modes = [1, 2]
+        inv.mode_cache = ModeCache()
+        inv.compile_inverse()
+        return inv
+
+    solver = _FakeSolver(n_dim, n_eps, n_rel)
+    inv = __inverse_solver(solver)
+    inv.run_inverse(inp_data[0], [])
+    solver.k_mat[0, 0] *= 2.0
+    inv.compile_inverse()
+    inv.run_inverse(inp_data[1], [])
+    assert solver.n_stiff == 2
+
+    ref_solver = _FakeSolver(n_dim, n_eps, n_rel)
+    ref_solver.k_mat[0, 0] *= 2.0
+    __inverse_solver(ref_solver).run_inverse(inp_data[1], [])
+    assert allclose(solver.forces[-1], ref_solver.forces[-1])
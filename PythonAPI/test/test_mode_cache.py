@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Unit tests for the eigenmode cache.
+"""
+
+from os import listdir
+
+from ctypes import c_int
+
+import pytest
+from numpy import allclose, diag, eye, pi, sqrt, transpose
+from numpy.linalg import eigh
+
+from fedempy.inverse import InverseSolver
+from fedempy.mode_cache import ModeCache
+
+
+def _spring_chain(n_dof, stiff=1.0):
+    """
+    Returns the stiffness and mass matrices of a fixed-free spring chain.
+    """
+    k_mat = diag([2.0 * stiff] * n_dof)
+    k_mat[-1, -1] = stiff
+    for i in range(n_dof - 1):
+        k_mat[i, i + 1] = k_mat[i + 1, i] = -stiff
+    return k_mat, eye(n_dof)
+
+
+def _eigen_modes(k_mat, n_modes):
+    """
+    Returns the lowest eigenfrequencies and eigenvectors (unit mass matrix).
+    """
+    e_val, e_vec = eigh(k_mat)
+    return sqrt(e_val[:n_modes]) * 0.5 / pi, transpose(e_vec[:, :n_modes])
+
+
+class _FakeSolver:
+    """
+    Mimics the eigenvalue solver interface of FedemSolver for a spring chain.
+    """
+
+    def __init__(self, n_dof):
+        self.k_mat = _spring_chain(n_dof)[0]
+        self.ierr = c_int(0)
+        self.time = 0.0
+        self.updates = 1
+        self.start_vec = []
+
+    def get_current_time(self):
+        return self.time
+
+    def get_system_size(self):
+        return self.k_mat.shape[0]
+
+    def get_solver_counters(self):
+        return {"steps": 0, "iterations": 0, "updates": self.updates, "reuses": 0}
+
+    def solve_modes(self, n_modes, dof_order=False, use_lapack=0, start_vec=None):
+        self.start_vec.append(start_vec)
+        e_val, e_vec = _eigen_modes(self.k_mat, n_modes)
+        return list(e_val), e_vec.tolist(), True
+
+
+def test_store_and_fetch(tmp_path):
+    """
+    Eigenmodes stored in one run should be found by another.
+    """
+    e_val, e_vec = _eigen_modes(_spring_chain(6)[0], 3)
+
+    cache = ModeCache(str(tmp_path), model_key="chain")
+    key = cache.checksum(0.1, "3:0")
+    assert key != cache.checksum(0.1, "4:0")
+    assert key == cache.checksum(0.2, "3:0")  # not time-varying
+    assert key != ModeCache(model_key="other").checksum(0.1, "3:0")
+    assert cache.fetch(key) == (None, None)
+    assert cache.store(key, e_val, e_vec)
+    assert not cache.store(key, e_val, e_vec)  # already present
+    assert listdir(tmp_path) == [key + ".npz"]
+
+    f_val, f_vec = ModeCache(str(tmp_path), model_key="chain").fetch(key)
+    assert allclose(f_val, e_val)
+    assert allclose(f_vec, e_vec)
+
+
+def test_model_key(tmp_path):
+    """
+    A persistent cache should require a model fingerprint.
+    """
+    with pytest.raises(ValueError, match="model_key"):
+        ModeCache(str(tmp_path))
+
+    model_file = tmp_path / "chain.fmm"
+    model_file.write_text("Spring chain")
+    key = ModeCache.fingerprint(str(model_file))
+    assert key == ModeCache.fingerprint(str(model_file))
+    assert ModeCache.fingerprint(str(tmp_path / "none.fmm")) is None
+    model_file.write_text("Modified spring chain")
+    assert key != ModeCache.fingerprint(str(model_file))
+
+
+def test_unchanged_system():
+    """
+    The most recent eigenmodes should be reused while the system is unchanged.
+    """
+    e_val, e_vec = _eigen_modes(_spring_chain(6)[0], 3)
+
+    cache = ModeCache(time_varying=True)
+    assert cache.checksum(0.1, "3:0") != cache.checksum(0.2, "3:0")
+    key = cache.checksum(0.1, "3:0", 5)
+    cache.store(key, e_val, e_vec, 5)
+    assert cache.checksum(0.2, "3:0", 5) == key
+    assert cache.checksum(0.2, "3:0", 6) != key
+    f_val, f_vec = cache.fetch(key)
+    assert allclose(f_val, e_val)
+    assert allclose(f_vec, e_vec)
+
+
+def test_start_vectors():
+    """
+    The most recent eigenvectors should be the starting vectors, if incremental.
+    """
+    e_val, e_vec = _eigen_modes(_spring_chain(6)[0], 3)
+
+    cache = ModeCache(incremental=True)
+    assert cache.start_vectors(6) is None  # nothing stored yet
+    cache.store(None, e_val, e_vec)
+    assert allclose(cache.start_vectors(6), e_vec)
+    assert cache.start_vectors(7) is None  # system size changed
+
+    cache = ModeCache()
+    cache.store(None, e_val, e_vec)
+    assert cache.start_vectors(6) is None  # not incremental
+
+
+def test_mode_load():
+    """
+    The eigensolver should be warm-started, and skipped for cached eigenmodes.
+    """
+    solver = _FakeSolver(8)
+    cache = ModeCache(incremental=True, time_varying=True)
+    f_vec = InverseSolver._mode_load(solver, [1, 3], 0, mode_cache=cache)
+    e_vec = _eigen_modes(solver.k_mat, 3)[1]
+    assert allclose(transpose(f_vec), e_vec[[0, 2]])
+    assert solver.start_vec == [None]
+
+    solver.time = 0.1  # system unchanged, no new eigenvalue solution
+    InverseSolver._mode_load(solver, [1, 3], 0, mode_cache=cache)
+    assert len(solver.start_vec) == 1
+
+    solver.time = 0.2  # system changed, start from the previous eigenvectors
+    solver.updates += 1
+    solver.k_mat[0, 0] *= 1.05
+    f_vec = InverseSolver._mode_load(solver, [1, 3], 0, mode_cache=cache)
+    e_vec = _eigen_modes(solver.k_mat, 3)[1]
+    assert allclose(transpose(f_vec), e_vec[[0, 2]])
+    assert len(solver.start_vec) == 2
+    assert solver.start_vec[1] is not None
+
+
+def test_invalidate(tmp_path):
+    """
+    Invalidated eigenmodes should neither be fetched nor persisted.
+    """
+    e_val, e_vec = _eigen_modes(_spring_chain(6)[0], 3)
+
+    cache = ModeCache(str(tmp_path), model_key="chain")
+    key = cache.checksum(0.1, "3:0")
+    cache.store(key, e_val, e_vec)
+    cache.invalidate()
+    assert cache.fetch(key) == (None, None)
+    assert not cache.store(cache.checksum(0.1, "4:0"), e_val, e_vec)
+    assert listdir(tmp_path) == [key + ".npz"]
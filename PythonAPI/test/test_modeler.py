@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Unit tests for the bulk object creation methods of the modeler,
+using a fake native modeler library.
+"""
+
+import pytest
+
+from fedempy.modeler import FedemModeler
+
+
+class _FakeLib:
+    """
+    Mimics the native modeler functions used by the bulk creation methods.
+    """
+
+    def __init__(self):
+        self.triads = []
+        self.beams = []
+        self.tags = {}
+
+    def FmCreateTriad(self, name, x, y, z, rx, ry, rz, part):
+        self.triads.append((name, [x, y, z], [rx, ry, rz]))
+        return len(self.triads)
+
+    def FmCreateBeam(self, name, triad1, triad2, bprop):
+        self.beams.append((name, triad1, triad2))
+        return 100 + len(self.beams)
+
+    def FmTagObjects(self, base_ids, num_obj, tag):
+        self.tags.setdefault(tag.value.decode(), []).extend(base_ids)
+        return num_obj.value
+
+
+def _modeler():
+    """
+    Returns a modeler instance using the fake library.
+    """
+    model = FedemModeler.__new__(FedemModeler)
+    model._fmlib = _FakeLib()
+    model._FedemModel__opened = True
+    return model
+
+
+def test_make_triads():
+    """
+    Triads should be created at the given positions and tagged by group.
+    """
+    model = _modeler()
+    positions = [[0, 0, 0], [1, 0, 0], [2, 0, 0]]
+    rotations = [[0, 0, 0], [0, 0, 1.5], [0, 0, 0]]
+    base_ids = model.make_triads("T", positions, rotations, tags=["a", None, "a"])
+    assert base_ids == [1, 2, 3]
+    assert [triad[0] for triad in model._fmlib.triads] == [b"T"] * 3
+    assert [triad[1] for triad in model._fmlib.triads] == positions
+    assert [triad[2] for triad in model._fmlib.triads] == rotations
+    assert model._fmlib.tags == {"a": [1, 3]}
+
+    base_ids = model.make_triads(["T4", "T5"], [3, 0, 0, 4, 0, 0], tags="b")
+    assert base_ids == [4, 5]
+    assert model._fmlib.triads[3] == (b"T4", [3.0, 0.0, 0.0], [0.0, 0.0, 0.0])
+    assert model._fmlib.tags["b"] == [4, 5]
+
+
+def test_make_triads_mismatch():
+    """
+    Inconsistent argument lengths should raise before any triad is created.
+    """
+    model = _modeler()
+    positions = [[0, 0, 0], [1, 0, 0]]
+    with pytest.raises(ValueError, match="rotations"):
+        model.make_triads("T", positions, [[0, 0, 0]])
+    with pytest.raises(ValueError, match="names"):
+        model.make_triads(["T1"], positions)
+    with pytest.raises(ValueError, match="tags"):
+        model.make_triads("T", positions, tags=["a", "b", "c"])
+    assert not model._fmlib.triads
+
+
+def test_make_beams():
+    """
+    Beams should be created between the given triad pairs.
+    """
+    model = _modeler()
+    base_ids = model.make_beams("B", [(1, 2), (2, 3)], tags=["b1", "b2"])
+    assert base_ids == [101, 102]
+    assert model._fmlib.beams == [(b"B", 1, 2), (b"B", 2, 3)]
+    assert model._fmlib.tags == {"b1": [101], "b2": [102]}
+
+
+def test_make_beams_mismatch():
+    """
+    Invalid triad pairs or tags should raise before any beam is created.
+    """
+    model = _modeler()
+    with pytest.raises(ValueError, match="pair"):
+        model.make_beams("B", [(1, 2), (2, 3, 4)])
+    with pytest.raises(ValueError, match="tags"):
+        model.make_beams("B", [(1, 2), (2, 3)], tags=["b1"])
+    assert not model._fmlib.beams
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Unit tests for the reduced FE part cache.
+"""
+
+from os import listdir, path, utime
+
+from fedempy.reduction_cache import ReductionCache
+
+
+def _make_part(dir_name, fem_data, options):
+    """
+    Creates an FE data file and a reducer working directory with option file.
+    """
+    rdbdir = dir_name / "rdb"
+    rdbdir.mkdir()
+    fem_file = dir_name / "part.nas"
+    fem_file.write_text(fem_data)
+    (rdbdir / "fedem_reducer.fco").write_text(options)
+    return str(fem_file), str(rdbdir)
+
+
+def test_checksum(tmp_path):
+    """
+    The cache key should not depend on file locations nor the res-file.
+    """
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    opts_a = '-linkfile "/models/a/part.ftl"\n-resfile "a.res"\n-neval 4\n'
+    opts_b = '-linkfile "/models/b/part.ftl"\n-resfile "b.res"\n-neval 4\n'
+    key_a = ReductionCache.checksum(*_make_part(tmp_path / "a", "GRID", opts_a))
+    key_b = ReductionCache.checksum(*_make_part(tmp_path / "b", "GRID", opts_b))
+    assert key_a == key_b
+
+    (tmp_path / "c").mkdir()
+    opts_c = '-linkfile "/models/c/part.ftl"\n-neval 8\n'
+    key_c = ReductionCache.checksum(*_make_part(tmp_path / "c", "GRID", opts_c))
+    assert key_a != key_c
+
+
+def test_checksum_link_file(tmp_path):
+    """
+    The cache key should depend on the content of the link file in rdbdir,
+    i.e., on which nodes the FE part is attached to in the model.
+    """
+    keys = []
+    for model, status in (("a", "1 0 1"), ("b", "1 1 0"), ("c", "1 0 1")):
+        (tmp_path / model).mkdir()
+        opts = f'-linkfile "{tmp_path / model / "rdb" / "part.ftl"}"\n'
+        fem_file, rdbdir = _make_part(tmp_path / model, "GRID", opts)
+        (tmp_path / model / "rdb" / "part.ftl").write_text(f"EXTERNAL {status}\n")
+        keys.append(ReductionCache.checksum(fem_file, rdbdir))
+
+    assert keys[0] != keys[1]
+    assert keys[0] == keys[2]
+
+
+def test_store_and_fetch(tmp_path):
+    """
+    Reduced files stored from one model should be copied into another.
+    """
+    cache = ReductionCache(str(tmp_path / "cache"))
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "c").mkdir()
+    fem_file, rdb_a = _make_part(tmp_path / "a", "GRID", "-neval 4\n")
+    key = cache.checksum(fem_file, rdb_a)
+    assert not cache.fetch(key, rdb_a)
+
+    inputs = listdir(rdb_a)
+    with open(path.join(rdb_a, "part_S.fmx"), "w") as fd:
+        fd.write("stiffness")
+    assert cache.store(key, rdb_a, inputs)
+
+    rdb_b = _make_part(tmp_path / "b", "GRID", "-neval 4\n")[1]
+    assert cache.fetch(key, rdb_b)
+    with open(path.join(rdb_b, "part_S.fmx"), "r") as fd:
+        assert fd.read() == "stiffness"
+    assert sorted(listdir(rdb_b)) == ["fedem_reducer.fco", "part_S.fmx"]
+
+    # Overwriting the fetched file should not affect the cache entry
+    with open(path.join(rdb_b, "part_S.fmx"), "w") as fd:
+        fd.write("modified")
+    rdb_c = _make_part(tmp_path / "c", "GRID", "-neval 4\n")[1]
+    assert cache.fetch(key, rdb_c)
+    with open(path.join(rdb_c, "part_S.fmx"), "r") as fd:
+        assert fd.read() == "stiffness"
+
+
+def test_evict(tmp_path):
+    """
+    The least recently used entries should be evicted first.
+    """
+    cache = ReductionCache(str(tmp_path / "cache"), 2.5 / 1048576)  # 2.5 bytes
+    rdbdir = tmp_path / "rdb"
+    rdbdir.mkdir()
+    (rdbdir / "part_S.fmx").write_text("K")
+    for key in ("k1", "k2"):
+        assert cache.store(key, str(rdbdir))
+        utime(tmp_path / "cache" / key, (1.0, 1.0) if key == "k1" else (2.0, 2.0))
+
+    assert cache.fetch("k1", str(rdbdir))  # k1 is now the most recent
+    assert cache.store("k3", str(rdbdir))  # this should evict k2
+    assert sorted(listdir(tmp_path / "cache")) == ["k1", "k3"]
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Unit tests for the solver input parsing used by the function tag index.
+"""
+
+from fedempy.solver import _engine_tags, _fsi_file, _option_value
+
+FSI = """
+&ENGINE
+  id = 10
+  extId = 1
+  tag = 'Load'
+/
+&TRIAD
+  id = 11
+  tag = 'NotAFunction'
+/
+&ENGINE
+  id = 12
+  extId = 2
+/
+&ENGINE
+  id = 13
+  extId = 3
+  tag = "Output 1"
+/
+"""
+
+
+def test_engine_tags():
+    """
+    Only the tagged general functions should be extracted.
+    """
+    assert _engine_tags(FSI) == ["Load", "Output 1"]
+
+
+def test_option_value():
+    """
+    Both option formats should be recognized, the last one taking precedence.
+    """
+    options = ["fedem_solver", "-fsifile", "a.fsi", "-terminal", "-1"]
+    assert _option_value(options, "fsifile") == "a.fsi"
+    assert _option_value(options + ["-fsifile=b.fsi"], "fsifile") == "b.fsi"
+    assert _option_value(options, "fco") is None
+
+
+def test_fsi_file(tmp_path, monkeypatch):
+    """
+    The solver input file may be specified in an option file.
+    """
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "fedem_solver.fco").write_text('-fsifile "model.fsi"\n')
+    assert _fsi_file(["-fco", "fedem_solver.fco"]) == str(tmp_path / "model.fsi")
+    assert _fsi_file([]) == str(tmp_path / "fedem_solver.fsi")
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Unit tests for the sub-model operator utilities.
+"""
+
+from multiprocessing import Pipe
+from os import utime
+from subprocess import CompletedProcess
+
+import numpy as np
+import pytest
+
+from fedempy.dts_operators import submodel
+from fedempy.dts_operators.submodel import _mapping_key, _read_mapping
+from fedempy.dts_operators.submodel import _send_to_worker
+
+
+def test_mapping_key(tmp_path):
+    """
+    The mapping cache key should depend on the search options and the content
+    of the files they refer to, but not on the output options.
+    """
+    (tmp_path / "global.ftl").write_text("NODE{1 0.0 0.0 0.0}\n")
+    (tmp_path / "nodes.txt").write_text("1 1 0.0 0.0 0.0\n")
+    opt_file = tmp_path / "fedem_solmap.fco"
+    opt_file.write_text('-ftlFile = "global.ftl"\n-nodeFile = "nodes.txt"\n')
+    key = _mapping_key(str(opt_file))
+    assert len(key) == 64
+
+    opt_file.write_text(opt_file.read_text() + "-debug = 1\n# comment\n")
+    assert _mapping_key(str(opt_file)) == key
+
+    opt_file.write_text(opt_file.read_text() + "-nodeTol = 0.01\n")
+    new_key = _mapping_key(str(opt_file))
+    assert new_key != key
+
+    # Same size, but modified content of the global FE model
+    (tmp_path / "global.ftl").write_text("NODE{1 1.0 0.0 0.0}\n")
+    utime(tmp_path / "global.ftl", ns=(1, 1))
+    assert _mapping_key(str(opt_file)) not in (key, new_key)
+
+
+def test_run_solmap_options(tmp_path, monkeypatch):
+    """
+    The result extraction options of fedem_solmap.fco should be passed on
+    also when the nodal mapping is read from a precomputed map-file.
+    """
+    commands = []
+    monkeypatch.setenv("FEDEM_SOLVER", str(tmp_path / "fedem_solver"))
+
+    def run(args, **kwargs):
+        commands.append(args)
+        return CompletedProcess(args, 0, b"", b"")
+
+    monkeypatch.setattr(submodel, "run", run)
+    (tmp_path / "sub.map").write_bytes(b"")
+    (tmp_path / "fedem_solmap.fco").write_text("-partId = 3\n-rotations\n")
+    submodel._run_solmap(str(tmp_path), "glob.frs", "sub.fnd", str(tmp_path))
+    assert "-mapFile=" + str(tmp_path / "sub.map") in commands[0]
+    assert "-partId=3" in commands[0]
+    assert "-rotations" in commands[0]
+
+
+def test_read_mapping(tmp_path):
+    """
+    The nodal mapping file should give the same interpolation as fedem_solmap,
+    including the transformation to the local system of the sub-model.
+    """
+    t_lg = np.array([[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    map_file = tmp_path / "sub.map"
+    with open(map_file, "wb") as fd:
+        fd.write(b"#FEDEM nodal mapping\x01\x00\x00\x00\x12\x34\x56\x78")
+        fd.write(b";7.9;2;\n")
+        fd.write(t_lg.T.tobytes())  # Written column-wise
+        fd.write(np.array([1, 11, 5, 2, 3, 4], np.int32).tobytes())
+        fd.write(np.array([0.5, 0.0, 0.0, 0.25, 0.75]).tobytes())
+        fd.write(np.array([1, 12, -1, 1, 7], np.int32).tobytes())
+
+    sub_nodes, glob_nodes, weights, tlg = _read_mapping(str(map_file))
+    assert sub_nodes.tolist() == [11, 12]
+    assert glob_nodes.tolist() == [3, 4, 7]
+    assert np.allclose(weights, [[0.25, 0.75, 0.0], [0.0, 0.0, 1.0]])
+    assert np.allclose(tlg, t_lg)
+
+    disp = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 2.0]])
+    sub_disp = (weights @ disp) @ tlg
+    assert np.allclose(sub_disp[0], t_lg.T @ [0.25, 0.75, 0.0])
+    assert np.allclose(sub_disp[1], [0.0, 0.0, 2.0])
+
+
+def test_send_to_failed_worker():
+    """
+    The exception of a failed sub-model worker should be raised in the parent
+    process, instead of a broken pipe error on the next send.
+    """
+    conn, child_conn = Pipe()
+    _send_to_worker(conn, (np.arange(2), np.zeros((2, 3))))
+    assert child_conn.recv()[0].tolist() == [0, 1]
+
+    child_conn.send(ValueError("Singular matrix in sub-model"))
+    child_conn.close()
+    with pytest.raises(ValueError, match="Singular matrix"):
+        _send_to_worker(conn, (np.arange(2), np.zeros((2, 3))))
+
+    conn, child_conn = Pipe()
+    child_conn.close()
+    with pytest.raises(RuntimeError, match="terminated unexpectedly"):
+        _send_to_worker(conn, (np.arange(2), np.zeros((2, 3))))
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Unit tests for the NumPy-based fmx-file reader.
+"""
+
+from numpy import arange, array_equal, float32, float64
+
+from fedempy.write_fmx import read_array, read_blocks
+
+
+def _write_fmx(prefix, tag, data):
+    """
+    Writes an fmx-file with a header similar to that of the native writer.
+    """
+    with open(str(prefix) + "_S.fmx", "wb") as fd:
+        fd.write(b"#FEDEM " + tag + b"\x1a\x01\x00\x00\x00\x00;1.0;\n")
+        data.ravel(order="F").tofile(fd)
+
+
+def test_read_array(tmp_path):
+    """
+    The matrix should be returned column-wise, both mapped and in core.
+    """
+    matrix = arange(12.0, dtype=float64).reshape((4, 3), order="F")
+    _write_fmx(tmp_path / "part", b"stiffness matrix", matrix)
+    for mmap in (True, False):
+        data = read_array(str(tmp_path / "part"), 1, 4, mmap)
+        assert data.flags.f_contiguous
+        assert array_equal(data, matrix)
+
+    square = arange(9.0, dtype=float32).reshape((3, 3), order="F")
+    _write_fmx(tmp_path / "sp", b"stiffness matrix SP", square)
+    data = read_array(str(tmp_path / "sp").encode(), 1)
+    assert data.dtype == float32
+    assert array_equal(data, square)
+
+
+def test_read_blocks(tmp_path):
+    """
+    The column blocks should add up to the whole matrix.
+    """
+    matrix = arange(20.0).reshape((4, 5), order="F")
+    _write_fmx(tmp_path / "part", b"stiffness matrix", matrix)
+    blocks = list(read_blocks(str(tmp_path / "part"), 1, 4, 2))
+    assert [icol for icol, _ in blocks] == [0, 2, 4]
+    for icol, block in blocks:
+        assert array_equal(block, matrix[:, icol : icol + 2])
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2023 SAP SE
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+# This file is part of FEDEM - https://openfedem.org
+
+"""
+Unit tests for the YAML model build planner.
+"""
+
+from os import utime
+
+import pytest
+
+from fedempy.solver import FedemException
+from fedempy.yaml_parser import (
+    ModelYAML,
+    _changes,
+    _digest,
+    _load_yaml,
+    _plan,
+    _prefetch,
+    _triad_position,
+)
+
+
+def test_plan():
+    """
+    Keywords should be processed after the keywords they depend on.
+    """
+    keywords = ["edit_triads", "beams", "beam_sections", "triads", "beam_materials"]
+    assert _plan(keywords) == [
+        "triads",
+        "beam_materials",
+        "beam_sections",
+        "beams",
+        "edit_triads",
+    ]
+    assert _plan(["virtual_sensors", "functions", "fe_parts"]) == [
+        "functions",
+        "fe_parts",
+        "virtual_sensors",
+    ]
+
+
+def test_prefetch(tmp_path):
+    """
+    Files that can not be read should be reported.
+    """
+    (tmp_path / "part.nas").write_text("GRID")
+    missing = str(tmp_path / "missing.nas")
+    assert _prefetch([str(tmp_path / "part.nas"), missing]) == [missing]
+
+
+def test_triad_position():
+    """
+    Only triads defined by global position should be created in bulk.
+    """
+    assert _triad_position(["T1", [1, 2, 3]]) == ("T1", [1, 2, 3], [0.0, 0.0, 0.0])
+    assert _triad_position([[1, 2, 3], [0, 0, 1]]) == ("", [1, 2, 3], [0, 0, 1])
+    assert _triad_position({"name": "T2", "pos": [1, 2, 3]})[0] == "T2"
+    assert _triad_position(["Part1", "node", 5]) is None
+    assert _triad_position({"name": "T3", "node": 5, "on_part": "Part1"}) is None
+
+
+def test_load_yaml(tmp_path):
+    """
+    Included files should be parsed again only when modified.
+    """
+    yaml_file = tmp_path / "sub.yaml"
+    yaml_file.write_text("triads:\n  T1: [0, 0, 0]\n")
+    data = _load_yaml(str(yaml_file))
+    data["triads"]["T1"].pop()  # the cached data should not be affected
+    assert _load_yaml(str(yaml_file)) == {"triads": {"T1": [0, 0, 0]}}
+
+    yaml_file.write_text("triads:\n  T1: [1, 0, 0]\n")
+    utime(yaml_file, ns=(0, 0))  # ensure a new modification time
+    assert _load_yaml(str(yaml_file)) == {"triads": {"T1": [1, 0, 0]}}
+
+
+def test_changes():
+    """
+    Only new objects and edits can be applied incrementally.
+    """
+    old = _digest({"triads": {"T1": [0, 0, 0]}, "edit_triads": {"T1": {"x": 1}}})
+    new = _digest(
+        {
+            "triads": {"T1": [0, 0, 0], "T2": [1, 0, 0]},
+            "edit_triads": {"T1": {"x": 1}, "T2": {"x": 3}},
+        }
+    )
+    assert _changes(old, new) == {"triads": ["T2"], "edit_triads": ["T2"]}
+    new = _digest({"triads": {"T1": [0, 0, 0]}, "edit_triads": {"T1": {"x": 2}}})
+    assert _changes(old, new) is None
+    assert _changes(old, _digest({"triads": {"T1": [0, 0, 0]}})) is None
+    assert _changes(old, _digest({"triads": {"T1": [0, 1, 0]}})) is None
+    assert _changes(old, _digest({"triads": {}})) is None
+
+
+def test_incremental_file_exists(tmp_path):
+    """
+    An explicit file_exists value should not be combined with incremental builds.
+    """
+    yaml_file = tmp_path / "model.yaml"
+    yaml_file.write_text("file_exists: STOP!\ntriads:\n  T1: [0, 0, 0]\n")
+    with pytest.raises(FedemException, match="incremental"):
+        ModelYAML(str(yaml_file), incremental=True)
+
+
+def test_incremental_amend(tmp_path):
+    """
+    An existing model file should not be amended in incremental builds,
+    since the source file then is the target file itself.
+    """
+    model_file = str(tmp_path / "model.fmm")
+    yaml_file = tmp_path / "model.yaml"
+    yaml_file.write_text(
+        f"source_file: {model_file}\ntarget_file: {model_file}\n"
+        "triads:\n  T1: [0, 0, 0]\n"
+    )
+    with pytest.raises(FedemException, match="incremental"):
+        ModelYAML(str(yaml_file), incremental=True)
@@ -12,7 +12,8 @@
 !> @brief Module with support for prescribed motions from file.
 !> @details This module contains an array with prescribed displacement values
 !> which are read from a binary file. Subroutines for opening and reading this
-!> file is also provided.
+!> file is also provided. Alternatively, the prescribed displacement values
+!> may be assigned directly from core, without going through a file.
 !>
 !> @author Knut Morten Okstad
 !> @date 8 Apr 2020
@@ -23,6 +24,9 @@ module PrescribedMotionModule
 
   implicit none
 
+  !> @brief Value of pDisFile when the prescribed motions are assigned in core
+  integer , parameter :: inCore_p = -22222
+
   integer , save :: pDisFile = -11111 !< File handle for prescribed motion file
   real(dp), save :: nextTime = 0.0_dp !< Time for next update from file
 
@@ -141,7 +145,13 @@ contains
     ierr = 0
     lerr = 0
     notice = .false.
-    if (pDisFile >= 0 .and. allocated(pDispl)) then
+    if (pDisFile == inCore_p .and. allocated(pDispl)) then
+       !! The prescribed displacements have been assigned in core,
+       !! use them in the current step and wait for the next assignment
+       ierr = size(pDispl)
+       nextTime = huge(nextTime)
+       return
+    else if (pDisFile >= 0 .and. allocated(pDispl)) then
        if (present(lpu)) notice = lpu > 0
        if (notice) then
           call reportError (note_p,'Update prescribed displacements from file')
@@ -176,4 +186,51 @@ contains
 
   end subroutine ReadMotionFile
 
+
+  !!============================================================================
+  !> @brief Assigns prescribed displacements for next time step from core.
+  !>
+  !> @param[in] values Prescribed displacement values
+  !> @param[out] ierr Error flag
+  !>
+  !> @details The values are picked up by the next invocation of
+  !> ReadMotionFile, instead of reading them from a binary file.
+  !> Any prescribed motion file opened previously is then closed.
+  !>
+  !> @callgraph @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine SetMotionValues (values,ierr)
+
+    use BinaryDBInterface, only : closeBinaryDB
+    use ReportErrorModule, only : AllocationError
+
+    real(dp), intent(in)  :: values(:)
+    integer , intent(out) :: ierr
+
+    !! --- Logic section ---
+
+    ierr = 0
+    if (pDisFile >= 0) call closeBinaryDB (pDisFile,ierr)
+
+    if (allocated(pDispl)) then
+       if (size(pDispl) /= size(values)) deallocate(pDispl)
+    end if
+    if (.not. allocated(pDispl)) then
+       allocate(pDispl(size(values)),STAT=ierr)
+       if (ierr /= 0) then
+          ierr = AllocationError('SetMotionValues')
+          return
+       end if
+    end if
+
+    pDispl = values
+    pDisFile = inCore_p
+    nextTime = -huge(nextTime)
+
+  end subroutine SetMotionValues
+
 end module PrescribedMotionModule
@@ -496,8 +496,12 @@ contains
   !> @param[in] NRHS Number of right-hand-side vectors
   !> @param[in] LPU File unit number for res-file output
   !> @param[out] IERR Error flag
+  !> @param[in] nThreads Number of threads to use in the mass matrix projection
   !>
   !> @details CMS : "Component Mode Synthesis".
+  !> If @a nThreads differs from 1 and the whole B-matrix fits in core,
+  !> the dot products of the mass matrix projection B'*Mii*B are computed
+  !> concurrently by OpenMP threads. Otherwise, they are computed serially.
   !>
   !> @callgraph @callergraph
   !>
@@ -510,7 +514,7 @@ contains
   subroutine CMSTRS (iopSing, sam, bmatDisk, &
        &             SMII, SMIE, SMEE, SMMAT, SKII, SKEE, SKMAT, &
        &             PHI, fullRHS, RHS, VGI, tolFactorize, &
-       &             iStiff, NGEN, NRHS, LPU, IERR)
+       &             iStiff, NGEN, NRHS, LPU, IERR, nThreads)
 
     use sprKindModule      , only : ik, nbik_p
     use KindModule         , only : dp, i8, nbd_p
@@ -519,7 +523,7 @@ contains
     use DiskMatrixModule   , only : DiskMatrixType
     use SparseMatrixModule , only : SparseMatrixType
     use SysMatrixTypeModule, only : restoreSysMat
-    use DiskMatrixModule   , only : dmWrite, dmSetReadOnly, dmGetColPtr
+    use DiskMatrixModule   , only : dmWrite, dmSetReadOnly, dmGetColPtr, dmSize
     use SparseMatrixModule , only : smWrite, smSize, smMatTransTimesVec
     use SolExtensionModule , only : csSolveSupEl, csSolve
     use MatExtensionModule , only : csPremult, csTransform
@@ -543,16 +547,18 @@ contains
     real(dp)              , intent(out)   :: SMMAT(:,:), SKMAT(:,:)
     real(dp)              , intent(out)   :: RHS(:,:), VGI(:,:)
     integer               , intent(out)   :: IERR
+    integer, optional     , intent(in)    :: nThreads
 
     !! Local variables
-    integer                  :: i, j, NDOF1, NDOF2, NEQ1
+    logical                  :: useThreads
+    integer                  :: i, j, jerr, NDOF1, NDOF2, NEQ1
     integer(i8)              :: nStiff
     integer(ik), allocatable :: meqErr(:)
     real(dp)                 :: dummy(1,1)
     real(dp),    allocatable :: SM11(:,:), SM12(:,:), SM22(:,:)
     real(dp),    allocatable :: SK11(:,:), SK22(:,:)
     real(dp),    allocatable :: RHS1(:,:), RHS2(:,:), gFull(:,:)
-    real(dp),    allocatable :: vec_ndof2(:), vec2_neq(:)
+    real(dp),    allocatable :: vec_ndof2(:), vec2_neq(:), vec2_ndof1(:)
     real(dp),    pointer     :: vec_neq(:), vec_ndof1(:), phiFull(:,:)
     real(dp),    external    :: DDOT
 
@@ -872,7 +878,29 @@ contains
     end if
 
     !! Compute M22 = B'*Mii*B
+    useThreads = .false.
+    if (present(nThreads)) then
+       !! Multi-threading requires that all columns of B are in core
+       useThreads = nThreads /= 1 .and. dmSize(bmatDisk,3) >= int(ndof2,i8)
+    end if
+    if (useThreads) then
+       allocate(vec2_ndof1(ndof1),STAT=ierr)
+       if (ierr /= 0) then
+          ierr = AllocationError('CMSTRS: vec2_ndof1')
+          return
+       else if (doLogMem) then
+          call logAllocMem ('CMSTRS',0,size(vec2_ndof1),nbd_p)
+       end if
+       call writeProgress('     Using multi-threaded computation of B`*Mii*B')
+    end if
     do j = 1, ndof2
+       if (useThreads) then
+          call threadedBMB (j)
+          if (ierr < 0) goto 900
+          call writeProgress(j,ndof2)
+          cycle
+       end if
+
        vec_ndof1 => getBcolumn(j,ierr)
        if (ierr < 0) goto 900
 
@@ -895,6 +923,10 @@ contains
     end do
 
     call writeProgress('     Done computing  B`*Mii*B')
+    if (allocated(vec2_ndof1)) then
+       if (doLogMem) call logAllocMem ('CMSTRS',size(vec2_ndof1),0,nbd_p)
+       deallocate(vec2_ndof1)
+    end if
 
     if (smii%storageType == diagonalMatrix_p) then
 
@@ -1037,6 +1069,46 @@ contains
       end if
     end subroutine padRedMatrix
 
+    !> @brief Computes column @a j of M22 = B'*Mii*B using multiple threads.
+    !> @details The product Mii*B(:,j) is computed first, and its internal DOF
+    !> components are gathered into a separate vector. The dot products with
+    !> the other columns of B are then independent and computed concurrently.
+    !> This requires that all columns of B are in core, such that
+    !> dmGetColPtr does not perform any swapping.
+    subroutine threadedBMB (j)
+      integer , intent(in) :: j
+      integer              :: i, lerr
+      real(dp), pointer    :: bcol(:)
+      vec_ndof1 => getBcolumn(j,ierr)
+      if (ierr < 0) return
+      call csPremult (smii,vec_ndof1,vec2_neq,1,ierr)
+      if (ierr < 0) return
+      if (neq1 > NDOF1) then
+         call DGATHR (NDOF1,sam%meqn1(1),vec2_neq(1),vec2_ndof1(1),1)
+      else
+         call DCOPY (NDOF1,vec2_neq(1),1,vec2_ndof1(1),1)
+      end if
+      jerr = 0
+      !$omp parallel do private(i,bcol,lerr) reduction(min:jerr) &
+      !$omp schedule(static)
+      do i = 1, j
+         bcol => dmGetColPtr(bmatDisk,i,lerr)
+         if (lerr < 0) then
+            jerr = min(jerr,lerr)
+         else
+            sm22(i,j) = DDOT(NDOF1,bcol(1),1,vec2_ndof1(1),1)
+         end if
+      end do
+      !$omp end parallel do
+      if (jerr < 0) then
+         ierr = jerr
+         return
+      end if
+      do i = 1, j-1
+         sm22(j,i) = sm22(i,j)
+      end do
+    end subroutine threadedBMB
+
     !> @brief Extracts a column from the B-matrix expanded to length @a neq1.
     function getBcolumn (icol,ierr) result(vec_ndof1)
       integer , intent(in)  :: icol
@@ -41,7 +41,8 @@ subroutine reducer (ierr)
   use InaddModule               , only : INADD, extractSubMat
   use CmstrsModule              , only : CMSTRS, EIGVAL, EIGCMS, JCMS, GRAV
   use FileUtilitiesModule       , only : getFileName
-  use TimerModule               , only : initTime, showTime
+  use TimerModule               , only : initTime, showTime, getTotalTime
+  use TimerModule               , only : startTimer, stopTimer
   use VersionModule             , only : openResFile
   use ProgressModule            , only : lterm, writeProgress
   use AllocationModule          , only : doLogMem, logAllocMem, reAllocate
@@ -59,6 +60,7 @@ subroutine reducer (ierr)
   use FFaCmdLineArgInterface    , only : ffa_cmdlinearg_isSet
   use FFlLinkHandlerInterface   , only : ffl_done, ffl_calcs, ffl_getcs
   use FFlLinkHandlerInterface   , only : ffl_addcs_int, ffl_addcs_double
+  !$ use omp_lib                , only : omp_set_num_threads
 
   implicit none
 
@@ -67,7 +69,7 @@ subroutine reducer (ierr)
   logical                :: factorMass, calcGdisp, twoLoops
   integer                :: i, imass, istiff, iopSing, lpu, iprint
   integer                :: cs, ndim, nenod, neval, ngen, nevred, nrhs, mlc(100)
-  integer                :: iNod, lDof, lowBconn, Bprec
+  integer                :: iNod, lDof, lowBconn, Bprec, numThreads, nThreads
   integer(i8)            :: nMass, nStiff
   real(dp), parameter    :: tolMass_p = 1.0e-6_dp
   real(sp)               :: autoBramRatio
@@ -87,10 +89,14 @@ subroutine reducer (ierr)
   character(len=lfnam_p) :: chName
   character(len=64)      :: errMsg
 
+  !! Timers for the most time-consuming phases of the reduction
+  integer, parameter :: asmTimer_p = 2, eigTimer_p = 3, cmsTimer_p = 4
+  integer, parameter :: redTimer_p = 5, grvTimer_p = 6
+
 
   !! --- Logic section ---
 
-  call initTime ()
+  call initTime (grvTimer_p)
   call ffa_initprofiler ('fedem_reducer profiler')
   call ffa_starttimer ('fedem_reducer')
   call openTerminalOutputFile (lterm)
@@ -127,6 +133,21 @@ subroutine reducer (ierr)
   call ffa_cmdlinearg_getdouble ('tolEigval',tolEigval)
   call ffa_cmdlinearg_getdouble ('tolFactorize',tolFactorize)
   call ffa_cmdlinearg_getdouble ('eigenshift',eigenShift)
+  call ffa_cmdlinearg_getint ('numThreads',numThreads)
+
+  ! --- Set the number of threads to use in the parallel sections
+
+  nThreads = 1
+  if (numThreads > 1) then
+     !$ call omp_set_num_threads (numThreads)
+     !$ nThreads = numThreads
+     if (nThreads == 1) then
+        call reportError (note_p,'This reducer is built without OpenMP '// &
+             &            'support.','The option -numThreads is ignored.')
+     end if
+  else if (numThreads < 1) then
+     !$ nThreads = 0 ! Use the default number of OpenMP threads
+  end if
 
 
   ! --- Read the link file and establish the SAM datastructure
@@ -223,8 +244,10 @@ subroutine reducer (ierr)
 
      ! --- Now assemble the substructure stiffness matrix
 
+     call startTimer (asmTimer_p)
      call INADD (sam, csStiffMat, csMassMat, sMass, rMass, &
           &      diagMass.or.lumpedMass, dataChk, 1, iprint, lpu, ierr)
+     call stopTimer (asmTimer_p)
      if (ierr < 0) then
         call reportError (error_p,'Can not build substructure stiffness matrix')
         goto 890
@@ -255,8 +278,10 @@ subroutine reducer (ierr)
 
      ! --- Now assemble the substructure mass matrix
 
+     call startTimer (asmTimer_p)
      call INADD (sam, csStiffMat, csMassMat, sMass, rMass, &
           &      diagMass.or.lumpedMass, dataChk, 2, iprint, lpu, ierr)
+     call stopTimer (asmTimer_p)
      if (ierr < 0) then
         call reportError (error_p,'Can not build substructure mass matrix')
         goto 890
@@ -283,8 +308,10 @@ subroutine reducer (ierr)
 
      ! --- Now assemble the substructure mass- and stiffness matrices
 
+     call startTimer (asmTimer_p)
      call INADD (sam, csStiffMat, csMassMat, sMass, rMass, &
           &      diagMass.or.lumpedMass, dataChk, 3, iprint, lpu, ierr)
+     call stopTimer (asmTimer_p)
      if (ierr < 0) then
         call reportError (error_p,'Can not build substructure matrices')
         goto 890
@@ -392,9 +419,11 @@ subroutine reducer (ierr)
 
      ! --- Compute eigenvalues and eigenvectors of the substructure
 
+     call startTimer (eigTimer_p)
      call EIGVAL (sam, csStiffMat, csMassMat, neval, factorMass, &
           &       iopSing, tolFactorize, tolEigval, eigenShift, &
           &       eval, evec, iprint, lpu, ierr)
+     call stopTimer (eigTimer_p)
      if (ierr < 0) then
         call reportError (error_p,'Can not perform eigenvalue calculation')
         goto 900
@@ -492,10 +521,12 @@ subroutine reducer (ierr)
 
   ! --- Perform the CMS-transformation
 
+  call startTimer (cmsTimer_p)
   call CMSTRS (iopSing, sam, BmatDisk, &
        &       csMassMat, smieSparse, smee, sm, csStiffMat, skee, sk, &
        &       tmpVec, tmpRhs, rhs, vgi, tolFactorize, &
-       &       iStiff, ngen, nrhs, lpu, ierr)
+       &       iStiff, ngen, nrhs, lpu, ierr, nThreads)
+  call stopTimer (cmsTimer_p)
   if (ierr /= 0) then
      call reportError (error_p,'Can not perform CMS-transformation')
      goto 900
@@ -626,8 +657,10 @@ subroutine reducer (ierr)
         call logAllocMem ('reducer',0,size(rVal)+size(rVec),nbd_p)
      end if
 
+     call startTimer (redTimer_p)
      call EIGCMS (sk,sm,BmatDisk,tmpVec,rVal,rVec,sam%meqn1,sam%meqn2, &
           &       ndim,sam%ndof1,sam%ndof2,nevred,iprint,lpu,ierr)
+     call stopTimer (redTimer_p)
      if (ierr < 0) goto 900
 
      if (chname /= '' .and. ierr == 0) then
@@ -665,7 +698,9 @@ subroutine reducer (ierr)
      call logAllocMem ('reducer',0,size(gravec),nbd_p)
   end if
 
+  call startTimer (grvTimer_p)
   call GRAV (sam,csMassMat,BmatDisk,tmpVec,gravec,ndim,ngen,lpu,ierr)
+  call stopTimer (grvTimer_p)
   if (ierr /= 0) then
      call reportError (error_p,'Can not compute gravity forces')
      goto 900
@@ -719,6 +754,7 @@ subroutine reducer (ierr)
   call ffa_printMemStatus (lterm)
 
   if (ierr == 0 .and. i /= 0) ierr = i
+  call writePhaseTimes ()
   if (ierr /= 0) then
      call reportError (debugFileOnly_p,'reducer')
      call getFileName ('resfile',chname,'.res')
@@ -745,4 +781,30 @@ subroutine reducer (ierr)
           & /1X,62('-'))
 6310 format(' Node',I7,' DOF',I3,' Max connection value ',1PE12.5)
 
+contains
+
+  !> @brief Prints the elapsed- and CPU-time of the reduction phases.
+  subroutine writePhaseTimes ()
+    integer           :: iTimer
+    real(sp)          :: phaseTime(2)
+    character(len=36) :: phaseName(asmTimer_p:grvTimer_p)
+    phaseName(asmTimer_p) = 'Stiffness and mass assembly'
+    phaseName(eigTimer_p) = 'Component modes (Lanczos)'
+    phaseName(cmsTimer_p) = 'Static modes and CMS-transformation'
+    phaseName(redTimer_p) = 'Reduced eigenvalue analysis'
+    phaseName(grvTimer_p) = 'Gravity forces'
+    write(lpu,6400)
+    if (nThreads > 0) write(lpu,6410) nThreads
+    do iTimer = asmTimer_p, grvTimer_p
+       phaseTime = getTotalTime(iTimer)
+       if (phaseTime(1) > 0.0_sp .or. phaseTime(2) > 0.0_sp) then
+          write(lpu,6420) phaseName(iTimer),phaseTime
+       end if
+    end do
+6400 format(//4X,'REDUCTION PHASE TIMINGS',T61,'Elapsed [s]',T77,'CPU [s]' &
+          &  /4X,'-----------------------')
+6410 format(4X,'Number of threads :',I4)
+6420 format(4X,A,T60,F12.2,F12.2)
+  end subroutine writePhaseTimes
+
 end subroutine reducer
@@ -18,9 +18,17 @@
 
 module AddInSysModule
 
+  use kindModule, only : dp
+
   implicit none
 
+  !> Thread-local system matrix values used in the parallel assembly
+  real(dp), save, private, allocatable, target :: thrVal(:,:)
+  !> Thread-local system right-hand-side vectors used in the parallel assembly
+  real(dp), save, private, allocatable :: thrRhs(:,:)
+
   private :: hasL0Change
+  private :: useThreadBuffers, initThreadBuffers, mergeThreadBuffers
 
 
 contains
@@ -60,10 +68,12 @@ contains
           if (associated(spring%spr(i)%p%length0Engine)) then
              hasL0Change = .true.
              spring%alpha2 = -hugeVal_p
+             !$omp critical (reportError)
              call reportError (warning_p,'Stiffness-proportional damping '//&
                   'for Axial spring'//trim(getId(spring%id)), &
                   'is deactivated due to stress-free length change.', &
                   'Use an Axial damper instead.')
+             !$omp end critical (reportError)
              return
           end if
        end if
@@ -73,6 +83,125 @@ contains
 
   end function hasL0Change
 
+
+  !!============================================================================
+  !> @brief Checks if the system matrix can be assembled in parallel.
+  !>
+  !> @param[in] sysMat The system matrix to assemble
+  !> @param[in] nThreads Number of threads to use
+  !>
+  !> @details The parallel assembly adds the element matrices into thread-local
+  !> copies of the system matrix values, which are summed afterwards.
+  !> This is done only for the storage formats where all matrix values are
+  !> stored in the @a value array, that is, skyline, sparse and dense matrices.
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  logical function useThreadBuffers (sysMat,nThreads)
+
+    use SysMatrixTypeModule, only : SysMatrixType
+    use SysMatrixTypeModule, only : skylineMatrix_p, sparseMatrix_p
+    use SysMatrixTypeModule, only : denseMatrix_p
+
+    type(SysMatrixType), intent(in) :: sysMat
+    integer            , intent(in) :: nThreads
+
+    !! --- Logic section ---
+
+    select case (sysMat%storageType)
+    case (skylineMatrix_p, sparseMatrix_p, denseMatrix_p)
+       useThreadBuffers = nThreads > 1
+    case default
+       useThreadBuffers = .false.
+    end select
+
+  end function useThreadBuffers
+
+
+  !!============================================================================
+  !> @brief Allocates the thread-local buffers used in the parallel assembly.
+  !>
+  !> @param[in] sysMat The system matrix to assemble
+  !> @param[in] neq Number of system equations
+  !> @param[in] nThreads Number of threads to use
+  !> @param[out] ierr Error flag
+  !>
+  !> @details The buffers are kept between the invocations,
+  !> and are reallocated only if they are too small.
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine initThreadBuffers (sysMat,neq,nThreads,ierr)
+
+    use SysMatrixTypeModule, only : SysMatrixType
+    use reportErrorModule  , only : allocationError
+
+    type(SysMatrixType), intent(in)  :: sysMat
+    integer            , intent(in)  :: neq, nThreads
+    integer            , intent(out) :: ierr
+
+    !! --- Logic section ---
+
+    ierr = 0
+    if (allocated(thrVal)) then
+       if ( size(thrVal,1) >= size(sysMat%value) .and. &
+            size(thrRhs,1) >= neq .and. size(thrVal,2) >= nThreads ) return
+       deallocate(thrVal,thrRhs)
+    end if
+
+    allocate(thrVal(size(sysMat%value),nThreads),thrRhs(neq,nThreads),STAT=ierr)
+    if (ierr /= 0) ierr = allocationError('AddInSysModule::initThreadBuffers')
+
+  end subroutine initThreadBuffers
+
+
+  !!============================================================================
+  !> @brief Adds the thread-local buffers into the system matrix and vector.
+  !>
+  !> @param sysMat The system matrix to add into
+  !> @param[in] nThreads Number of threads that were used
+  !> @param sysRhs System right-hand-side vector to add into
+  !>
+  !> @details The buffers are summed in the thread order, such that the result
+  !> is the same in each invocation with the same number of threads.
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine mergeThreadBuffers (sysMat,nThreads,sysRhs)
+
+    use SysMatrixTypeModule, only : SysMatrixType
+
+    type(SysMatrixType), intent(inout) :: sysMat
+    integer            , intent(in)    :: nThreads
+    real(dp), optional , intent(inout) :: sysRhs(:)
+
+    !! Local variables
+    integer :: i, j
+
+    !! --- Logic section ---
+
+    !$omp parallel do num_threads(nThreads) private(j) schedule(static)
+    do i = 1, size(sysMat%value)
+       do j = 1, nThreads
+          sysMat%value(i) = sysMat%value(i) + thrVal(i,j)
+       end do
+    end do
+    !$omp end parallel do
+
+    if (present(sysRhs)) then
+       do j = 1, nThreads
+          sysRhs = sysRhs + thrRhs(1:size(sysRhs),j)
+       end do
+    end if
+
+  end subroutine mergeThreadBuffers
+
   !!============================================================================
   !> @brief Builds the system Newton matrix.
   !>
@@ -94,6 +223,9 @@ contains
   !> and stiffness matrices, Nmat = scaleM*M + scaleC*C + scaleK*K.
   !> If @a Rhs is provided, contributions due to prescribed motions,
   !> if any, will be added.
+  !> If more than one thread is used (command-line option -numThreads),
+  !> the superelement, spring and damper matrices are added in parallel into
+  !> thread-local copies of the system matrix, which are summed afterwards.
   !>
   !> @callgraph @callergraph
   !>
@@ -108,6 +240,9 @@ contains
     use SamModule                   , only : SamType, dp
     use SysMatrixTypeModule         , only : SysMatrixType
     use MechanismTypeModule         , only : MechanismType
+    use SupElTypeModule             , only : SupElType
+    use SpringTypeModule            , only : SpringType
+    use MasterSlaveJointTypeModule  , only : MasterSlaveJointType
     use SupElRoutinesModule         , only : BuildSupNewtonMat, addInSupMat
     use UserdefElRoutinesModule     , only : BuildUDENewtonMat, addInUDEMat
     use BushingElementRoutinesModule, only : addInBushingElementMat
@@ -120,7 +255,9 @@ contains
     use TireRoutinesModule          , only : addInTireStiffMat
     use TireRoutinesModule          , only : addInTireDamperMat
     use profilerModule              , only : startTimer, stopTimer, asm_p
+    use profilerModule              , only : getNumThreads
     use reportErrorModule           , only : reportError, debugFileOnly_p
+    !$ use omp_lib                  , only : omp_get_thread_num
 #ifdef FT_DEBUG
     use dbgUnitsModule        , only : dbgSolve
     use SysMatrixTypeModule   , only : writeObject
@@ -139,9 +276,10 @@ contains
     real(dp), optional , intent(inout) :: Rhs(:)
 
     !! Local variables
-    integer             :: i
-    real(dp)            :: scaleD
-    logical             :: reComputeSupMat, newTanStiff
+    integer             :: i, lerr, nThreads, nUsed, iThr
+    logical             :: reComputeSupMat, newTanStiff, newTanStiffEl
+    logical             :: haveSupMats, parallelAsm
+    type(SysMatrixType) :: tMat
     logical , parameter :: lDynamics = .true.
     real(dp), parameter :: eps_p = 1.0e-16_dp
     real(dp), save      :: oldScaleM = 0.0_dp
@@ -189,11 +327,93 @@ contains
        oldScaleC = scaleC
     end if
 
+    nThreads = getNumThreads()
+    parallelAsm = useThreadBuffers(Nmat,nThreads)
+    haveSupMats = nThreads > 1 .and. size(mech%sups) > 1
+    if (parallelAsm) then
+
+       !! Compute and add the superelement, spring and damper matrices
+       !! in parallel, into thread-local copies of the system matrix
+       call initThreadBuffers (Nmat,sam%neq,nThreads,ierr)
+       if (ierr < 0) goto 900
+
+       nUsed = 1
+       newTanStiffEl = globalStressStiffIsOn .and. newTanStiff
+       !$omp parallel num_threads(nThreads) private(i,iThr,lerr,tMat) &
+       !$omp&         reduction(min:ierr) reduction(max:nUsed)
+       iThr = 1
+       !$ iThr = 1 + omp_get_thread_num()
+       nUsed = iThr
+       tMat = Nmat
+       tMat%value => thrVal(1:size(Nmat%value),iThr)
+       tMat%value = 0.0_dp
+       thrRhs(:,iThr) = 0.0_dp
+
+       !$omp do schedule(dynamic)
+       do i = 1, size(mech%sups)
+          if (newSupNewtonMat(mech%sups(i))) then
+             call BuildSupNewtonMat (newTanStiff, scaleM, scaleC, scaleK, &
+                  &                  mech%sups(i), lerr)
+             ierr = min(ierr,lerr)
+          end if
+          call addInSupMat (mech%sups(i)%Nmat, tMat, mech%sups(i), sam, &
+               &            lerr, thrRhs(:,iThr))
+          ierr = min(ierr,lerr)
+       end do
+       !$omp end do nowait
+
+       !$omp do schedule(dynamic)
+       do i = 1, size(mech%axialSprings)
+          call addInAxialSpringMat (newTanStiffEl, mech%axialSprings(i), &
+               &                    tMat, lerr, thrRhs(:,iThr))
+          ierr = min(ierr,lerr)
+       end do
+       !$omp end do nowait
+
+       !$omp do schedule(dynamic)
+       do i = 1, size(mech%joints)
+          call addInJointSpringMat (newTanStiffEl, mech%joints(i), &
+               &                    tMat, lerr, thrRhs(:,iThr))
+          ierr = min(ierr,lerr)
+       end do
+       !$omp end do nowait
+
+       !$omp do schedule(dynamic)
+       do i = 1, size(mech%dampers)
+          call addInDamperMat (newTanStiffEl, scaleC, scaleK, tMat, &
+               &               mech%dampers(i), sam, lerr, thrRhs(:,iThr))
+          ierr = min(ierr,lerr)
+       end do
+       !$omp end do
+       !$omp end parallel
+       if (ierr < 0) goto 900
+
+       call mergeThreadBuffers (Nmat,nUsed,Rhs)
+
+    else if (haveSupMats) then
+
+       !! Compute the superelement Newton matrices in parallel first,
+       !! they are then added into the system matrix serially below
+       !$omp parallel do num_threads(nThreads) private(lerr) &
+       !$omp&            reduction(min:ierr) schedule(dynamic)
+       do i = 1, size(mech%sups)
+          if (newSupNewtonMat(mech%sups(i))) then
+             lerr = 0
+             call BuildSupNewtonMat (newTanStiff, scaleM, scaleC, scaleK, &
+                  &                  mech%sups(i), lerr)
+             ierr = min(ierr,lerr)
+          end if
+       end do
+       !$omp end parallel do
+       if (ierr < 0) goto 900
+
+    end if
+
     do i = 1, size(mech%sups)
 
-       if ( reComputeSupMat .or. mech%sups(i)%stressStiffFlag(1) == 1 .or. &
-            abs(mech%sups(i)%massScl(1)-mech%sups(i)%massScl(2)) > eps_p .or. &
-            abs(mech%sups(i)%stifScl(1)-mech%sups(i)%stifScl(2)) > eps_p ) then
+       if (parallelAsm) exit ! Already added
+
+       if (.not. haveSupMats .and. newSupNewtonMat(mech%sups(i))) then
 
           call BuildSupNewtonMat (newTanStiff, scaleM, scaleC, scaleK, &
                &                  mech%sups(i), ierr)
@@ -267,35 +487,15 @@ contains
 #endif
 
     do i = 1, size(mech%axialSprings)
-       scaleD = mech%axialSprings(i)%alpha2 + alpha2
-       if (newTanStiff .and. scaleD > 0.0_dp) then
-          call addInSpringStiffMat (.true., scaleK, Nmat, &
-               &                    mech%axialSprings(i), sam, ierr, Rhs)
-          if (ierr < 0) goto 900
-          if (.not. hasL0Change(mech%axialSprings(i))) then
-             scaleD = scaleC*scaleD
-             call addInSpringStiffMat (.false., scaleD, Nmat, &
-                  &                    mech%axialSprings(i), sam, ierr, Rhs)
-             if (ierr < 0) goto 900
-          end if
-       else
-          scaleD = scaleK + scaleC*max(scaleD,0.0_dp)
-          call addInSpringStiffMat (newTanStiff, scaleD, Nmat, &
-               &                    mech%axialSprings(i), sam, ierr, Rhs)
-          if (ierr < 0) goto 900
-       end if
+       if (parallelAsm) exit ! Already added
+       call addInAxialSpringMat (newTanStiff, mech%axialSprings(i), &
+            &                    Nmat, ierr, Rhs)
+       if (ierr < 0) goto 900
     end do
     do i = 1, size(mech%joints)
-       if (associated(mech%joints(i)%springEl)) then
-          call addInSpringStiffMat (newTanStiff, scaleK, Nmat, &
-               &                    mech%joints(i)%springEl, sam, ierr, Rhs)
-          if (ierr < 0) goto 900
-       end if
-       if (associated(mech%joints(i)%sprFric)) then
-          call addInSpringStiffMat (newTanStiff, scaleK, Nmat, &
-               &                    mech%joints(i)%sprFric, sam, ierr, Rhs)
-          if (ierr < 0) goto 900
-       end if
+       if (parallelAsm) exit ! Already added
+       call addInJointSpringMat (newTanStiff, mech%joints(i), Nmat, ierr, Rhs)
+       if (ierr < 0) goto 900
     end do
 
 #ifdef FT_DEBUG
@@ -307,6 +507,7 @@ contains
 #endif
 
     do i = 1, size(mech%dampers)
+       if (parallelAsm) exit ! Already added
        call addInDamperMat (newTanStiff, scaleC, scaleK, Nmat, &
             &               mech%dampers(i), sam, ierr, Rhs)
        if (ierr < 0) goto 900
@@ -356,6 +557,60 @@ contains
 900 call stopTimer (asm_p)
     if (ierr < 0) call reportError (debugFileOnly_p,'BuildNewtonMat')
 
+  contains
+
+    !> @brief Checks if the Newton matrix of a superelement must be recomputed.
+    logical function newSupNewtonMat (sup)
+      type(SupElType), intent(in) :: sup
+      newSupNewtonMat = reComputeSupMat .or. sup%stressStiffFlag(1) == 1 .or. &
+           &            abs(sup%massScl(1)-sup%massScl(2)) > eps_p .or. &
+           &            abs(sup%stifScl(1)-sup%stifScl(2)) > eps_p
+    end function newSupNewtonMat
+
+    !> @brief Adds the matrices of an axial spring into the system matrix.
+    !> @details The stiffness-proportional damping is included, if any.
+    subroutine addInAxialSpringMat (tanStiff, spring, sysMat, err, sysRhs)
+      logical            , intent(in)    :: tanStiff
+      type(SpringType)   , intent(inout) :: spring
+      type(SysMatrixType), intent(inout) :: sysMat
+      integer            , intent(out)   :: err
+      real(dp), optional , intent(inout) :: sysRhs(:)
+      real(dp) :: scaleD
+      scaleD = spring%alpha2 + alpha2
+      if (tanStiff .and. scaleD > 0.0_dp) then
+         call addInSpringStiffMat (.true., scaleK, sysMat, &
+              &                    spring, sam, err, sysRhs)
+         if (err < 0) return
+         if (hasL0Change(spring)) return
+         scaleD = scaleC*scaleD
+         call addInSpringStiffMat (.false., scaleD, sysMat, &
+              &                    spring, sam, err, sysRhs)
+      else
+         scaleD = scaleK + scaleC*max(scaleD,0.0_dp)
+         call addInSpringStiffMat (tanStiff, scaleD, sysMat, &
+              &                    spring, sam, err, sysRhs)
+      end if
+    end subroutine addInAxialSpringMat
+
+    !> @brief Adds the spring matrices of a joint into the system matrix.
+    subroutine addInJointSpringMat (tanStiff, joint, sysMat, err, sysRhs)
+      logical                   , intent(in)    :: tanStiff
+      type(MasterSlaveJointType), intent(in)    :: joint
+      type(SysMatrixType)       , intent(inout) :: sysMat
+      integer                   , intent(out)   :: err
+      real(dp), optional        , intent(inout) :: sysRhs(:)
+      err = 0
+      if (associated(joint%springEl)) then
+         call addInSpringStiffMat (tanStiff, scaleK, sysMat, &
+              &                    joint%springEl, sam, err, sysRhs)
+         if (err < 0) return
+      end if
+      if (associated(joint%sprFric)) then
+         call addInSpringStiffMat (tanStiff, scaleK, sysMat, &
+              &                    joint%sprFric, sam, err, sysRhs)
+      end if
+    end subroutine addInJointSpringMat
+
   end subroutine BuildNewtonMat
 
 
@@ -540,6 +795,9 @@ contains
   !>
   !> @details If @a Rhs is provided, contributions due to prescribed motions,
   !> if any, will be added.
+  !> If more than one thread is used (command-line option -numThreads),
+  !> the superelement and spring matrices are added in parallel into
+  !> thread-local copies of the system matrix, which are summed afterwards.
   !>
   !> @callgraph @callergraph
   !>
@@ -552,6 +810,8 @@ contains
     use SamModule                   , only : SamType, dp
     use SysMatrixTypeModule         , only : SysMatrixType
     use MechanismTypeModule         , only : MechanismType
+    use SupElTypeModule             , only : SupElType
+    use MasterSlaveJointTypeModule  , only : MasterSlaveJointType
     use SupElRoutinesModule         , only : CompTanStiff, addInSupMat
     use UserdefElRoutinesModule     , only : addInUDEMat
     use BushingElementRoutinesModule, only : addInBushingElementMat
@@ -559,7 +819,9 @@ contains
     use SpringRoutinesModule        , only : addInSpringStiffMat
     use TireRoutinesModule          , only : addInTireStiffMat
     use profilerModule              , only : startTimer, stopTimer, asm_p
+    use profilerModule              , only : getNumThreads
     use reportErrorModule           , only : reportError, debugFileOnly_p
+    !$ use omp_lib                  , only : omp_get_thread_num
 
     type(SysMatrixType), intent(inout) :: Kmat
     type(MechanismType), intent(inout) :: mech
@@ -571,8 +833,10 @@ contains
     real(dp), optional , intent(inout) :: Rhs(:)
 
     !! Local variables
-    integer             :: i
-    logical             :: newTanStiff, lDynamics
+    integer             :: i, lerr, nThreads, nUsed, iThr
+    logical             :: newTanStiff, newSupTanStiff, newTanStiffEl
+    logical             :: lDynamics, parallelAsm
+    type(SysMatrixType) :: tMat
     real(dp), parameter :: scaleK = 1.0_dp, scaleC = 0.0_dp
 
     !! --- Logic section ---
@@ -583,24 +847,80 @@ contains
     Kmat%value = 0.0_dp
 
     newTanStiff = iter <= 0 .or. iter > stressStiffUpdateSkip
+    newSupTanStiff = newTanStiff
 
-    do i = 1, size(mech%sups)
-       if ( (iter >= 0 .and. mech%sups(i)%stressStiffFlag(2) == 1) .or. &
-            (iter <  0 .and. mech%sups(i)%stressStiffFlag(3) == 1) ) then
+    nThreads = getNumThreads()
+    parallelAsm = useThreadBuffers(Kmat,nThreads)
+    if (parallelAsm) then
+
+       !! Compute and add the superelement and spring matrices in parallel,
+       !! into thread-local copies of the system matrix
+       call initThreadBuffers (Kmat,sam%neq,nThreads,ierr)
+       if (ierr < 0) goto 900
+
+       nUsed = 1
+       newTanStiffEl = newTanStiff .and. globalStressStiffIsOn
+       !$omp parallel num_threads(nThreads) private(i,iThr,lerr,tMat) &
+       !$omp&         reduction(min:ierr) reduction(max:nUsed)
+       iThr = 1
+       !$ iThr = 1 + omp_get_thread_num()
+       nUsed = iThr
+       tMat = Kmat
+       tMat%value => thrVal(1:size(Kmat%value),iThr)
+       tMat%value = 0.0_dp
+       thrRhs(:,iThr) = 0.0_dp
+
+       !$omp do schedule(dynamic)
+       do i = 1, size(mech%sups)
+          call addInSupStiffMat (newTanStiff, mech%sups(i), &
+               &                 tMat, lerr, thrRhs(:,iThr))
+          ierr = min(ierr,lerr)
+       end do
+       !$omp end do nowait
+
+       !$omp do schedule(dynamic)
+       do i = 1, size(mech%axialSprings)
+          call addInSpringStiffMat (newTanStiffEl, scaleK, tMat, &
+               &                    mech%axialSprings(i), sam, lerr, &
+               &                    thrRhs(:,iThr))
+          ierr = min(ierr,lerr)
+       end do
+       !$omp end do nowait
+
+       !$omp do schedule(dynamic)
+       do i = 1, size(mech%joints)
+          call addInJointSpringMat (newTanStiffEl, mech%joints(i), &
+               &                    tMat, lerr, thrRhs(:,iThr))
+          ierr = min(ierr,lerr)
+       end do
+       !$omp end do
+       !$omp end parallel
+       if (ierr < 0) goto 900
+
+       call mergeThreadBuffers (Kmat,nUsed,Rhs)
+
+    else if (newTanStiff .and. nThreads > 1 .and. size(mech%sups) > 1) then
 
-          if (newTanStiff) then
-             call CompTanStiff (mech%sups(i), ierr)
-             if (ierr < 0) goto 900
+       !! Compute the superelement tangent stiffness matrices in parallel
+       !$omp parallel do num_threads(nThreads) private(lerr) &
+       !$omp&            reduction(min:ierr) schedule(dynamic)
+       do i = 1, size(mech%sups)
+          if ( (iter >= 0 .and. mech%sups(i)%stressStiffFlag(2) == 1) .or. &
+               (iter <  0 .and. mech%sups(i)%stressStiffFlag(3) == 1) ) then
+             call CompTanStiff (mech%sups(i), lerr)
+             ierr = min(ierr,lerr)
           end if
+       end do
+       !$omp end parallel do
+       if (ierr < 0) goto 900
 
-          call addInSupMat (mech%sups(i)%KtMat, Kmat, &
-               &            mech%sups(i), sam, ierr, Rhs, &
-               &            mech%sups(i)%stifScl(1))
-       else
-          call addInSupMat (mech%sups(i)%KmMat, Kmat, &
-               &            mech%sups(i), sam, ierr, Rhs, &
-               &            mech%sups(i)%stifScl(1))
-       end if
+       newSupTanStiff = .false. ! Already computed
+
+    end if
+
+    do i = 1, size(mech%sups)
+       if (parallelAsm) exit ! Already added
+       call addInSupStiffMat (newSupTanStiff, mech%sups(i), Kmat, ierr, Rhs)
        if (ierr < 0) goto 900
     end do
 
@@ -625,21 +945,15 @@ contains
     end do
 
     do i = 1, size(mech%axialSprings)
+       if (parallelAsm) exit ! Already added
        call addInSpringStiffMat (newTanStiff, scaleK, Kmat, &
             &                    mech%axialSprings(i), sam, ierr, Rhs)
        if (ierr < 0) goto 900
     end do
     do i = 1, size(mech%joints)
-       if (associated(mech%joints(i)%springEl)) then
-          call addInSpringStiffMat (newTanStiff, scaleK, Kmat, &
-               &                    mech%joints(i)%springEl, sam, ierr, Rhs)
-          if (ierr < 0) goto 900
-       end if
-       if (associated(mech%joints(i)%sprFric)) then
-          call addInSpringStiffMat (newTanStiff, scaleK, Kmat, &
-               &                    mech%joints(i)%sprFric, sam, ierr, Rhs)
-          if (ierr < 0) goto 900
-       end if
+       if (parallelAsm) exit ! Already added
+       call addInJointSpringMat (newTanStiff, mech%joints(i), Kmat, ierr, Rhs)
+       if (ierr < 0) goto 900
     end do
 
     lDynamics = iter < 0 ! Use same stiffness in eigen-analysis as in dynamics
@@ -652,6 +966,48 @@ contains
 900 call stopTimer (asm_p)
     if (ierr < 0) call reportError (debugFileOnly_p,'BuildStiffMat')
 
+  contains
+
+    !> @brief Adds the stiffness matrix of a superelement into system matrix.
+    subroutine addInSupStiffMat (tanStiff, sup, sysMat, err, sysRhs)
+      logical            , intent(in)    :: tanStiff
+      type(SupElType)    , intent(inout) :: sup
+      type(SysMatrixType), intent(inout) :: sysMat
+      integer            , intent(out)   :: err
+      real(dp), optional , intent(inout) :: sysRhs(:)
+      if ( (iter >= 0 .and. sup%stressStiffFlag(2) == 1) .or. &
+           (iter <  0 .and. sup%stressStiffFlag(3) == 1) ) then
+         if (tanStiff) then
+            call CompTanStiff (sup, err)
+            if (err < 0) return
+         end if
+         call addInSupMat (sup%KtMat, sysMat, sup, sam, err, sysRhs, &
+              &            sup%stifScl(1))
+      else
+         call addInSupMat (sup%KmMat, sysMat, sup, sam, err, sysRhs, &
+              &            sup%stifScl(1))
+      end if
+    end subroutine addInSupStiffMat
+
+    !> @brief Adds the spring matrices of a joint into the system matrix.
+    subroutine addInJointSpringMat (tanStiff, joint, sysMat, err, sysRhs)
+      logical                   , intent(in)    :: tanStiff
+      type(MasterSlaveJointType), intent(in)    :: joint
+      type(SysMatrixType)       , intent(inout) :: sysMat
+      integer                   , intent(out)   :: err
+      real(dp), optional        , intent(inout) :: sysRhs(:)
+      err = 0
+      if (associated(joint%springEl)) then
+         call addInSpringStiffMat (tanStiff, scaleK, sysMat, &
+              &                    joint%springEl, sam, err, sysRhs)
+         if (err < 0) return
+      end if
+      if (associated(joint%sprFric)) then
+         call addInSpringStiffMat (tanStiff, scaleK, sysMat, &
+              &                    joint%sprFric, sam, err, sysRhs)
+      end if
+    end subroutine addInJointSpringMat
+
   end subroutine BuildStiffMat
 
 
@@ -40,8 +40,7 @@ contains
   subroutine addKgrToKm (supEl,ktan,km,fint,ierr)
 
     use SupElTypeModule   , only : SupElType, dp
-    use scratchArrayModule, only : getRealScratchMatrix
-    use reportErrorModule , only : reportError, debugFileOnly_p
+    use reportErrorModule , only : allocationError
 
     type(SupElType), intent(in)  :: supEl
     real(dp)       , intent(in)  :: km(:,:), fint(:)
@@ -49,9 +48,9 @@ contains
     integer        , intent(out) :: ierr
 
     !! Local variables
-    integer           :: i, j, ndof
-    real(dp)          :: kgr
-    real(dp), pointer :: fnm(:,:)
+    integer               :: i, j, ndof
+    real(dp)              :: kgr
+    real(dp), allocatable :: fnm(:,:)
 
     !! --- Logic section ---
 
@@ -60,9 +59,11 @@ contains
     if (associated(supel%genDOFs)) then
        ndof = ndof - supel%genDOFs%nDOFs
     end if
-    fnm => getRealScratchMatrix(3,ndof,ierr)
-    if (ierr < 0) then
-       call reportError (debugFileOnly_p,'addKgrToKm')
+    !! Not using the scratch array module here,
+    !! since this subroutine may be invoked from parallel regions
+    allocate(fnm(3,ndof),stat=ierr)
+    if (ierr /= 0) then
+       ierr = allocationError('addKgrToKm')
        return
     end if
 
@@ -97,6 +98,8 @@ contains
 
     end if
 
+    deallocate(fnm)
+
   end subroutine addKgrToKm
 
 
@@ -322,13 +322,17 @@ contains
   !> @param[in]  ndim Dimension of the global equation system
   !> @param[out] ierr Error flag
   !>
+  !> @details The frequencies are independent of each other, and are therefore
+  !> solved in parallel when the solver is run with several threads,
+  !> each thread factorizing its own copy of the complex system matrix.
+  !>
   !> @callgraph @callergraph
 
   subroutine freq_sweep (ndim, ierr)
 
     use SolverModule     , only : getSystemMatrix
     use ProgressModule   , only : writeProgress
-    use ProfilerModule   , only : startTimer, stopTimer, fra_p
+    use ProfilerModule   , only : startTimer, stopTimer, fra_p, getNumThreads
     use ReportErrorModule, only : allocationError
     use ReportErrorModule, only : reportError, debugFileOnly_p
 
@@ -338,6 +342,9 @@ contains
     !! Local variables
     integer                  :: nc          !< loop variable
     integer                  :: inc         !< total number of increments
+    integer                  :: nDone       !< number of solved increments
+    integer                  :: nThreads    !< number of threads to use
+    integer                  :: lerr        !< thread-local error flag
 
     real(dp)   , allocatable :: omega(:)    !< circular frequency
 
@@ -345,7 +352,7 @@ contains
     real(dp)   , allocatable :: K(:,:)      !< global stiffness matrix
     real(dp)   , allocatable :: C(:,:)      !< global damping matrix
 
-    real(dp)                 :: w, dw       !< frequency, frequency increment
+    real(dp)                 :: w0, w, dw   !< start frequency, frequency, frequency increment
     complex(dp), allocatable :: SysMat(:,:) !< global system matrix
     complex(dp), allocatable :: eqVec(:)    !< equation vector
     complex(dp), allocatable :: disp(:,:)   !< result matrix (result vector for all increments)
@@ -365,13 +372,10 @@ contains
     call getSystemMatrix(C, 3, ierr) ! 3 returns the global damping matrix
     if (ierr /= 0) goto 998
 
-    allocate(SysMat(ndim,ndim), eqVec(ndim), STAT=ierr)
-    if (ierr /= 0) goto 999
-
-    w  = 2.0_dp*pi_p*sweep_range(1) ! start frequency
+    w0 = 2.0_dp*pi_p*sweep_range(1) ! start frequency
     dw = 0.1_dp ! set frequency increment to 0.1 [Hz]
 
-    inc = int((2.0_dp*pi_p*sweep_range(2)-w)/dw)
+    inc = int((2.0_dp*pi_p*sweep_range(2)-w0)/dw)
     if (associated(plt)) then
        allocate(disp(ndim,inc), omega(inc), STAT=ierr)
        if (ierr /= 0) goto 999
@@ -380,24 +384,46 @@ contains
 
     call startTimer (fra_p)
 
+    nDone = 0
+    nThreads = max(1,min(getNumThreads(),inc))
+
+    !$omp parallel num_threads(nThreads) private(nc,w,lerr,SysMat,eqVec) &
+    !$omp&         reduction(min:ierr)
+    allocate(SysMat(ndim,ndim), eqVec(ndim), STAT=lerr)
+    if (lerr /= 0) ierr = allocationError('freq_sweep')
+
+    !$omp do schedule(dynamic)
     do nc = 1, inc
 
+      if (lerr /= 0) cycle ! Skip the remaining increments on this thread
+
+      w = w0 + real(nc-1,dp)*dw
       eqVec = (0.0_dp, 0.0_dp)
       eqVec(sweep_dof) = cmplx(1,0,dp) ! unit load at sweep_dof
       SysMat = cmplx(-w*w*M + K, w*C, dp)
-      call complexEqSolv(ndim, SysMat, eqVec, ierr)
-      if (ierr /= 0) exit
+      call complexEqSolv(ndim, SysMat, eqVec, lerr)
+      if (lerr /= 0) then
+         ierr = min(ierr,lerr)
+         cycle
+      end if
 
       if (associated(plt)) then
          disp(:,nc) = eqVec
          omega(nc) = w/(2.0_dp*pi_p)
       end if
-      w = w + dw
 
       if (.false.) call writeToFile("sweep.txt", omega(nc), eqVec(sweep_dof))
 
-      call writeProgress (nc,inc)
+      !$omp critical (freqProgress)
+      nDone = nDone + 1
+      call writeProgress (nDone,inc)
+      !$omp end critical (freqProgress)
     end do
+    !$omp end do
+
+    if (allocated(SysMat)) deallocate(SysMat)
+    if (allocated(eqVec)) deallocate(eqVec)
+    !$omp end parallel
 
     if (associated(plt) .and. ierr == 0) then
       call createPyPlotCurves(omega, disp, "sweep", '$\ sweep- $', "sweep", "frequency[w]", type=3, savefigure=.true.)
@@ -408,7 +434,6 @@ contains
     if (associated(plt)) then
        deallocate(disp,omega)
     end if
-    deallocate(SysMat,eqVec)
 998 deallocate(M,K,C)
 
     if (ierr /= 0) call reportError (debugFileOnly_p,'freq_sweep')
@@ -672,13 +697,18 @@ contains
   !> @param[in]    sdim System dimension
   !> @param[out]   ierr Error indicator
   !>
+  !> @details The right-hand-side vectors for all samples are established
+  !> first. In the direct solution, the samples are then solved in parallel
+  !> (when the solver is run with several threads) before the solution vectors
+  !> are expanded to the full system dimension.
+  !>
   !> @callgraph @callergraph
 
   subroutine freq_segment (data, sUd, sUv, sUa, mDmp, del, npt, sdim, ierr)
 
     use SolverModule      , only : objectEquations, getSystemMatrix
     use DenseMatrixModule , only : solveEigenvalues
-    use ProfilerModule    , only : startTimer, stopTimer, fra_p
+    use ProfilerModule    , only : startTimer, stopTimer, fra_p, getNumThreads
     use FunctionTypeModule, only : FunctionType, FunctionValue
     use ReportErrorModule , only : allocationError
     use ReportErrorModule , only : reportError, debugFileOnly_p
@@ -699,6 +729,9 @@ contains
     integer                             :: ndof                   !< number of dgree of freedoms
     integer                             :: pos                    !< position within the array
     integer                             :: nrMotion               !< nr of motion cases
+    integer                             :: nred                   !< dimension of reduced equation system
+    integer                             :: nThreads               !< number of threads to use
+    integer                             :: lerr                   !< thread-local error flag
     integer             , allocatable   :: dof_pattern(:)         !< dof scheme for equation system
     integer             , allocatable   :: pattern(:)             !< dof scheme for RHS
 
@@ -721,6 +754,7 @@ contains
 
     complex(dp)         , allocatable   :: Sys(:,:)               !< system matrix
     complex(dp)         , allocatable   :: Rhs(:)                 !< right hand side vector
+    complex(dp)         , allocatable   :: X(:,:)                 !< rhs/solution vectors for all samples
 
     real(dp)            , allocatable   :: eVal(:)                !< eigenvalue
     real(dp)            , allocatable   :: eVec(:,:)              !< mode shapes
@@ -804,6 +838,10 @@ contains
        allocate(K1(0,0),M1(0,0),C1(0,0),pattern(0),dof_pattern(0))
     end if
 
+    nred = ndim ! dimension of the (possibly) reduced equation system
+    allocate(X(nred,npt/2+1), STAT=ierr)
+    if (ierr /= 0) goto 999
+
     ! in case of model decomposition compute eigenvalues and
     ! eigenvectors for the current segment
     if(nrModes > 0) then
@@ -845,12 +883,9 @@ contains
 
       allocate(mSys(nrModes), mF(nrModes), mU(nrModes), STAT=ierr)
       if (ierr /= 0) goto 999
-    else
-      allocate(Sys(ndim, ndim), STAT=ierr)
-      if (ierr /= 0) goto 999
     endif
 
-    ! loop over samples
+    ! loop over samples, establish the right hand side vectors
     do cc = 1, npt/2+1
 
       ndim = sdim  ! reset dimension
@@ -894,22 +929,58 @@ contains
         enddo
       end if
 
-      ! solution vector for modal and direct solution
-      if (nrModes > 0) then
-        mF  = matmul(transpose(eVec), Rhs)
+      X(:,cc) = Rhs
+      call resizeRhs(sdim) ! restore full size for the next sample
+      if (ierr /= 0) goto 999
+
+    end do
+
+    ! solution vector for modal and direct solution
+    if (nrModes > 0) then
+      do cc = 1, npt/2+1
+        w  = 2.0_dp*pi_p*real(cc-1,dp)/real(npt,dp)/del
+        mF = matmul(transpose(eVec), X(:,cc))
         do k = 1, nrModes
           mSys(k) = cmplx(-w*w + eVal(k), w*mC(k,k), dp)
         end do
         ! modal displacement vector
         mU = mF/mSys
         ! transform modal displacement vector to displacement vector
-        Rhs = matmul(eVec, mU)
-      else
-        ! direct solution
+        X(:,cc) = matmul(eVec, mU)
+      end do
+    else
+      ! direct solution, the samples are solved in parallel
+      ! with a separate copy of the complex system matrix for each thread
+      nThreads = max(1,min(getNumThreads(),npt/2+1))
+      !$omp parallel num_threads(nThreads) private(cc,w,lerr,Sys) &
+      !$omp&         reduction(min:ierr)
+      allocate(Sys(nred, nred), STAT=lerr)
+      if (lerr /= 0) ierr = allocationError('freq_segment')
+      !$omp do schedule(dynamic)
+      do cc = 1, npt/2+1
+        if (lerr /= 0) cycle ! Skip the remaining samples on this thread
+        w   = 2.0_dp*pi_p*real(cc-1,dp)/real(npt,dp)/del
         Sys = cmplx(-w*w*Mn + Kn, w*Cn, dp)
-        call complexEqSolv(ndim, Sys, Rhs, ierr)
-        if (ierr /= 0) goto 998
-      end if
+        call complexEqSolv(nred, Sys, X(:,cc), lerr)
+        ierr = min(ierr,lerr)
+      end do
+      !$omp end do
+      if (allocated(Sys)) deallocate(Sys)
+      !$omp end parallel
+      if (ierr /= 0) goto 998
+    end if
+
+    ! loop over samples, store the solution vectors
+    do cc = 1, npt/2+1
+
+      ndim = nred ! reset dimension
+
+      ! circular frequency
+      w = 2.0_dp*pi_p*real(cc-1,dp)/real(npt,dp)/del
+
+      call resizeRhs(nred)
+      if (ierr /= 0) goto 999
+      Rhs = X(:,cc)
 
       ! rebuilding solution vector (in case of prescribed motions)
       if(nrMotion > 0) then
@@ -940,10 +1011,9 @@ contains
        deallocate(mSys,mF,mU)
        deallocate(tA,mK,mM,mC)
        deallocate(eVal,eVec)
-    else
-       deallocate(Sys)
     end if
 
+    deallocate(X)
     deallocate(dof_pattern,pattern)
     deallocate(K1,M1,C1)
     deallocate(Kn,Mn,Cn,Rhs)
@@ -1041,6 +1111,17 @@ contains
 
     end subroutine remove_Row_Vec
 
+    !> @brief Reallocates the right-hand-side vector, if its size differs.
+    subroutine resizeRhs (n)
+      integer, intent(in) :: n
+
+      if (size(Rhs) == n) return
+
+      deallocate(Rhs)
+      allocate(Rhs(n),stat=ierr)
+
+    end subroutine resizeRhs
+
   end subroutine freq_segment
 
 
@@ -1311,35 +1392,43 @@ contains
   !> @param[out]   ierr error flag
   !>
   !> @details Number of right hand sides is set to 1.
+  !> The pivot array is allocated locally (and not taken from the scratch
+  !> array module) such that this subroutine can be invoked from several
+  !> threads simultaneously.
   !>
   !> @callgraph @callergraph
 
   subroutine complexEqSolv(n, A, B, ierr)
 
-    use ScratchArrayModule, only : getIntegerScratchArray
-    use ReportErrorModule , only : reportError, debugFileOnly_p, error_p
+    use ReportErrorModule, only : allocationError
+    use ReportErrorModule, only : reportError, error_p
 
     integer    , intent(in)    :: n
     complex(dp), intent(inout) :: A(:,:), B(:)
     integer    , intent(out)   :: ierr
 
     !! Local variables
-    integer, parameter :: nrhs = 1
-    integer, pointer   :: ipiv(:)
-    character(len=32)  :: cdiag
+    integer, parameter   :: nrhs = 1
+    integer, allocatable :: ipiv(:)
+    character(len=32)    :: cdiag
 
 
     !! --- Logic section ---
 
-    ipiv => getIntegerScratchArray(n,ierr)
-    if (ierr < 0) then
-       call reportError (debugFileOnly_p,'complexEqSolv')
+    allocate(ipiv(n),STAT=ierr)
+    if (ierr /= 0) then
+       !$omp critical (complexEqSolvError)
+       ierr = allocationError('complexEqSolv')
+       !$omp end critical (complexEqSolvError)
        return
     end if
 
     !! solve the equations A*X = B.
     call zgesv(n, nrhs, A(1,1), n, ipiv(1), B(1), n, ierr)
+    deallocate(ipiv)
+    if (ierr == 0) return
 
+    !$omp critical (complexEqSolvError)
     !! check for the exact singularity.
     if (ierr > 0) then
        write(cdiag,"('U(',I6,' ,',I6,' ) is zero,')") ierr,ierr
@@ -1352,6 +1441,7 @@ contains
        call reportError (error_p,'LAPACK::ZGESV failed',IERR=ierr, &
             &            addString='complexEqSolv')
     end if
+    !$omp end critical (complexEqSolvError)
 
   end subroutine complexEqSolv
 
@@ -38,8 +38,18 @@ module HydroDynamicsModule
   real(sp), save :: wavTime(2,2) !< Timing of wave calculation module (HW & SW)
   integer , save :: wavCall(2)   !< Number of wave calculation invokations
 
-  logical, save :: useHWAFLS !< Flag for hardware wave evaluation
-  logical, save :: useFNV    !< Flag for nonlinear wave force calculations
+  logical, save :: useHWAFLS   !< Flag for hardware wave evaluation
+  logical, save :: useFNV      !< Flag for nonlinear wave force calculations
+  logical, save :: useWaveGrid !< Flag for tabulated wave kinematics
+
+  real(dp), allocatable, save :: waveGrid(:,:,:,:) !< Tabulated wave kinematics
+  real(dp), save :: gridX0(3)  !< Origin of the wave kinematics grid
+  real(dp), save :: gridDX(3)  !< Spacing of the wave kinematics grid
+  real(dp), save :: gridTime   !< Time of the tabulated wave kinematics
+  real(dp), save :: gridTol    !< Error tolerance of the tabulated kinematics
+  logical , save :: gridChecked !< Has the grid resolution been verified?
+
+  integer, parameter :: maxGrid_p = 1000000 !< Max number of grid points
   !> @endcond
 
   !> @brief Updates hydrodynamics quantities after a time step is converged.
@@ -47,7 +57,8 @@ module HydroDynamicsModule
      module procedure UpdateHydroDynamicsAtConvergence
   end interface
 
-  public :: initFluidMotions, getCalculatedFluidMotion, closeHydroDyn
+  public :: initFluidMotions, evaluateFluidMotions
+  public :: getCalculatedFluidMotion, closeHydroDyn
   public :: InitiateHydroDynBodies, UpdateAtConvergence
   public :: getWaveElevation, getMorisonForces, getBuoyancyForces, getDragForces
   public :: getSeaState, diffractionCalc, getDiffractionForces
@@ -116,6 +127,8 @@ contains
     use reportErrorModule      , only : debugFileOnly_p, reportError
     use FFaCmdLineArgInterface , only : ffa_cmdlinearg_isTrue
     use FFaCmdLineArgInterface , only : ffa_cmdlinearg_intValue
+    use FFaCmdLineArgInterface , only : ffa_cmdlinearg_getdouble
+    use FFaCmdLineArgInterface , only : ffa_cmdlinearg_getdoubles
 
     real(dp)             , intent(in)  :: time
     type(EnvironmentType), intent(in)  :: env
@@ -162,6 +175,17 @@ contains
           i = env%waveFunc%intParameters(3)
           call HWAFLS_init (nnod,i,env%seaDepth,env%waveFunc%realParameters)
        end if
+       useWaveGrid = .false.
+       if (associated(env%waveFunc) .and. .not.(useHWAFLS .or. useFNV)) then
+          if (env%waveFunc%type == WAVE_SINUS_p) then
+             call ffa_cmdlinearg_getdoubles ('waveGrid',gridDX,3)
+             call ffa_cmdlinearg_getdouble ('waveGridTol',gridTol)
+             if (gridDX(2) <= 0.0_dp) gridDX(2) = gridDX(1)
+             useWaveGrid = gridDX(1) > 0.0_dp .and. gridDX(3) > 0.0_dp
+             gridTime = -huge(1.0_dp)
+             gridChecked = .false.
+          end if
+       end if
     else
        calcWMotion = 0
        waterMotion(1:10,:) = 0.0_dp ! retain the 11th column
@@ -183,6 +207,11 @@ contains
        call stopTimer (wav_p)
     end if
 
+    if (useWaveGrid .and. time >= 0.0_dp .and. ierr == 0) then
+       call initWaveGrid (env,triads,time,ierr)
+       if (ierr /= 0) call reportError (debugFileOnly_p,'initFluidMotions')
+    end if
+
     call stopTimer (hyd_p)
 
   end subroutine initFluidMotions
@@ -386,7 +415,11 @@ contains
     atSurface = abs(stat) == 2
     call ffa_cmdlinearg_getbool ('noWheelerStretching',noWStretch)
 
-    if (waveFunc%type == WAVE_EMBEDDED_p) then
+    if (interpolateWaveGrid(waveFunc%type,X,atSurface,wave,dynp)) then
+
+       !! Interpolated from the tabulated wave kinematics at current time
+
+    else if (waveFunc%type == WAVE_EMBEDDED_p) then
 
        !! Nonlinear streamline wave theory embedded in an irreagular sea state
        call embeddedWave (waveFunc%intParameters, waveFunc%realParameters, &
@@ -494,6 +527,375 @@ contains
   end subroutine evaluateWave
 
 
+  !!============================================================================
+  !> @brief Interpolates the wave kinematics from the tabulated grid values.
+  !>
+  !> @param[in] waveType Type of wave function to evaluate
+  !> @param[in] X Local coordinates (in wave system) and time of the point
+  !> @param[in] atSurface If .true., evaluate at the wave surface (no table)
+  !> @param[out] wave Wave elevation, velocity and acceleration at the point
+  !> @param[out] dynp Dynamic pressure at the point
+  !> @return .true. if the point is inside the tabulated grid, otherwise .false.
+  !>
+  !> @details The grid cell containing the point must be completely below
+  !> the wave surface, otherwise the kinematics are evaluated directly.
+  !>
+  !> @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  function interpolateWaveGrid (waveType,X,atSurface,wave,dynp) result(found)
+
+    use explicitFunctionsModule, only : WAVE_SINUS_p
+
+    integer           , intent(in)  :: waveType
+    real(dp)          , intent(in)  :: X(4)
+    logical           , intent(in)  :: atSurface
+    real(dp)          , intent(out) :: wave(3,3)
+    real(dp), optional, intent(out) :: dynp
+    logical                         :: found
+
+    !! Local variables
+    integer  :: a, b, c, k, n, i(3)
+    real(dp) :: s, w, xi(3), f(8)
+
+    !! --- Logic section ---
+
+    found = .false.
+    if (.not. useWaveGrid .or. atSurface .or. waveType /= WAVE_SINUS_p) return
+    if (.not. allocated(waveGrid) .or. X(4) /= gridTime) return
+
+    !! Find the grid cell containing the point
+    do k = 1, 3
+       n = size(waveGrid,k+1)
+       if (n < 2) then
+          i(k) = 1
+          xi(k) = 0.0_dp
+          cycle
+       end if
+       s = (X(k)-gridX0(k))/gridDX(k)
+       if (s < 0.0_dp .or. s > real(n-1,dp)) return ! outside the grid
+       i(k) = min(int(s)+1,n-1)
+       xi(k) = s - real(i(k)-1,dp)
+    end do
+
+    !! Check that the cell is below the wave surface
+    k = min(i(3)+1,size(waveGrid,4))
+    s = gridX0(3) + gridDX(3)*real(k-1,dp)
+    do b = 0, min(1,size(waveGrid,3)-1)
+       do a = 0, min(1,size(waveGrid,2)-1)
+          if (s > waveGrid(1,i(1)+a,i(2)+b,k)) return
+       end do
+    end do
+
+    !! Trilinear interpolation
+    f = 0.0_dp
+    do c = 0, min(1,size(waveGrid,4)-1)
+       do b = 0, min(1,size(waveGrid,3)-1)
+          do a = 0, min(1,size(waveGrid,2)-1)
+             w = merge(xi(1),1.0_dp-xi(1),a == 1) &
+                  &  * merge(xi(2),1.0_dp-xi(2),b == 1) &
+                  &  * merge(xi(3),1.0_dp-xi(3),c == 1)
+             f = f + w*waveGrid(:,i(1)+a,i(2)+b,i(3)+c)
+          end do
+       end do
+    end do
+
+    wave(:,1) = 0.0_dp
+    wave(3,1) = f(1)
+    wave(:,2) = f(2:4)
+    wave(:,3) = f(5:7)
+    if (present(dynp)) dynp = f(8)
+    found = .true.
+
+  end function interpolateWaveGrid
+
+
+  !!============================================================================
+  !> @brief Tabulates the wave kinematics on a grid around the wet triads.
+  !>
+  !> @param[in] env Environmental data
+  !> @param[in] triads All triads in the model
+  !> @param[in] time Current simulation time
+  !> @param[out] ierr Error flag
+  !>
+  !> @details The wave elevation, particle velocity, particle acceleration
+  !> and dynamic pressure are evaluated on a regular grid (in the wave
+  !> coordinate system) covering all wet triads, once per time step.
+  !> The wave kinematics at any point inside the grid are then found through
+  !> trilinear interpolation (see interpolateWaveGrid), which is much faster
+  !> than summing up all wave components when there are many of them.
+  !> The grid spacing is given by the command-line option -waveGrid.
+  !>
+  !> The first time the grid is generated, the interpolated values are
+  !> compared with directly evaluated values in the cell centres. If the
+  !> relative difference exceeds the command-line option -waveGridTol,
+  !> the grid spacing is halved (up to three times). If the tolerance still
+  !> is not met, the tabulation is switched off.
+  !>
+  !> @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine initWaveGrid (env,triads,time,ierr)
+
+    use EnvironmentTypeModule, only : EnvironmentType
+    use TriadTypeModule      , only : TriadType
+    use reportErrorModule    , only : reportError, note_p, warning_p
+
+    type(EnvironmentType), intent(in)  :: env
+    type(TriadType)      , intent(in)  :: triads(:)
+    real(dp)             , intent(in)  :: time
+    integer              , intent(out) :: ierr
+
+    !! Local variables
+    integer            :: i, nRefine
+    real(dp)           :: X(3), Xmin(3), Xmax(3), err
+    character(len=128) :: msg
+
+    !! --- Logic section ---
+
+    ierr = 0
+    if (time == gridTime) return ! Already tabulated at this time
+
+    !! Find the bounding box of all wet triads in the wave coordinate system
+    Xmin =  huge(1.0_dp)
+    Xmax = -huge(1.0_dp)
+    do i = 1, size(triads)
+       if (triads(i)%inFluid > 0) then
+          X = glob2loc(env%Tsea,triads(i)%ur(:,4))
+          Xmin = min(Xmin,X)
+          Xmax = max(Xmax,X)
+       end if
+    end do
+    if (Xmin(1) > Xmax(1)) return ! No wet triads
+
+    do nRefine = 0, 3
+       call fillWaveGrid (env,time,Xmin,Xmax,ierr)
+       if (ierr /= 0 .or. .not. useWaveGrid .or. gridChecked) return
+
+       !! Verify the grid resolution
+       err = waveGridError(env,time)
+       if (err <= gridTol) then
+          gridChecked = .true.
+          write(msg,600) shape(waveGrid(1,:,:,:)), gridDX, err
+          call reportError (note_p,'Tabulating the wave kinematics on a '// &
+               &            'regular grid',msg)
+          return
+       end if
+
+       gridDX = 0.5_dp*gridDX
+    end do
+
+    write(msg,610) err, gridTol
+    call reportError (warning_p,'The tabulated wave kinematics is not '// &
+         &            'accurate enough, the option -waveGrid is ignored.',msg)
+    useWaveGrid = .false.
+    deallocate(waveGrid)
+
+600 format('Grid size ',I0,2('x',I0),', spacing',1P3E10.2,', error',E10.2)
+610 format('Relative error',1PE10.2,' exceeds the tolerance',E10.2)
+
+  end subroutine initWaveGrid
+
+
+  !!============================================================================
+  !> @brief Evaluates the wave kinematics at all grid points.
+  !>
+  !> @param[in] env Environmental data
+  !> @param[in] time Current simulation time
+  !> @param[in] Xmin Lower corner of the region to cover, in wave coordinates
+  !> @param[in] Xmax Upper corner of the region to cover, in wave coordinates
+  !> @param[out] ierr Error flag
+  !>
+  !> @details The grid points are evaluated in parallel, using the number of
+  !> threads specified by the command-line option -numThreads.
+  !>
+  !> @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine fillWaveGrid (env,time,Xmin,Xmax,ierr)
+
+    use EnvironmentTypeModule, only : EnvironmentType
+    use profilerModule       , only : startTimer, stopTimer, getNumThreads, wav_p
+    use reportErrorModule    , only : allocationError, reportError, warning_p
+
+    type(EnvironmentType), intent(in)  :: env
+    real(dp)             , intent(in)  :: time, Xmin(3), Xmax(3)
+    integer              , intent(out) :: ierr
+
+    !! Local variables
+    integer  :: k, ip, np, n(3), nThreads
+    real(dp) :: g, Tw(3,4)
+
+    !! --- Logic section ---
+
+    ierr = 0
+    gridTime = -huge(1.0_dp) ! Invalidate the current table
+
+    !! Determine the grid size, with one extra layer of points on each side.
+    !! The grid is 2D (in the xz-plane) for long-crested waves.
+    do k = 1, 3
+       if (k == 2 .and. env%waveFunc%intParameters(4) < 2) then
+          n(k) = 1
+          gridX0(k) = 0.0_dp
+       else
+          n(k) = 3 + ceiling((Xmax(k)-Xmin(k))/gridDX(k))
+          gridX0(k) = Xmin(k) - gridDX(k)
+       end if
+    end do
+
+    np = product(n)
+    if (np > maxGrid_p) then
+       call reportError (warning_p,'The wave kinematics grid is too large '// &
+            &            '(too small spacing), the option -waveGrid is ignored.')
+       useWaveGrid = .false.
+       if (allocated(waveGrid)) deallocate(waveGrid)
+       return
+    end if
+
+    if (allocated(waveGrid)) then
+       if (any(shape(waveGrid) /= (/8,n/))) deallocate(waveGrid)
+    end if
+    if (.not. allocated(waveGrid)) then
+       allocate(waveGrid(8,n(1),n(2),n(3)),STAT=ierr)
+       if (ierr /= 0) then
+          ierr = allocationError('fillWaveGrid')
+          return
+       end if
+    end if
+
+    !! Identity transformation, such that the wave kinematics are evaluated
+    !! in the wave coordinate system without scaling
+    Tw = 0.0_dp
+    do k = 1, 3
+       Tw(k,k) = 1.0_dp
+    end do
+
+    g = sqrt(sum(env%gravity*env%gravity))
+    nThreads = getNumThreads()
+
+    call startTimer (wav_p)
+    call startTW ()
+
+    !! Evaluate the first point serially, such that any invalid wave function
+    !! is detected (and reported) before entering the parallel region
+    call evalGridPoint (0,ierr)
+    if (ierr >= 0) then
+       !$omp parallel do num_threads(max(1,nThreads)) private(k) schedule(static)
+       do ip = 1, np-1
+          call evalGridPoint (ip,k)
+       end do
+       !$omp end parallel do
+       ierr = 0
+       gridTime = time
+    end if
+
+    call stopTW (2)
+    wavCall(2) = wavCall(2) + np
+    call stopTimer (wav_p)
+
+  contains
+
+    !> @brief Evaluates the wave kinematics at grid point @a ip (zero-based).
+    subroutine evalGridPoint (ip,stat)
+      integer, intent(in)  :: ip
+      integer, intent(out) :: stat
+      integer  :: i(3)
+      real(dp) :: X(3), wave(3,3), dynp
+      i(1) = mod(ip,n(1))
+      i(2) = mod(ip/n(1),n(2))
+      i(3) = ip/(n(1)*n(2))
+      X = gridX0 + gridDX*real(i,dp)
+      stat = 0
+      dynp = 0.0_dp
+      call evaluateWave (env%waveFunc,env%waveTheory,Tw,g,env%seaDepth, &
+           &             X,time,1.0_dp,wave,dynp,stat)
+      waveGrid(1,i(1)+1,i(2)+1,i(3)+1)   = wave(3,1)
+      waveGrid(2:4,i(1)+1,i(2)+1,i(3)+1) = wave(:,2)
+      waveGrid(5:7,i(1)+1,i(2)+1,i(3)+1) = wave(:,3)
+      waveGrid(8,i(1)+1,i(2)+1,i(3)+1)   = dynp
+    end subroutine evalGridPoint
+
+  end subroutine fillWaveGrid
+
+
+  !!============================================================================
+  !> @brief Returns the relative error of the tabulated wave kinematics.
+  !>
+  !> @param[in] env Environmental data
+  !> @param[in] time Current simulation time
+  !>
+  !> @details The interpolated wave elevation, velocity and acceleration are
+  !> compared with the directly evaluated values in the centre of (up to) 64
+  !> grid cells. The largest difference for each quantity is divided by the
+  !> largest directly evaluated value of that quantity.
+  !>
+  !> @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  function waveGridError (env,time) result(err)
+
+    use EnvironmentTypeModule  , only : EnvironmentType
+    use explicitFunctionsModule, only : WAVE_SINUS_p
+
+    type(EnvironmentType), intent(in) :: env
+    real(dp)             , intent(in) :: time
+    real(dp)                          :: err
+
+    !! Local variables
+    integer  :: ic, nc, stat, i(3), m(3)
+    real(dp) :: g, X(4), Tw(3,4), wave(3,3), wint(3,3), dmax(3), vmax(3)
+
+    !! --- Logic section ---
+
+    Tw = 0.0_dp
+    do ic = 1, 3
+       Tw(ic,ic) = 1.0_dp
+    end do
+    g = sqrt(sum(env%gravity*env%gravity))
+
+    dmax = 0.0_dp
+    vmax = 0.0_dp
+    m  = max(1,shape(waveGrid(1,:,:,:))-1) ! Number of cells in each direction
+    nc = product(m)
+    do ic = 0, nc-1, max(1,nc/64)
+       i(1) = mod(ic,m(1))
+       i(2) = mod(ic/m(1),m(2))
+       i(3) = ic/(m(1)*m(2))
+       X(1:3) = gridX0 + gridDX*(real(i,dp)+0.5_dp)
+       if (size(waveGrid,3) < 2) X(2) = gridX0(2)
+       X(4) = time
+       if (.not. interpolateWaveGrid(WAVE_SINUS_p,X,.false.,wint)) cycle
+
+       stat = 0
+       gridTime = -huge(1.0_dp) ! Force direct evaluation
+       call evaluateWave (env%waveFunc,env%waveTheory,Tw,g,env%seaDepth, &
+            &             X(1:3),time,1.0_dp,wave,stat=stat)
+       gridTime = time
+       dmax(1) = max(dmax(1),abs(wint(3,1)-wave(3,1)))
+       dmax(2) = max(dmax(2),sqrt(sum((wint(:,2)-wave(:,2))**2)))
+       dmax(3) = max(dmax(3),sqrt(sum((wint(:,3)-wave(:,3))**2)))
+       vmax(1) = max(vmax(1),abs(wave(3,1)))
+       vmax(2) = max(vmax(2),sqrt(sum(wave(:,2)**2)))
+       vmax(3) = max(vmax(3),sqrt(sum(wave(:,3)**2)))
+    end do
+
+    err = maxval(dmax/max(vmax,eps_p))
+
+  end function waveGridError
+
+
   !!============================================================================
   !> @brief Evaluates the sea current velocity at the given point and time.
   !>
@@ -690,6 +1092,149 @@ contains
   end subroutine evaluateSea
 
 
+  !!============================================================================
+  !> @brief Evaluates the sea state at all wet beam element nodes.
+  !>
+  !> @param sups All superelements in the model
+  !> @param[in] env Environmental data
+  !> @param[in] time Current simulation time
+  !> @param[out] ierr Error flag
+  !>
+  !> @details This subroutine fills the fluid particle motion cache for all
+  !> wet triads connected to beam elements with hydrodynamic properties, which
+  !> have not been evaluated yet in the current time step (or iteration).
+  !> The wave kinematics is then evaluated in parallel over the nodes, using
+  !> the number of threads specified by the command-line option -numThreads
+  !> (requires that the solver is built with OpenMP support).
+  !> The sea current, which is based on general functions, is added serially
+  !> afterwards. The subsequent calls to getMorisonForces then only pick up
+  !> the cached values, such that the result does not depend on the number
+  !> of threads used. Nothing is done here if only one thread is used,
+  !> or if the wave kinematics is computed by other means (hardware module,
+  !> FNV formulation or user-defined wave function plug-in).
+  !>
+  !> @callgraph @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine evaluateFluidMotions (sups,env,time,ierr)
+
+    use EnvironmentTypeModule  , only : EnvironmentType
+    use SupElTypeModule        , only : SupElType, IsBeam
+    use explicitFunctionsModule, only : USER_DEFINED_p
+    use profilerModule         , only : startTimer, stopTimer, wav_p, hyd_p
+    use profilerModule         , only : getNumThreads
+    use reportErrorModule      , only : allocationError
+    use FFaCmdLineArgInterface , only : ffa_cmdlinearg_getint
+
+    type(SupElType)      , intent(in)  :: sups(:)
+    type(EnvironmentType), intent(in)  :: env
+    real(dp)             , intent(in)  :: time
+    integer              , intent(out) :: ierr
+
+    !! Local variables
+    integer, parameter    :: pending_p = 99
+    integer               :: i, j, k, n, nThreads, dumpWave, stat
+    integer , allocatable :: nodes(:)
+    real(dp), allocatable :: X(:,:)
+    real(dp)              :: g, wn(3), cvel(3)
+
+    !! --- Logic section ---
+
+    ierr = 0
+    if (.not. allocated(calcWMotion)) return
+    if (.not. associated(env%waveFunc) .or. useHWAFLS .or. useFNV) return
+    if (env%waveFunc%type == USER_DEFINED_p) return
+
+    nThreads = getNumThreads()
+    if (nThreads < 2) return
+
+    g = waterSurfaceNormal(wn,env%gravity)
+    if (g <= 0.0_dp) return ! Let getMorisonForces report this error
+
+    call startTimer (hyd_p)
+
+    allocate(nodes(size(calcWMotion)),X(3,size(calcWMotion)),STAT=ierr)
+    if (ierr /= 0) then
+       ierr = allocationError('evaluateFluidMotions')
+       goto 900
+    end if
+
+    !! Collect the wet nodes that need to be evaluated, in a fixed order.
+    !! The dumpWaveNode triad (if any) is left to getMorisonForces.
+    call ffa_cmdlinearg_getint ('dumpWaveNode',dumpWave)
+    n = 0
+    do i = 1, size(sups)
+       if (.not. associated(sups(i)%hydyn)) cycle
+       if (.not. IsBeam(sups(i))) cycle
+       do k = 1, size(sups(i)%triads)
+          j = sups(i)%triads(k)%p%inFluid
+          if (j < 1) cycle ! dry triad
+          if (calcWMotion(j) /= 0) cycle ! already evaluated
+          if (sups(i)%triads(k)%p%id%userId == dumpWave) cycle
+          n = n + 1
+          nodes(n) = j
+          X(:,n) = sups(i)%triads(k)%p%ur(:,4)
+          calcWMotion(j) = pending_p
+       end do
+    end do
+    if (n < 1) goto 900
+
+    call startTimer (wav_p)
+    call startTW ()
+
+    !! Evaluate the first node serially, such that any invalid wave function
+    !! is detected (and reported) before entering the parallel region
+    stat = 0
+    call evaluateWave (env%waveFunc,env%waveTheory,env%Tsea,g, &
+         &             env%seaDepth,X(:,1),time,env%seaScale, &
+         &             waterMotion(1:9,nodes(1)),stat=stat)
+    calcWMotion(nodes(1)) = stat
+    if (stat >= 0) then
+       !$omp parallel do num_threads(nThreads) private(k,j) schedule(static)
+       do k = 2, n
+          j = nodes(k)
+          calcWMotion(j) = 0
+          call evaluateWave (env%waveFunc,env%waveTheory,env%Tsea,g, &
+               &             env%seaDepth,X(:,k),time,env%seaScale, &
+               &             waterMotion(1:9,j),stat=calcWMotion(j))
+       end do
+       !$omp end parallel do
+    end if
+
+    call stopTW (2)
+    wavCall(2) = wavCall(2) + n
+    call stopTimer (wav_p)
+
+    !! Add the sea current (serially, since the current functions may not be
+    !! thread safe). Nodes that failed are reset, such that the error will be
+    !! detected and reported when evaluated again in getMorisonForces.
+    do k = 1, n
+       j = nodes(k)
+       stat = calcWMotion(j)
+       if (stat == 1) then
+          call evaluateCurrent (env%currFunc,env%cDirFunc,env%Tsea, &
+               &                X(:,k),time,env%currScale,cvel,stat)
+          waterMotion(4:6,j) = waterMotion(4:6,j) + cvel
+       end if
+       if (stat < 0 .or. stat == pending_p) then
+          calcWMotion(j) = 0
+       else
+          calcWMotion(j) = stat
+       end if
+    end do
+
+900 continue
+    if (allocated(nodes)) deallocate(nodes)
+    if (allocated(X)) deallocate(X)
+
+    call stopTimer (hyd_p)
+
+  end subroutine evaluateFluidMotions
+
+
   !!============================================================================
   !> @brief Returns the wave height at the given point and time.
   !>
@@ -2024,6 +2569,7 @@ contains
 
     if (allocated(waterMotion)) deallocate(waterMotion)
     if (allocated(calcWMotion)) deallocate(calcWMotion)
+    if (allocated(waveGrid))    deallocate(waveGrid)
 
 600 format(//47X,'# calls Wall time  CPU time' &
          &  / 4X,'+',39('-'),'+',3(9('-'),'+'))
@@ -133,6 +133,7 @@ contains
        call ffa_cmdlinearg_getdouble ('eigenshift',modes%shift)
        call ffa_cmdlinearg_getbool ('factorMass_eigensolver',modes%factorMass)
        call ffa_cmdlinearg_getbool ('addBC_eigensolver',modes%addBC)
+       call ffa_cmdlinearg_getbool ('warmStartEig',modes%warmStart)
 
     end if
 
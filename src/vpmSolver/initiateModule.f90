@@ -57,6 +57,7 @@ contains
 
     use headingNameListModule       , only : read_HEADING, modelFile, version
     use inputUtilities              , only : iuCopyToScratch, iuWriteToScratch
+    use inputUtilities              , only : iuIndexEntries, iuClearIndex
     use initiateSystemTypeModule    , only : InitiateSystem
     use initiateTriadTypeModule     , only : ReadTriads
     use initiateSupElTypeModule     , only : ReadSupEls
@@ -136,7 +137,11 @@ contains
        end if
 
     end if
-    rewind(infp)
+
+    !! Count all namelist entries in one pass, such that the readers below
+    !! do not need to search through the whole file for each entry type
+    call iuIndexEntries (infp,err)
+    if (err /= 0) goto 990
 
 
     !! --- Start parsing the solver input file
@@ -313,6 +318,7 @@ contains
     if (err /= 0) goto 990
 #endif
 
+    call iuClearIndex ()
     close(infp)
 
     !! Get solution algorithm parameters from command-line arguments
@@ -325,7 +331,8 @@ contains
 
     return
 
-990 close(infp)
+990 call iuClearIndex ()
+    close(infp)
 999 call reportError (debugFileOnly_p,'readSolverData')
 
   end subroutine readSolverData
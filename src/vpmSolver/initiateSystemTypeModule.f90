@@ -148,6 +148,7 @@ contains
     call ffa_cmdlinearg_getint ('nupdat',sys%nUpdat)
     call ffa_cmdlinearg_getint ('maxSeqNoUpdate',sys%maxSequentialNoUpdate)
     call ffa_cmdlinearg_getdouble ('tolUpdateFactor',sys%tolUpdateFactor)
+    call ffa_cmdlinearg_getdouble ('tanReuseRate',sys%tanReuseRate)
 
     !! Quasi-static equilibrium parameters
     if (ffa_cmdlinearg_isTrue('initEquilibrium')) then
@@ -34,6 +34,7 @@ module ModesRoutinesModule
   !> @endcond
 
   public :: allocEigenMatrices, eigenModes, printModes, exportModes
+  public :: modalBasis, modalSolve
 
 
 contains
@@ -101,6 +102,7 @@ contains
        deallocate(modes%eqVec)
        nullify(modes%eqVec)
     end if
+    modes%nStart = 0
 
     if (N < 1) return ! We are deallocating only
 
@@ -633,6 +635,7 @@ contains
   !> @param mech Mechanism components of the model
   !> @param[in] iprint Print switch for additional output
   !> @param[out] ierr Error flag
+  !> @param[in] startVec Starting subspace for the warm-started eigensolver
   !>
   !> @details This is the main driver of the system-level eigenvalue analysis.
   !> The parameter modestypemodule::modestype::solver determines which actual
@@ -644,9 +647,14 @@ contains
   !> - 4 : Use LAPACK::DGGEVX (damped system)
   !> - 5 : Use LAPACK::DSYGVX (symmetric system)
   !>
+  !> If modestypemodule::modestype::warmstart is .true. and a Lanczos solver
+  !> is used, a block subspace iteration starting from the eigenvectors of
+  !> the previous analysis (or from @a startVec) is tried first. The Lanczos
+  !> solver is then used only if the subspace iteration fails to converge.
+  !>
   !> @callgraph @callergraph
 
-  subroutine eigenModes (sam,modes,sys,mech,iprint,ierr)
+  subroutine eigenModes (sam,modes,sys,mech,iprint,ierr,startVec)
 
     use sprKindModule      , only : ik
     use SamModule          , only : SamType
@@ -672,6 +680,7 @@ contains
     type(MechanismType) , intent(inout) :: mech
     integer             , intent(in)    :: iprint
     integer             , intent(out)   :: ierr
+    real(dp), optional  , intent(in)    :: startVec(:,:)
 
     !! Local variables
     logical               :: mIsDestroyed
@@ -703,6 +712,7 @@ contains
     if (mIsDestroyed) then
        call csCopyMat (sys%Nmat,modes%Mmat,ierr)
        if (ierr /= 0) goto 915
+       sys%NmatIsReusable = .false.
     end if
 
 #ifdef FT_DEBUG
@@ -739,6 +749,31 @@ contains
           goto 915
        end if
 
+       if (present(startVec)) then
+          !! Use the provided vectors as the starting subspace
+          modes%nStart = min(size(startVec,2),size(modes%eqVec,2))
+          modes%eqVec(:,1:modes%nStart) = startVec(:,1:modes%nStart)
+       end if
+
+       if (modes%warmStart .and. modes%nStart > 0) then
+          !! Try subspace iteration from the previous eigenvectors first
+          call subspaceIteration (modes,neqEig,alphaR,io,ierr)
+          if (ierr == 0) goto 100
+          if (ierr < 0) then
+             call stopTimer (eig_p)
+             goto 915
+          end if
+          call reportError (note_p,'Subspace iteration did not converge,'// &
+               &            ' using the Lanczos eigensolver instead')
+          !! Rebuild the stiffness matrix, since it now is factorized
+          call BuildStiffMat (modes%Kmat,mech,sam,iter,modes%stressStiffIsOn, &
+               &              zeroStressStiffUpdateSkip,ierr)
+          if (ierr /= 0) then
+             call stopTimer (eig_p)
+             goto 915
+          end if
+       end if
+
        !! Solve the real symmetric eigenvalue problem
 
        if (modes%factorMass) then
@@ -783,6 +818,7 @@ contains
           ierr = 0
        end if
 
+100    modes%nStart = modes%nModes
        do j = 1, modes%nModes
           modes%ReVal(j) = dsqrt(abs(alphaR(j)))
           if (alphaR(j) < 0.0_dp) ierr = ierr + 1
@@ -942,6 +978,297 @@ contains
   end subroutine eigenModes
 
 
+  !!============================================================================
+  !> @brief Solves the symmetric eigenvalue problem by subspace iteration.
+  !>
+  !> @param modes Eigenmode data
+  !> @param[in] neqEig Number of equations to solve for
+  !> @param[out] eigVal Computed eigenvalues
+  !> @param[in] lpu File unit number for res-file output
+  !> @param[out] ierr Error flag
+  !>
+  !> @details The iteration starts from the subspace spanned by the @a nStart
+  !> first vectors in modes%eqVec, typically the eigenvectors of the previous
+  !> eigenvalue analysis, supplemented with some arbitrary trial vectors.
+  !> Each iteration consists of one inverse iteration step on the whole block
+  !> followed by a Rayleigh-Ritz projection, which is solved by LAPACK::DSYGV.
+  !> When the system has changed only slightly since the previous analysis,
+  !> this usually converges in a few iterations, and at the cost of one
+  !> factorization of the stiffness matrix only.
+  !>
+  !> On successful exit, the mass-normalized eigenvectors are stored as the
+  !> first modes%nModes vectors of modes%eqVec. If the iterations did not
+  !> converge, or the stiffness matrix is singular, @a ierr is set to 1 and
+  !> modes%eqVec is left unchanged. Notice that the stiffness matrix is
+  !> factorized on exit, also when the iterations failed.
+  !>
+  !> @callgraph @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine subspaceIteration (modes,neqEig,eigVal,lpu,ierr)
+
+    use ModesTypeModule   , only : ModesType
+    use KindModule        , only : epsDiv0_p
+    use SolExtensionModule, only : csSolve
+    use MatExtensionModule, only : csPremult, csAddMat
+    use reportErrorModule , only : allocationError
+
+    type(ModesType), intent(inout) :: modes
+    integer        , intent(in)    :: neqEig, lpu
+    real(dp)       , intent(out)   :: eigVal(:)
+    integer        , intent(out)   :: ierr
+
+    !! Local variables
+    integer, parameter    :: maxIt_p = 20
+    integer               :: i, j, iter, nVec, nBlk, neq
+    real(dp), allocatable :: X(:,:), Y(:,:), Kr(:,:), Mr(:,:), w(:), wPrev(:)
+    real(dp), allocatable :: work(:)
+
+    !! --- Logic section ---
+
+    nVec = modes%nModes
+    nBlk = min(2*nVec,nVec+8,size(modes%eqVec,2),neqEig)
+    if (nBlk < nVec) then
+       ierr = 1
+       return
+    end if
+
+    neq = size(modes%eqVec,1)
+    allocate(X(neq,nBlk),Y(neq,nBlk),Kr(nBlk,nBlk),Mr(nBlk,nBlk), &
+         &   w(nBlk),wPrev(nVec),work(3*nBlk),stat=ierr)
+    if (ierr /= 0) then
+       ierr = allocationError('subspaceIteration')
+       return
+    end if
+
+    !! Starting subspace, the previous eigenvectors and some trial vectors
+    j = min(modes%nStart,nBlk)
+    X(:,1:j) = modes%eqVec(:,1:j)
+    do j = j+1, nBlk
+       do i = 1, neqEig
+          X(i,j) = sin(real(i*j,dp))
+       end do
+    end do
+    X(neqEig+1:,:) = 0.0_dp
+
+    if (abs(modes%shift) > epsDiv0_p) then
+       !! Shifted eigenvalue problem, (K - shift*M)*x = (lambda - shift)*M*x
+       call csAddMat (modes%Kmat,modes%Mmat,-modes%shift,ierr)
+       if (ierr /= 0) goto 900
+    end if
+
+    wPrev = 0.0_dp
+    do iter = 1, maxIt_p
+
+       !! Inverse iteration, Y = K^-1*M*X (factorization in the first one)
+       do j = 1, nBlk
+          call csPremult (modes%Mmat,X(:,j),Y(:,j),1,ierr)
+          if (ierr /= 0) goto 900
+       end do
+       X = Y
+       call csSolve (min(iter+2,4),0,modes%Kmat,Y,lpu,ierr,neq1=neqEig)
+       if (ierr < 0) goto 900
+       Y(neqEig+1:,:) = 0.0_dp
+
+       !! Rayleigh-Ritz projection, Kr = Y^T*M*X and Mr = Y^T*M*Y
+       Kr = matmul(transpose(Y),X)
+       do j = 1, nBlk
+          call csPremult (modes%Mmat,Y(:,j),X(:,j),1,ierr)
+          if (ierr /= 0) goto 900
+       end do
+       Mr = matmul(transpose(Y),X)
+
+       !! Solve the projected eigenvalue problem
+       call DSYGV (1,'V','U',nBlk,Kr,nBlk,Mr,nBlk,w,work,size(work),ierr)
+       if (ierr /= 0) goto 900
+       X = matmul(Y,Kr)
+
+       !! Check for convergence in the eigenvalues
+       if (all(abs(w(1:nVec)-wPrev) <= modes%tol(1)*abs(w(1:nVec)))) then
+          modes%eqVec(:,1:nVec) = X(:,1:nVec)
+          eigVal(1:nVec) = w(1:nVec) + modes%shift
+          ierr = 0
+          goto 990
+       end if
+       wPrev = w(1:nVec)
+
+    end do
+
+900 ierr = 1 ! Not converged, or a singular system matrix
+990 deallocate(X,Y,Kr,Mr,w,wPrev,work)
+
+  end subroutine subspaceIteration
+
+
+  !!============================================================================
+  !> @brief Calculates the eigenmodes used in mode superposition integration.
+  !>
+  !> @param[in] sam Data for managing system matrix assembly
+  !> @param modes Eigenmode data of the modal basis
+  !> @param mech Mechanism components of the model
+  !> @param[in] iprint Print switch for additional output
+  !> @param[out] ierr Error flag
+  !>
+  !> @details The eigenmodes are computed by the Lanczos eigensolver for the
+  !> current configuration of the model. Only the mass-normalized eigenvectors
+  !> in equation order are kept, together with the eigenfrequencies and the
+  !> modal damping ratios. Unlike in eigenmodes(), the eigenvectors are not
+  !> expanded to DOF-order, and the internal work arrays of this module are
+  !> not used, such that this subroutine can be used independently of the
+  !> regular eigenvalue analysis.
+  !>
+  !> @callgraph @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine modalBasis (sam,modes,mech,iprint,ierr)
+
+    use sprKindModule      , only : ik
+    use SamModule          , only : SamType
+    use ModesTypeModule    , only : ModesType
+    use MechanismTypeModule, only : MechanismType
+    use KindModule         , only : epsDiv0_p
+    use SolExtensionModule , only : csLanczosEigenSolve
+    use MatExtensionModule , only : csTransform
+    use AddInSysModule     , only : BuildStiffMat, BuildDamperMat, BuildMassMat
+    use profilerModule     , only : startTimer, stopTimer, eig_p
+    use reportErrorModule  , only : allocationError, getErrorFile
+    use reportErrorModule  , only : reportError, debugFileOnly_p, warning_p
+
+    type(SamType)       , intent(in)    :: sam
+    type(ModesType)     , intent(inout) :: modes
+    type(MechanismType) , intent(inout) :: mech
+    integer             , intent(in)    :: iprint
+    integer             , intent(out)   :: ierr
+
+    !! Local variables
+    integer               :: j, neqEig, mip(7), mop(10)
+    integer(ik)           :: meqErr(2)
+    real(dp), allocatable :: eigVal(:)
+    integer, parameter    :: iter = -1, zeroStressStiffUpdateSkip = 0
+
+    !! --- Logic section ---
+
+    call BuildStiffMat (modes%Kmat,mech,sam,iter,modes%stressStiffIsOn, &
+         &              zeroStressStiffUpdateSkip,ierr)
+    if (ierr /= 0) goto 915
+
+    call BuildDamperMat (modes%Cmat,mech,sam,ierr)
+    if (ierr /= 0) goto 915
+
+    call BuildMassMat (modes%Mmat,mech,sam,ierr)
+    if (ierr /= 0) goto 915
+
+    if (modes%addBC) then
+       neqEig = sam%ndof1
+    else
+       neqEig = sam%neq
+    end if
+
+    if (.not. associated(modes%eqVec)) then
+       allocate(modes%eqVec(sam%neq,modes%maxLan),stat=ierr)
+       if (ierr /= 0) then
+          ierr = allocationError('modalBasis')
+          return
+       end if
+    end if
+    allocate(eigVal(sam%neq),stat=ierr)
+    if (ierr /= 0) then
+       ierr = allocationError('modalBasis')
+       return
+    end if
+
+    mip = (/ 1, 1, -1, 2, 2, 1, 0 /)
+    if (modes%factorMass) mip(6) = 2
+
+    call startTimer (eig_p)
+    call csLanczosEigenSolve (modes%Kmat, modes%Mmat, mip, mop, sam%meqn, &
+         &                    neqEig, modes%nModes, modes%nModes, &
+         &                    modes%tol, modes%shift, eigVal, modes%eqVec, &
+         &                    min(1,iprint/2), getErrorFile(), meqErr, ierr)
+    call stopTimer (eig_p)
+    if (ierr < 0) then
+       if (ierr >= -5) ierr = ierr - 10*int(meqErr(1))
+       goto 915
+    else if (ierr > 0) then
+       call reportError (warning_p,'Not all eigenvectors of the modal '// &
+            &            'basis were accepted')
+    end if
+
+    !! The Newton matrix of each mode is then M + C*svel/sacc + K/sacc,
+    !! where the modal damping C is 2*zeta*omega, and the modal stiffness
+    !! K is omega^2 (the modal mass M is unity with normalized eigenvectors)
+    do j = 1, modes%nModes
+       modes%ReVal(j) = sqrt(abs(eigVal(j)))
+       call csTransform (modes%Cmat,modes%eqVec(:,j),modes%dampRat(j),ierr)
+       if (ierr < 0) goto 915
+       if (modes%ReVal(j) > epsDiv0_p) then
+          modes%dampRat(j) = 0.5_dp*modes%dampRat(j) / modes%ReVal(j)
+       else
+          modes%dampRat(j) = 0.0_dp ! Rigid body mode
+       end if
+    end do
+
+    deallocate(eigVal)
+    return
+
+915 continue
+    call reportError (debugFileOnly_p,'modalBasis')
+
+  end subroutine modalBasis
+
+
+  !!============================================================================
+  !> @brief Solves the linearized equation system in modal coordinates.
+  !>
+  !> @param[in] modes Eigenmode data of the modal basis
+  !> @param[in] scaleM Mass matrix scaling factor
+  !> @param[in] scaleC Damping matrix scaling factor
+  !> @param[in] scaleK Stiffness matrix scaling factor
+  !> @param rhs Right-hand-side vector on input, solution vector on output
+  !>
+  !> @details The Newton matrix, scaleM*M + scaleC*C + scaleK*K, is diagonal
+  !> in the coordinates of the mass-normalized eigenvectors, assuming that
+  !> the damping matrix is diagonalized by the eigenmodes as well. The solution
+  !> is then obtained as the sum of the decoupled modal contributions,
+  !> without any factorization of the system matrix.
+  !>
+  !> @callgraph @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine modalSolve (modes,scaleM,scaleC,scaleK,rhs)
+
+    use ModesTypeModule, only : ModesType
+
+    type(ModesType), intent(in)    :: modes
+    real(dp)       , intent(in)    :: scaleM, scaleC, scaleK
+    real(dp)       , intent(inout) :: rhs(:)
+
+    !! Local variables
+    integer  :: j
+    real(dp) :: omega, q(modes%nModes)
+
+    !! --- Logic section ---
+
+    do j = 1, modes%nModes
+       omega = modes%ReVal(j)
+       q(j)  = dot_product(modes%eqVec(:,j),rhs) &
+            / (scaleM + scaleC*2.0_dp*modes%dampRat(j)*omega + scaleK*omega*omega)
+    end do
+
+    rhs = matmul(modes%eqVec(:,1:modes%nModes),q)
+
+  end subroutine modalSolve
+
+
   !!============================================================================
   !> @brief Calculates effective modal masses for the eigenmodes.
   !>
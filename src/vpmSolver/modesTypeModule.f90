@@ -33,6 +33,8 @@ module ModesTypeModule
      logical  :: addBC  !< .true. if the additional BCs should be applied
      logical  :: factorMass !< .true. if factorization of mass matrix in LANCZ2
      logical  :: stressStiffIsOn !< .true. if geometric stiffness should be used
+     logical  :: warmStart !< .true. if starting from the previous eigenvectors
+     integer  :: nStart !< Number of previous eigenvectors stored in eqVec
 
      type(SysMatrixType) :: Kmat !< System stiffness matrix
      type(SysMatrixType) :: Cmat !< System damping matrix
@@ -79,6 +81,8 @@ contains
     modes%addBC  = .false.
     modes%factorMass = .false.
     modes%stressStiffIsOn = .false.
+    modes%warmStart = .false.
+    modes%nStart = 0
 
     nullify(modes%ReVal)
     nullify(modes%ImVal)
@@ -26,7 +26,7 @@ module MotionRoutinesModule
      module procedure updatePrescribedMotionsB
   end interface
 
-  public :: updatePrescribedMotions, initPrescribedVelAcc
+  public :: updatePrescribedMotions, initPrescribedVelAcc, setPrescribedMotions
 
 
 contains
@@ -319,4 +319,81 @@ contains
 
   end subroutine initPrescribedVelAcc
 
+
+  !!==========================================================================
+  !> @brief Assigns prescribed nodal displacements from core.
+  !>
+  !> @param motions Array of all prescribed motions in the model
+  !> @param[in] nodes External node numbers of the prescribed displacements
+  !> @param[in] values Prescribed displacement values, @a nCmp per node
+  !> @param[out] ierr Error flag
+  !>
+  !> @details This subroutine is an in-core alternative to the binary file of
+  !> prescribed displacements (-displacementfile), typically used in sub-model
+  !> analysis where the displacements are computed by another solver instance.
+  !> The motions are associated with the @a values array through their external
+  !> node number, and the values are applied in the next time step.
+  !>
+  !> @callgraph @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine setPrescribedMotions (motions,nodes,values,ierr)
+
+    use MotionTypeModule      , only : MotionType, dp
+    use PrescribedMotionModule, only : setMotionValues
+    use reportErrorModule     , only : allocationError
+    use reportErrorModule     , only : reportError, error_p, debugFileOnly_p
+
+    type(MotionType), intent(inout) :: motions(:)
+    integer         , intent(in)    :: nodes(:)
+    real(dp)        , intent(in)    :: values(:)
+    integer         , intent(out)   :: ierr
+
+    !! Local variables
+    integer :: i, j, nCmp
+    integer, allocatable :: nodeIdx(:)
+
+    !! --- Logic section ---
+
+    nCmp = 0
+    if (size(nodes) > 0) nCmp = size(values)/size(nodes)
+    if (nCmp < 1 .or. nCmp*size(nodes) /= size(values)) then
+       ierr = -1
+       call reportError (error_p,'Invalid size of prescribed values array', &
+            &            addString='setPrescribedMotions')
+       return
+    end if
+
+    !! Establish the node-to-value index mapping
+    allocate(nodeIdx(max(maxval(nodes),1)),STAT=ierr)
+    if (ierr /= 0) then
+       ierr = allocationError('setPrescribedMotions')
+       return
+    end if
+
+    nodeIdx = 0
+    do j = 1, size(nodes)
+       if (nodes(j) > 0) nodeIdx(nodes(j)) = j
+    end do
+
+    do i = 1, size(motions)
+       if (motions(i)%node < 1) cycle
+       j = 0
+       if (motions(i)%node <= size(nodeIdx)) j = nodeIdx(motions(i)%node)
+       if (j > 0 .and. motions(i)%dof <= nCmp) then
+          motions(i)%ipd = nCmp*(j-1) + motions(i)%dof
+       else
+          motions(i)%ipd = 0
+       end if
+    end do
+    deallocate(nodeIdx)
+
+    call setMotionValues (values,ierr)
+    if (ierr < 0) call reportError (debugFileOnly_p,'setPrescribedMotions')
+
+  end subroutine setPrescribedMotions
+
 end module MotionRoutinesModule
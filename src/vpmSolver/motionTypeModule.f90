@@ -45,6 +45,7 @@ module MotionTypeModule
      type(TriadType)           , pointer :: triad
      integer :: dof !< Local DOF that is prescribed in the joint or triad
      integer :: ipd !< Index into the prescribed displacement values array
+     integer :: node !< External node number, for prescribed displacements
 
      type(EngineType), pointer :: engine !< Function giving current motion value
      real(dp) :: d0 !< Time-independent prescribed motion value
@@ -208,6 +209,7 @@ contains
              motions(idIn)%D = motions(idIn)%triad%urdd(lDof)
           end select
 
+          motions(idIn)%node = nodeId
           if (nodeId > 0 .and. associated(pdNodes) .and. lDof <= nCmp) then
              do i = 1, size(pdNodes)
                 if (pdNodes(i) == nodeId) then
@@ -367,6 +369,9 @@ contains
     end if
     write(io,*) 'dof         =', motion%dof
     write(io,*) 'ipd         =', motion%ipd
+    if (motion%node > 0) then
+       write(io,*) 'node        =', motion%node
+    end if
     write(io,*) 'sDof        =', motion%sDof
 
     if (associated(motion%engine)) then
@@ -429,6 +434,7 @@ contains
     nullify(motion%joint)
     motion%dof = 0
     motion%ipd = 0
+    motion%node = 0
 
     nullify(motion%engine)
     motion%d0 = 0.0_dp
@@ -500,6 +500,7 @@ contains
   !> @param[inout] resFileFormat Flag for res-file output of convergence history
   !> @param[in]    lpu File unit number for res-file output
   !> @param[out]   ierr Error flag
+  !> @param[in]    modes Eigenmodes for mode superposition integration
   !>
   !> @details This subroutine performs different sub-tasks of the solution
   !> process, depending on the value of the control variable @a iop, as follows:
@@ -540,6 +541,10 @@ contains
   !> @note iii) The third digit c is equivalent to the variable @e iopAlg
   !> elsewhere in this documentation. c &gt; 0 also implies a = 2.
   !>
+  !> If @a modes is present with computed eigenvectors and @a iop = 0,
+  !> the linearized equation system of each time step is solved by projection
+  !> onto the eigenmodes instead (mode superposition), using one iteration only.
+  !>
   !> @callgraph @callergraph
   !>
   !> @author MTHJ                              @date 1 Jun 1983
@@ -549,13 +554,14 @@ contains
   !> @author Knut Morten Okstad                @date 9 Jun 2002
 
   subroutine NewmarkInt (sam,sys,mech,ctrl,alpha,extRhs, &
-       &                 iop,NewmarkFlag,resFileFormat,lpu,ierr)
+       &                 iop,NewmarkFlag,resFileFormat,lpu,ierr,modes)
 
     use KindModule               , only : dp, i8
     use SamModule                , only : SamType
     use SystemTypeModule         , only : SystemType
     use MechanismTypeModule      , only : MechanismType
     use ControlTypeModule        , only : ControlType
+    use ModesTypeModule          , only : ModesType
     use NormTypeModule           , only : iVecNorm_p, HasConverged
     use IdTypeModule             , only : StrId
     use ControlRoutinesModule    , only : IterateControlSystem
@@ -572,6 +578,7 @@ contains
     use SupElRoutinesModule      , only : updateSupElDamping
     use EngineRoutinesModule     , only : preEvaluate, EngineValue
     use EngineRoutinesModule     , only : isPredictorStep
+    use ModesRoutinesModule      , only : modalSolve
     use solExtensionModule       , only : csSolve
     use addInSysModule           , only : BuildNewtonMat, GetForceVectors
     use profilerModule           , only : startTimer, stopTimer, sol_p, upd_p
@@ -593,10 +600,12 @@ contains
     integer            , intent(inout) :: iop, resFileFormat
     integer            , intent(in)    :: NewmarkFlag, lpu
     integer            , intent(out)   :: ierr
+    type(ModesType), optional, intent(in) :: modes
 
     !! Local variables
     integer, parameter :: nrhs_p = 1
-    logical            :: useTotalInc, doTangentUpdate
+    logical            :: useTotalInc, doTangentUpdate, useModes
+    logical, save      :: reuseTangent = .false.
     integer            :: stressStiffSkip, stressStiffSkipOnDivr
     integer            :: stopOnDivergence, cutbackNegPiv, iopAlg
     integer            :: predControl, corrControl, solveMode
@@ -604,6 +613,8 @@ contains
     integer, save      :: nWarnPivot = 0, nWarnDiverg = 0, iCutStp = 0
     real(dp)           :: H, SSTIF, SMASS, SDAMP, EPS(1), saveIter(2)
     real(dp), save     :: tolUpdateFactor = 0.0_dp
+    real(dp), save     :: convRate = 0.0_dp, prevVelNorm = 0.0_dp
+    real(dp), save     :: dtFactorized = 0.0_dp
 
     !! --- Logic section ---
 
@@ -641,6 +652,13 @@ contains
 
     end if
 
+    !! Check if the linearized equation system is to be solved by
+    !! mode superposition, instead of through the Newton matrix
+    useModes = .false.
+    if (present(modes) .and. iop == 0) then
+       useModes = associated(modes%eqVec)
+    end if
+
 100 continue ! re-entry point after iteration cut-back
     if (iop < 1) then
 
@@ -675,9 +693,17 @@ contains
        sys%nIterThisStep = 0
        sys%nUpdaThisStep = 0
        tolUpdateFactor = sys%tolUpdateFactor
-       nSeqNoUpdates = 0
        nNegPivot = 0
 
+       !! Check if the factorized Newton matrix of the previous step can be
+       !! reused. This requires the same time step size, and no prescribed
+       !! motions (their right-hand-side contributions need the matrix build).
+       reuseTangent = sys%NmatIsReusable .and. iop == 0 &
+            &         .and. convRate <= sys%tanReuseRate &
+            &         .and. sys%timeStep == dtFactorized &
+            &         .and. size(mech%motions) == 0
+       if (.not. reuseTangent) nSeqNoUpdates = 0
+
        if (associated(sys%fxItEngine)) then
           !! A variable fixed number of iterations is used
           solveMode = sys%fixedIt
@@ -819,11 +845,26 @@ contains
        sys%del = sys%residual ! Right-hand-side of the equation system
 200    continue
 
+       if (useModes) then
+          !! Solve the decoupled modal equations, no matrix assembly needed
+          doTangentUpdate = .false.
+          call startTimer (sol_p)
+          call modalSolve (modes,SMASS,SDAMP,SSTIF,sys%del)
+          call stopTimer (sol_p)
+          goto 300
+       end if
+
        !! Determine if we need to update the tangent matrix in this iteration
-       if (sys%nIterThisStep < max(1,sys%nUpdat)) then
+       if (sys%nIterThisStep == 0 .and. reuseTangent .and. &
+            & nSeqNoUpdates < sys%maxSequentialNoUpdate) then
+          doTangentUpdate = .false. ! Reuse the matrix from the previous step
+          sys%nReuses = sys%nReuses + 1_i8
+       else if (sys%nIterThisStep < max(1,sys%nUpdat)) then
           doTangentUpdate = .true. ! Always update in the first nUpdat iters.
        else if (nSeqNoUpdates >= sys%maxSequentialNoUpdate) then
           doTangentUpdate = .true. ! Too many sequentually iters. without update
+       else if (convRate > sys%tanReuseRate) then
+          doTangentUpdate = .true. ! Too slow convergence with current tangent
        else if (sys%tolUpdateFactor <= 1.0_dp) then
           doTangentUpdate = .false. ! No update tolerance is given, tangent OK
        else if (HasConverged(sys%convergenceSet,tolUpdateFactor)) then
@@ -895,6 +936,10 @@ contains
           sys%nUpdates = sys%nUpdates + 1_i8
           sys%nUpdaThisStep = sys%nUpdaThisStep + 1
           nSeqNoUpdates = 0
+          !! The factorization may be reused in the next time step only if
+          !! the Newton matrix was not subjected to external manipulations
+          sys%NmatIsReusable = sys%tanReuseRate > 0.0_dp .and. iop == 0
+          dtFactorized = sys%timeStep
           if (iop < 0) then
              iop = 6
              return
@@ -909,6 +954,7 @@ contains
        call stopTimer (sol_p)
        if (ierr < 0) goto 915
 
+300    continue
        if (ffa_cmdlinearg_isTrue('lineSearch')) then
           call IterationAccelerator(sys%nIterThisStep,sys%residual,sys%del,ierr)
           if (ierr < 0) goto 915
@@ -922,6 +968,16 @@ contains
        call CalculateIterationNorms (sam,sys,sys%nIterThisStep,ierr)
        if (ierr < 0) goto 915
 
+       !! Estimate the convergence rate from the velocity correction norms
+       if (sys%tanReuseRate <= 0.0_dp) then
+          convRate = 0.0_dp ! Matrix reuse is not enabled
+       else if (sys%nIterThisStep > 0 .and. prevVelNorm > 0.0_dp) then
+          convRate = sys%convergenceSet%velNorms(iVecNorm_p)%value/prevVelNorm
+       else
+          convRate = 0.0_dp
+       end if
+       prevVelNorm = sys%convergenceSet%velNorms(iVecNorm_p)%value
+
        !! Print iteration information
        if (resFileFormat /= 0) then
           call printConvergence (lpu,resFileFormat-1,sys%nStep+1_i8, &
@@ -960,7 +1016,12 @@ contains
        sys%nIter         = sys%nIter + 1_i8
 
        !! Check if fixed number of iterations
-       if (sys%fixedIt > 0) then
+       if (useModes) then
+
+          !! Mode superposition, the linear response is found in one iteration
+          exit
+
+       else if (sys%fixedIt > 0) then
 
           !! A fixed number of iterations has been requested
           if (sys%nIterThisStep == sys%fixedIt) exit
@@ -1096,6 +1157,7 @@ contains
       logical, intent(in) :: reduceStepSize
       iCutStp = 0
       ctrlSysMode = 4
+      sys%NmatIsReusable = .false.
       sys%time = sys%time - sys%timeStep
       if (reduceStepSize) then
          sys%cutbck(2) = sys%cutbck(2)*sys%cutbck(1)
@@ -15,7 +15,8 @@
 !> @details This module contains parameters used to identify the various program
 !> parts to be profiled, and a subroutine for printing the profiling results.
 !> Two subroutines for starting and stopping the timing of a task is imported
-!> from the timermodule.
+!> from the timermodule. It also provides the number of threads to use in the
+!> program parts that are multi-threaded.
 
 module ProfilerModule
 
@@ -182,4 +183,39 @@ contains
 
   end subroutine reportTiming
 
+
+  !!============================================================================
+  !> @brief Returns the number of threads to use in the parallel program parts.
+  !>
+  !> @details The number of threads is given by the command-line option
+  !> -numThreads. If zero or negative, the OpenMP default is used.
+  !> One is returned if the solver is built without OpenMP support,
+  !> and also in debug builds, to keep the debug output in sequence.
+  !>
+  !> @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  function getNumThreads () result(nThreads)
+
+    use FFaCmdLineArgInterface, only : ffa_cmdlinearg_getint
+    !$ use omp_lib            , only : omp_get_max_threads
+
+    !! Local variables
+    integer :: numThreads, nThreads
+
+    !! --- Logic section ---
+
+    call ffa_cmdlinearg_getint ('numThreads',numThreads)
+    nThreads = 1
+    !$ nThreads = numThreads
+    !$ if (numThreads < 1) nThreads = omp_get_max_threads()
+#ifdef FT_DEBUG
+    nThreads = 1
+#endif
+
+  end function getNumThreads
+
 end module ProfilerModule
@@ -145,6 +145,22 @@ subroutine slv_modes (nMode,eval,evec,dofOrder,useLaPack,ierr)
   call solveModes (nMode,eval,evec,dofOrder,useLaPack,ierr)
 end subroutine slv_modes
 
+!===============================================================================
+!> @brief Defines the starting vectors for the next eigenvalue analysis.
+!> @param[in] evec Starting vectors in equation order
+!> @param[in] nvec Number of starting vectors
+!> @param[out] ierr Error flag
+!> @callgraph
+subroutine slv_startmodes (evec,nvec,ierr)
+  use kindModule  , only : dp
+  use solverModule, only : setStartModes
+  implicit none
+  integer , intent(in)  :: nvec
+  real(dp), intent(in)  :: evec(*)
+  integer , intent(out) :: ierr
+  call setStartModes (evec,nvec,ierr)
+end subroutine slv_startmodes
+
 !===============================================================================
 !> @brief Solves the inverse problem at the current state.
 !> @param[in] x Array with response data at certain DOFs
@@ -484,6 +500,36 @@ subroutine slv_savepart (iopS,bid,data,ndat,ierr)
   call savePartState (iopS,bid,data,ndat,ierr)
 end subroutine slv_savepart
 
+!===============================================================================
+!> @brief Returns total nodal translations for some nodes of an FE part.
+!> @callgraph
+subroutine slv_getnodaldisp (bid,nodes,disp,nnod,ierr)
+  use kindModule  , only : dp
+  use solverModule, only : getNodalDisplacements
+  implicit none
+  integer , intent(in)  :: bid      !< Base ID of the FE part
+  integer , intent(in)  :: nodes(*) !< External node numbers
+  real(dp), intent(out) :: disp(*)  !< Total nodal translations
+  integer , intent(in)  :: nnod     !< Number of nodes
+  integer , intent(out) :: ierr     !< Error flag
+  call getNodalDisplacements (bid,nodes(1:nnod),disp(1:3*nnod),ierr)
+end subroutine slv_getnodaldisp
+
+!===============================================================================
+!> @brief Assigns prescribed nodal displacements for the next time step.
+!> @callgraph
+subroutine slv_setprescdisp (nodes,disp,nnod,ncmp,ierr)
+  use kindModule  , only : dp
+  use solverModule, only : setPrescribedDisplacements
+  implicit none
+  integer , intent(in)  :: nodes(*) !< External node numbers
+  real(dp), intent(in)  :: disp(*)  !< Prescribed nodal displacements
+  integer , intent(in)  :: nnod     !< Number of nodes
+  integer , intent(in)  :: ncmp     !< Number of components per node
+  integer , intent(out) :: ierr     !< Error flag
+  call setPrescribedDisplacements (nodes(1:nnod),disp(1:ncmp*nnod),ierr)
+end subroutine slv_setprescdisp
+
 !===============================================================================
 !> @brief Checks whether current time step have results to be saved.
 !> @callgraph
@@ -493,3 +539,14 @@ function slv_haveresults ()
   integer :: slv_haveresults
   slv_haveresults = haveResults()
 end function slv_haveresults
+
+!===============================================================================
+!> @brief Returns the accumulated solution effort counters.
+!> @callgraph
+subroutine slv_counters (counters)
+  use kindModule  , only : dp
+  use solverModule, only : solverCounters
+  implicit none
+  real(dp), intent(out) :: counters(4) !< Array receiving the counter values
+  call solverCounters (counters)
+end subroutine slv_counters
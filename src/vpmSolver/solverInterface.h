@@ -218,6 +218,60 @@ extern "C" {
   bool getRespVars(const double* disp, const int* Ids, double* resVar,
                    const int ndof, const int nId);
 
+  /*!
+    \brief Gets gage strain values from a set of displacement fields.
+    \param[in] disp    Displacement vectors (\a ndof &times; \a nvec matrix)
+    \param[in] gageIDs Array of strain gage ID numbers
+    \param[out] eps    Strain tensors (3&times;\a ng &times; \a nvec matrix)
+    \param[in] ndof    Length of each displacement vector
+    \param[in] ng      Length of gageIDs (number of gages)
+    \param[in] nvec    Number of displacement vectors
+
+    \details This is the same as calling getStrainsFromDisp() once for each
+    displacement vector, but with a single call. The matrices are assumed
+    stored column-wise, i.e., one displacement vector after the other.
+  */
+  bool getStrainsFromDispBatch(const double* disp, const int* gageIDs,
+                               double* eps, const int ndof, const int ng,
+                               const int nvec);
+
+  /*!
+    \brief Gets internal sectional forces from a set of displacement fields.
+    \param[in] disp    Displacement vectors (\a ndof &times; \a nvec matrix)
+    \param[in] beamIDs Array of beam IDs
+    \param[out] forces Sectional forces (6&times;\a nBeam &times; \a nvec matrix)
+    \param[in] ndof    Number of degrees of freedom
+    \param[in] nBeam   Number of beams
+    \param[in] nvec    Number of displacement vectors
+  */
+  bool getBeamForcesFromDispBatch(const double* disp, const int* beamIDs,
+                                  double* forces, const int ndof,
+                                  const int nBeam, const int nvec);
+
+  /*!
+    \brief Gets relative distances from a set of displacement fields.
+    \param[in]  disp   Displacement vectors (\a ndof &times; \a nvec matrix)
+    \param[in]  Ids    Array of engine IDs
+    \param[out] relDis Relative distance changes (\a nId &times; \a nvec matrix)
+    \param[in]  ndof   Number of degrees of freedom
+    \param[in]  nId    Number of engine IDs
+    \param[in]  nvec   Number of displacement vectors
+  */
+  bool getRelDispBatch(const double* disp, const int* Ids, double* relDis,
+                       const int ndof, const int nId, const int nvec);
+
+  /*!
+    \brief Gets response variable values from a set of displacement fields.
+    \param[in]  disp   Displacement vectors (\a ndof &times; \a nvec matrix)
+    \param[in]  Ids    Array of engine IDs
+    \param[out] resVar Response variable values (\a nId &times; \a nvec matrix)
+    \param[in]  ndof   Number of degrees of freedom
+    \param[in]  nId    Number of engine IDs
+    \param[in]  nvec   Number of displacement vectors
+  */
+  bool getRespVarsBatch(const double* disp, const int* Ids, double* resVar,
+                        const int ndof, const int nId, const int nvec);
+
   /*!
     \brief Saves the deformation of an FE part to the provided core array.
     \param[in] bid Base ID of the FE part to consider
@@ -242,6 +296,35 @@ extern "C" {
   */
   bool savePartStressState(int bid, double* stateData, const int ndat);
 
+  /*!
+    \brief Returns the total translations for some nodes of an FE part.
+    \param[in] bid Base ID of the FE part to consider
+    \param[in] nodes External node numbers to return displacements for
+    \param[out] disp Total translations in global directions (3 per node)
+    \param[in] nnod Number of nodes
+
+    \details This function can be used after a successful ::solveNext call,
+    to pass the displacements at the interface nodes of a global model to
+    a sub-model analysis in core, see ::setPrescribedDisplacements.
+    Stress recovery must be enabled for the FE part (-recovery option).
+  */
+  bool getNodalDisplacements(int bid, const int* nodes,
+                             double* disp, const int nnod);
+
+  /*!
+    \brief Assigns prescribed nodal displacements for the next time step.
+    \param[in] nodes External node numbers of the prescribed displacements
+    \param[in] disp Prescribed displacement values (\a ncmp per node)
+    \param[in] nnod Number of nodes
+    \param[in] ncmp Number of displacement components per node (3 or 6)
+
+    \details This is the in-core alternative to the -displacementfile option,
+    typically used in sub-model analysis. The values are associated with the
+    prescribed motions of the model through their external node number.
+  */
+  bool setPrescribedDisplacements(const int* nodes, const double* disp,
+                                  const int nnod, const int ncmp);
+
   /*!
     \brief Advances the solution one time/load step forward.
     \param[out] ierr Equal to zero on a successful computation, a non-zero
@@ -289,7 +372,8 @@ extern "C" {
     \param[out] evec Computed eigenvectors
     \param[in] dofOrder If \e true, return eigenvectors in DOF-order.
     Otherwise, they are returned in equation order
-    \param[in] useLaPack Flag usage of LAPACK eigensolvers (1=DSYGVX, 2=DGGEVX)
+    \param[in] useLaPack Flag usage of LAPACK eigensolvers (1=DSYGVX, 2=DGGEVX),
+    or subspace iteration from the previous eigenvectors (3)
     \param[out] ierr Equal to zero on a successful computation, a negative value
     indicates memory allocation error or similar issues, positive value indicate
     that the eigenvalue solver failed, but the execution may continue
@@ -298,6 +382,19 @@ extern "C" {
   bool solveEigenModes(const int nmod, double* eval, double* evec,
                        bool dofOrder, int useLaPack, int* ierr);
 
+  /*!
+    \brief Defines the starting vectors for the next eigenvalue analysis.
+    \param[in] evec Starting vectors (in equation order), typically
+    eigenvectors computed by a previous solveEigenModes invocation
+    \param[in] nvec Number of starting vectors
+    \param[out] ierr Equal to zero on a successful definition
+    \return \e true, if the starting vectors were successfully defined
+
+    \details The starting vectors are used by the next solveEigenModes
+    invocation with \a useLaPack equal to 3 only.
+  */
+  bool setEigenStartVectors(const double* evec, int nvec, int* ierr);
+
   /*!
     \brief Solves the inverse problem at current time/load step.
     \param[in] x Specified displacement values at a set of degrees of freedom
@@ -438,6 +535,13 @@ extern "C" {
   */
   int getSystemSize(bool dofs = false);
 
+  /*!
+    \brief Returns the accumulated solution effort counters.
+    \param[out] counters Number of time steps, iterations, system matrix
+    updates, and time steps started with a reused matrix factorization
+  */
+  void getSolverCounters(double* counters);
+
   /*!
     \brief Returns current content of the system Newton matrix.
     \param[out] Smat The system matrix in full format
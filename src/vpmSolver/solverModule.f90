@@ -39,6 +39,7 @@ module solverModule
   !! Model data containers
   type(SamType)      , save :: sam   !< Data for managing system matrix assembly
   type(ModesType)    , save :: modes !< Data for eigenmodes
+  type(ModesType)    , save :: mBasis !< Modal basis for mode superposition
   type(SystemType)   , save :: sys   !< System level model data
   type(ControlType)  , save :: ctrl  !< Control system data
   type(MechanismType), save :: mech  !< Mechanism objects of the model
@@ -48,6 +49,9 @@ module solverModule
   !> @details Assumed constant during Newton iterations.
   real(dp), allocatable, save :: extRhs(:)
 
+  !> @brief Externally set starting vectors for the eigenvalue solver.
+  real(dp), allocatable, save :: startVec(:,:)
+
   !! Internal global control parameters (undocumented)
   !> @cond NO_DOCUMENTATION
   logical , save :: lDouble(2), lEnergyInt, lSave, anyRes(5)
@@ -56,6 +60,7 @@ module solverModule
   real(dp), save :: flushInc, lastFlush, bufRat(5)
   real(dp), save :: alpha(2), stopGlbDmp
   real(dp), save :: printInc, lastPrint, eigInc, lastEig
+  real(dp), save :: modalInc, lastModal
   real(dp), save :: rdbInc, lastRDB, dumpBeams
 #ifdef FT_HAS_RECOVERY
   integer , save :: lRec
@@ -71,13 +76,16 @@ module solverModule
 
   public :: sam, sys, mech, resFilFM ! For frequency response analysis module
   public :: initialize, softRestart, solveStep, solveRampUp, solveModes
+  public :: setStartModes
   public :: finalize, closeAll
   public :: solveDynamic, getEngine, getEngineId, getTime, setNewTime
   public :: stateVectorSize, saveState
   public :: partStateVectorSize, savePartState
+  public :: getNodalDisplacements, setPrescribedDisplacements
   public :: strainGagesSize, saveInitGageStrains
   public :: getSystemMatrix, getElementMatrix, getRhsVector, setRhsVector
   public :: systemSize, objectEquations, objectStateVar, haveResults
+  public :: solverCounters
   public :: solverParameters, solveLinEqSystem
   public :: computeGageStrains, computeBeamForces, computeRelativeDistance
   public :: computeResponseVars, getJointSpringStiffness
@@ -116,6 +124,8 @@ contains
     use InitiateModule            , only : readSolverData, preprocessSolverData
     use InitiateSystemTypeModule  , only : initTimeStepping
     use InitiateSupElTypeModule   , only : writeSupEls2Ftn
+    use InitiateModesTypeModule   , only : initiateModes
+    use ModesTypeModule           , only : nullifyModes
     use RestartModule             , only : restartInit
     use AddInSysModule            , only : getForceVectors
     use TimeStepModule            , only : getInitialTimeStepSize
@@ -183,6 +193,7 @@ contains
 
     call initiateSaveModule ()
     call nullifySysMatrix (Amat)
+    call nullifyModes (mBasis)
 
     !! Read model data from the solver input file
     call writeProgress (' --> READ SOLVER INPUT')
@@ -224,6 +235,29 @@ contains
     call preprocessSolverData (sam,sys,ctrl,modes,mech,iprint,ierr)
     if (ierr /= 0) goto 915
 
+    !! Check if mode superposition time integration is requested
+    call ffa_cmdlinearg_getint ('modalModes',nchar)
+    if (nchar > 0) then
+       if (size(mech%motions) > 0) then
+          ierr = -1
+          call reportError (error_p,'Mode superposition is not available '// &
+               &            'for models with prescribed motions')
+          goto 915
+       end if
+       call initiateModes (sam,sys,mBasis,ierr,nchar)
+       if (ierr /= 0) goto 915
+       if (mBasis%solver > 2) then
+          ierr = -1
+          call reportError (error_p,'Mode superposition requires '// &
+               &            'the Lanczos eigenvalue solver')
+          goto 915
+       end if
+       call ffa_cmdlinearg_getdouble ('modalInc',modalInc)
+       write(chname,"(I8)") mBasis%nModes
+       call reportError (note_p,'Using mode superposition time integration'//&
+            &            ' with'//trim(chname)//' eigenmodes')
+    end if
+
     if (isQuasiStatic(sys)) then
        !! The simulation will start with quasi-static load increments
        if (size(mech%tires) > 0) then
@@ -672,6 +706,7 @@ contains
     use StaticEquilibriumModule, only : StaticInt
     use NewmarkRoutinesModule  , only : NewmarkInt
     use ModesRoutinesModule    , only : eigenModes, printModes, exportModes
+    use ModesRoutinesModule    , only : modalBasis
     use EngineRoutinesModule   , only : updateEnginesForSave, printFuncValues
 #ifdef FT_HAS_RECOVERY
     use StressRecoveryModule   , only : writeRecoveryHeaders, flushRecoveryFiles
@@ -864,13 +899,31 @@ contains
        alpha = 0.0_dp ! Switch off the global structural damping
     end if
 
+    if (mBasis%nModes > 0 .and. (iop == 0 .or. iop == -3)) then
+       !! Compute the modal basis for mode superposition, at first step and
+       !! thereafter whenever the specified recalculation interval has passed
+       if (.not. associated(mBasis%eqVec)) then
+          lastModal = sys%time
+       else if (modalInc < 0.0_dp .or. .not.hasReached(lastModal+modalInc)) then
+          goto 400
+       else
+          lastModal = sys%time
+       end if
+       call modalBasis (sam,mBasis,mech,iprint,ierr)
+       if (ierr /= 0) then
+          call reportError (error_p,'Failed to compute the modal basis')
+          goto 915
+       end if
+    end if
+
 400 if (allocated(extRhs)) then
        call NewmarkInt (sam,sys,mech,ctrl,alpha,extRhs, &
-            &           iop,NewmarkFlag,resFilFM,IO,iSimError)
+            &           iop,NewmarkFlag,resFilFM,IO,iSimError,mBasis)
     else
        call NewmarkInt (sam,sys,mech,ctrl,alpha, &
             &           iop=iop,NewmarkFlag=NewmarkFlag, &
-            &           resFileFormat=resFilFM,lpu=IO,ierr=iSimError)
+            &           resFileFormat=resFilFM,lpu=IO,ierr=iSimError, &
+            &           modes=mBasis)
     end if
     linearStatic = .false.
 
@@ -1004,6 +1057,10 @@ contains
   !> @param[in] useLaPack Flag for using LAPack eigenvalue solvers
   !> @param[out] ierr Error flag
   !>
+  !> @details If @a useLaPack equals 3, the default eigensolver is used,
+  !> but a subspace iteration starting from the eigenvectors of the previous
+  !> analysis (or those set by setStartModes) is tried first.
+  !>
   !> @callgraph @callergraph
   !>
   !> @author Knut Morten Okstad
@@ -1020,6 +1077,7 @@ contains
     use ReportErrorModule      , only : internalError
     use ReportErrorModule      , only : reportError, debugFileOnly_p, warning_p
     use FFaCmdLineArgInterface , only : ffa_cmdlinearg_getint
+    use FFaCmdLineArgInterface , only : ffa_cmdlinearg_getbool
 
     integer , intent(in)  :: nModes, useLaPack
     real(dp), intent(out) :: eVal(*), eVec(*)
@@ -1047,11 +1105,18 @@ contains
     else
        !! Use the default eigensolver
        call initiateModes (sam,sys,modes,ierr,nModes)
+       !! Warm-start from the previous eigenvectors, if requested
+       if (useLaPack == 3) modes%warmStart = .true.
     end if
     if (ierr < 0) goto 915
 
     call writeProgress (' --> EIGENVALUE CALCULATIONS')
-    call eigenModes (sam,modes,sys,mech,iprint,ierr)
+    if (allocated(startVec) .and. useLaPack == 3) then
+       call eigenModes (sam,modes,sys,mech,iprint,ierr,startVec)
+       deallocate(startVec)
+    else
+       call eigenModes (sam,modes,sys,mech,iprint,ierr)
+    end if
     if (ierr < -1) then
        if (ierr < -10) then
           meqErr(1) = -ierr/10
@@ -1091,8 +1156,9 @@ contains
     numEigSol = numEigSol + 1
     if (resFilFM == 1) resFilFM = 2 ! Must write new convergence heading
 
-    !! Reset from command-line argument
+    !! Reset from command-line arguments
     call ffa_cmdlinearg_getint ('numEigModes',modes%nModes)
+    call ffa_cmdlinearg_getbool ('warmStartEig',modes%warmStart)
 
     return
 
@@ -1101,6 +1167,49 @@ contains
   end subroutine solveModes
 
 
+  !!============================================================================
+  !> @brief Defines the starting vectors for the next eigenvalue analysis.
+  !>
+  !> @param[in] eVec0 Starting vectors, typically previous eigenvectors
+  !> @param[in] nVec0 Number of starting vectors
+  !> @param[out] ierr Error flag
+  !>
+  !> @details The vectors are assumed to be in equation order, and are used
+  !> by the next invocation of solveModes with @a useLaPack equal to 3 only.
+  !>
+  !> @callgraph @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine setStartModes (eVec0,nVec0,ierr)
+
+    use ReportErrorModule, only : allocationError
+
+    integer , intent(in)  :: nVec0
+    real(dp), intent(in)  :: eVec0(sam%neq,nVec0)
+    integer , intent(out) :: ierr
+
+    !! --- Logic section ---
+
+    if (allocated(startVec)) deallocate(startVec)
+    if (nVec0 < 1) then
+       ierr = 0
+       return
+    end if
+
+    allocate(startVec(sam%neq,nVec0),stat=ierr)
+    if (ierr /= 0) then
+       ierr = allocationError('setStartModes')
+       return
+    end if
+
+    startVec = eVec0
+
+  end subroutine setStartModes
+
+
   !!============================================================================
   !> @brief Terminates the simulation and close the result database.
   !>
@@ -1190,6 +1299,11 @@ contains
 3      format(//5X,'NUMBER OF MATRIX UPDATES:',I8, &
             &  /5X,'NUMBER OF ITERATIONS:',I12, &
             &  /5X,'NUMBER OF TIME STEPS:',I12)
+       if (sys%nReuses > 0_i8) then
+          write(IO   ,4) sys%nReuses
+          write(lterm,4) sys%nReuses
+4         format(5X,'STEPS WITH REUSED MATRIX:',I8)
+       end if
     end if
 
 
@@ -1484,6 +1598,7 @@ contains
     !! --- Logic section ---
 
     if (allocated(extRhs)) deallocate(extRhs)
+    if (allocated(startVec)) deallocate(startVec)
     if (allocated(meqErr)) deallocate(meqErr)
     if (allocated(frsNames)) deallocate(frsNames)
 
@@ -1496,6 +1611,7 @@ contains
     call castToInt8 (sam)
     call allocEigenMatrices (modes)
     call deallocateModes (modes)
+    call deallocateModes (mBasis)
     call deallocateCtrl (ctrl)
     call deallocateMechanism (mech)
     call deallocateSysMatrix (Amat)
@@ -1549,6 +1665,32 @@ contains
   end function haveResults
 
 
+  !!============================================================================
+  !> @brief Returns the accumulated solution effort counters.
+  !>
+  !> @param[out] counters Number of time steps, iterations, matrix updates
+  !> and time steps started with a reused matrix factorization, respectively
+  !>
+  !> @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine solverCounters (counters)
+
+    real(dp), intent(out) :: counters(4)
+
+    !! --- Logic section ---
+
+    counters(1) = real(sys%nStep,dp)
+    counters(2) = real(sys%nIter,dp)
+    counters(3) = real(sys%nUpdates,dp)
+    counters(4) = real(sys%nReuses,dp)
+
+  end subroutine solverCounters
+
+
   !!============================================================================
   !> @brief Returns the physical time of a specified simulation state.
   !>
@@ -2320,6 +2462,88 @@ contains
   end subroutine savePartState
 
 
+  !!============================================================================
+  !> @brief Returns total translations for some nodes of an FE part.
+  !>
+  !> @param[in] bid Base ID if the FE part to consider
+  !> @param[in] nodes External node numbers to return displacements for
+  !> @param[out] disp Total translations in global directions (3 per node)
+  !> @param[out] ierr Error flag
+  !>
+  !> @details This subroutine is used to pass the nodal displacements of a
+  !> global model to a sub-model analysis in core. It requires that stress
+  !> recovery is performed for the FE part during the simulation.
+  !>
+  !> @callgraph @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine getNodalDisplacements (bid,nodes,disp,ierr)
+
+#ifdef FT_HAS_RECOVERY
+    use StressRecoveryModule, only : getTotalDisplacement
+    use reportErrorModule   , only : reportError, debugFileOnly_p
+#else
+    use reportErrorModule   , only : reportError, error_p
+#endif
+
+    integer , intent(in)  :: bid, nodes(:)
+    real(dp), intent(out) :: disp(:)
+    integer , intent(out) :: ierr
+
+    !! --- Logic section ---
+
+#ifdef FT_HAS_RECOVERY
+    call getTotalDisplacement (mech%sups,bid,nodes,disp,ierr)
+    if (ierr < 0) call reportError (debugFileOnly_p,'getNodalDisplacements')
+#else
+    disp = 0.0_dp
+    ierr = -1
+    call reportError (error_p,'Stress recovery is not available', &
+         &            addString='getNodalDisplacements')
+#endif
+
+  end subroutine getNodalDisplacements
+
+
+  !!============================================================================
+  !> @brief Assigns prescribed nodal displacements for the next time step.
+  !>
+  !> @param[in] nodes External node numbers of the prescribed displacements
+  !> @param[in] disp Prescribed displacement values (3 or 6 per node)
+  !> @param[out] ierr Error flag
+  !>
+  !> @details This is the in-core alternative to the -displacementfile option,
+  !> for sub-model analysis where the displacements at the sub-model boundary
+  !> are computed by another solver instance running in the same process.
+  !>
+  !> @callgraph @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine setPrescribedDisplacements (nodes,disp,ierr)
+
+    use MotionRoutinesModule, only : setPrescribedMotions
+    use reportErrorModule   , only : reportError, debugFileOnly_p
+
+    integer , intent(in)  :: nodes(:)
+    real(dp), intent(in)  :: disp(:)
+    integer , intent(out) :: ierr
+
+    !! --- Logic section ---
+
+    call setPrescribedMotions (mech%motions,nodes,disp,ierr)
+    if (ierr < 0) then
+       call reportError (debugFileOnly_p,'setPrescribedDisplacements')
+    end if
+
+  end subroutine setPrescribedDisplacements
+
+
   !!============================================================================
   !> @brief Returns the dimension of the strain gages vector.
   !>
@@ -350,6 +350,7 @@ contains
 
           sys%nUpdates      = sys%nUpdates + 1_i8
           sys%nIter         = sys%nIter + 1_i8
+          sys%NmatIsReusable = .false.
           sys%nIterThisStep = sys%nIterThisStep + 1
 
           if (doIterations == 1) goto 500 ! Linear analysis, no checking
@@ -704,6 +705,7 @@ contains
 
           sys%nUpdates = sys%nUpdates + 1_i8
           sys%nUpdaThisStep = sys%nUpdaThisStep + 1
+          sys%NmatIsReusable = .false.
           nSeqNoUpdates = 0
           if (iop < 0) then
              iop = 5
@@ -51,7 +51,7 @@ module StressRecoveryModule
   public :: writeRosettes2Ftn, writeRecoveryHeaders, flushRecoveryFiles
   public :: getStrainGagesSize, initGageStrains
   public :: stressRecovery, gageRecovery, saveGageResults
-  public :: getDeformation, getDeformationSize
+  public :: getDeformation, getDeformationSize, getTotalDisplacement
   public :: getStress, getStressSize
   public :: getGageRecoveryFiles
 
@@ -148,6 +148,122 @@ contains
   end subroutine getDeformation
 
 
+  !!============================================================================
+  !> @brief Returns total translations for some nodes of the specified part.
+  !>
+  !> @param[in] sups All superelements in the model
+  !> @param[in] id Base ID of the FE part to return displacements for
+  !> @param[in] nodes External node numbers to return displacements for
+  !> @param[out] data Total translations in global directions (3 per node)
+  !> @param[out] ierr Error flag
+  !>
+  !> @details The total displacements are computed from the internal nodal
+  !> displacements recovered in the current time step. Stress recovery must
+  !> therefore be enabled for the FE part (-recovery option), without
+  !> restriction to an element group. This is an in-core alternative to reading
+  !> the Total translation nodal results from the frs-file afterwards.
+  !>
+  !> @callergraph
+  !>
+  !> @author agent
+  !>
+  !> @date 19 Oct 2026
+
+  subroutine getTotalDisplacement (sups,id,nodes,data,ierr)
+
+    use SupElTypeModule        , only : SupElType
+    use IdTypeModule           , only : StrId
+    use DisplacementModule     , only : calcTotalDisplacements
+    use ScratchArrayModule     , only : realScratchArray
+    use ReportErrorModule      , only : allocationError
+    use ReportErrorModule      , only : reportError, error_p, debugFileOnly_p
+    use FFlLinkHandlerInterface, only : ffl_set
+
+    type(SupElType), intent(in)  :: sups(:)
+    integer        , intent(in)  :: id, nodes(:)
+    real(dp)       , intent(out) :: data(:)
+    integer        , intent(out) :: ierr
+
+    !! Local variables
+    integer :: i, irec, inod, idof, j, nMiss
+    integer , allocatable :: nodeIdx(:)
+    real(rk), pointer     :: work(:)
+
+    !! --- Logic section ---
+
+    irec = 0
+    do i = 1, size(sups)
+       if (associated(sups(i)%rcy)) then
+          irec = irec + 1
+          if (sups(i)%id%baseId == id) exit
+       end if
+    end do
+    if (i > size(sups) .or. .not.allocated(part)) then
+       ierr = -1
+    else if (mod(sups(i)%rcy%recovery,2) /= 1) then
+       ierr = -2
+    else if (associated(part(irec)%B)) then
+       ierr = -3
+    else
+       ierr = 0
+    end if
+    if (ierr < 0) then
+       call reportError (error_p,'No displacement recovery for FE part '// &
+            &            trim(StrId(id)),addString='getTotalDisplacement')
+       return
+    end if
+
+    !! Calculate the total displacement state of the FE part
+    call realScratchArray (work,part(irec)%sam%ndof,ierr)
+    if (ierr < 0) goto 900
+    call ffl_set (irec)
+    call calcTotalDisplacements (sups(i),part(irec)%sam%madof, &
+         &                       part(irec)%sam%minex,part(irec)%sv, &
+         &                       work(1:part(irec)%sam%ndof),ierr)
+    if (ierr < 0) goto 900
+
+    !! Establish the external-to-internal node number mapping
+    allocate(nodeIdx(max(maxval(part(irec)%sam%minex),1)),STAT=ierr)
+    if (ierr /= 0) then
+       ierr = allocationError('getTotalDisplacement')
+       return
+    end if
+    nodeIdx = 0
+    do inod = 1, part(irec)%sam%nnod
+       if (part(irec)%sam%minex(inod) > 0) then
+          nodeIdx(part(irec)%sam%minex(inod)) = inod
+       end if
+    end do
+
+    !! Extract the translations of the requested nodes
+    nMiss = 0
+    do j = 1, min(size(nodes),size(data)/3)
+       inod = 0
+       if (nodes(j) > 0 .and. nodes(j) <= size(nodeIdx)) then
+          inod = nodeIdx(nodes(j))
+       end if
+       if (inod > 0) then
+          idof = part(irec)%sam%madof(inod)
+          data(3*j-2:3*j) = real(work(idof:idof+2),dp)
+       else
+          data(3*j-2:3*j) = 0.0_dp
+          nMiss = nMiss + 1
+       end if
+    end do
+    deallocate(nodeIdx)
+
+    if (nMiss > 0) then
+       ierr = -nMiss
+       call reportError (error_p,'Invalid node numbers for FE part '// &
+            &            trim(StrId(id)),addString='getTotalDisplacement')
+    end if
+    return
+
+900 call reportError (debugFileOnly_p,'getTotalDisplacement')
+
+  end subroutine getTotalDisplacement
+
+
   !!============================================================================
   !> @brief Returns the size of deformation vector for the specified part.
   !>
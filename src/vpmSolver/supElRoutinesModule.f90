@@ -239,6 +239,7 @@ contains
     use TriadTypeModule           , only : UpdateNodeForce
     use massMatrixCorrectionModule, only : mmcGetMassTorqueCorrection
     use HydrodynamicsModule       , only : getDragForces, getDiffractionForces
+    use HydrodynamicsModule       , only : evaluateFluidMotions
     use EngineRoutinesModule      , only : isPredictorStep
 #ifdef FT_DEBUG
     use IdTypeModule              , only : getId
@@ -280,6 +281,13 @@ contains
     end if
 
     lerr = ierr
+    if (env%rhow > 0.0_dp) then
+       !! Evaluate the sea kinematics at all wet beam nodes in one go,
+       !! possibly multi-threaded, before the Morison forces are calculated
+       call evaluateFluidMotions (sups,env,time,stat)
+       if (stat < 0) ierr = ierr + stat
+    end if
+
     do i = 1, size(sups)
        m = size(sups(i)%KmMat,1)
        n = size(sups(i)%KmMat,2)
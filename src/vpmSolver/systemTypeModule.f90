@@ -62,10 +62,13 @@ module SystemTypeModule
      integer  :: maxSequentialNoUpdate
      !> Relative tolerance to determine if tangent matrix update is necessary
      real(dp) :: tolUpdateFactor
+     !> Max. convergence rate for reusing the tangent matrix in next time step
+     real(dp) :: tanReuseRate
 
      integer(i8) :: nStep    !< Total number of time steps
      integer(i8) :: nIter    !< Total number of iterations updates
      integer(i8) :: nUpdates !< Total number of matrix updates
+     integer(i8) :: nReuses  !< Total number of steps without matrix update
 
      integer  :: nUpdaThisStep !< Number of matrix updates for this step
      integer  :: nIterThisStep !< Number of iterations for this step
@@ -104,6 +107,8 @@ module SystemTypeModule
      real(dp), pointer :: residual(:) !< Current residual force vector
 
      type(SysMatrixType) :: Nmat !< The system Newton matrix
+     !> If .true., Nmat is factorized and may be reused in the next time step
+     logical :: NmatIsReusable
 
   end type SystemType
 
@@ -167,6 +172,7 @@ contains
     write(io,*) 'nUpdat   =', sys%nUpdat
     write(io,*) 'maxSeqNU =', sys%maxSequentialNoUpdate
     write(io,*) 'tolUpdat =', sys%tolUpdateFactor
+    write(io,*) 'tanReuse =', sys%tanReuseRate
     write(io,*) 'equTol   =', sys%equTol
     write(io,*) 'equLim   =', sys%equLim
     write(io,'(A,1P3E13.5)') ' wDisp   =', sys%wDisp
@@ -230,10 +236,12 @@ contains
     sys%minIt   = 0
     sys%fixedIt = 0
     sys%nUpdat  = 0
+    sys%tanReuseRate = 0.0_dp
 
     sys%nStep    = 0_i8
     sys%nIter    = 0_i8
     sys%nUpdates = 0_i8
+    sys%nReuses  = 0_i8
     sys%nUpdaThisStep = 0
     sys%nIterThisStep = 0
     sys%nIterPrevStep = 0.0_dp
@@ -268,6 +276,7 @@ contains
     nullify(sys%residual)
 
     call nullifySysMatrix (sys%Nmat)
+    sys%NmatIsReusable = .false.
 
   end subroutine NullifySys
 
@@ -20,6 +20,14 @@ module InputUtilities
 
   implicit none
 
+  integer, private, save :: indexedFile = -1 !< File unit of the entry index
+  integer, private, save :: nIndexed = 0     !< Number of indexed entry names
+
+  !> Names of all namelist entries (upper case) in the indexed file
+  character(len=32), private, allocatable, save :: entryNames(:)
+  !> Number of occurrences of each namelist entry in the indexed file
+  integer, private, allocatable, save :: entryCounts(:)
+
   private :: iuToUpper
 
 
@@ -210,6 +218,101 @@ contains
   end function iuToUpper
 
 
+  !!============================================================================
+  !> @brief Counts all namelist entries of a solver input file in one pass.
+  !>
+  !> @param[in] file File unit number of the file to index
+  !> @param[out] ierr Error flag
+  !>
+  !> @details The file is read once, and the number of occurrences of each
+  !> namelist entry (lines starting with a `&`) is stored in an index.
+  !> Subsequent invocations of iuGetNumberOfEntries() for the same file unit
+  !> then use this index, instead of searching through the whole file again
+  !> for each entry type. The index must be cleared by iuClearIndex()
+  !> before the file unit is closed or its content is changed.
+  !>
+  !> @author agent
+  !> @date 19 Oct 2026
+
+  subroutine iuIndexEntries (file,ierr)
+
+    use reportErrorModule, only : reportError, error_p
+
+    integer, intent(in)  :: file
+    integer, intent(out) :: ierr
+
+    !! Local variables
+    integer            :: i
+    character(len=256) :: chline
+    character(len=32)  :: entryUpper
+
+    !! --- Logic section ---
+
+    call iuClearIndex ()
+    allocate(entryNames(64),entryCounts(64),STAT=ierr)
+    if (ierr /= 0) return
+
+    rewind(file,IOSTAT=ierr)
+    do while (ierr == 0)
+       read(file,'(a)',IOSTAT=ierr) chline
+       if (ierr /= 0 .or. scan(chline,'&') < 1) cycle
+
+       entryUpper = iuToUpper(chline)
+       if (entryUpper(1:1) /= '&') cycle
+
+       do i = 1, nIndexed
+          if (entryNames(i) == entryUpper) exit
+       end do
+       if (i > nIndexed) then
+          if (nIndexed == size(entryNames)) call growIndex ()
+          nIndexed = i
+          entryNames(i) = entryUpper
+          entryCounts(i) = 0
+       end if
+       entryCounts(i) = entryCounts(i) + 1
+    end do
+
+    if (ierr > 0) then
+       call iuClearIndex ()
+       call reportError (error_p,'Failed to index the input file', &
+            &            addString='iuIndexEntries')
+       return
+    end if
+
+    indexedFile = file
+    rewind(file,IOSTAT=ierr)
+
+  contains
+
+    !> @brief Doubles the size of the index arrays.
+    subroutine growIndex ()
+      character(len=32), allocatable :: newNames(:)
+      integer          , allocatable :: newCounts(:)
+      allocate(newNames(2*nIndexed),newCounts(2*nIndexed))
+      newNames(1:nIndexed) = entryNames
+      newCounts(1:nIndexed) = entryCounts
+      call move_alloc (newNames,entryNames)
+      call move_alloc (newCounts,entryCounts)
+    end subroutine growIndex
+
+  end subroutine iuIndexEntries
+
+
+  !!============================================================================
+  !> @brief Clears the namelist entry index created by iuIndexEntries().
+
+  subroutine iuClearIndex ()
+
+    !! --- Logic section ---
+
+    if (allocated(entryNames)) deallocate(entryNames)
+    if (allocated(entryCounts)) deallocate(entryCounts)
+    indexedFile = -1
+    nIndexed = 0
+
+  end subroutine iuClearIndex
+
+
   !!============================================================================
   !> @brief Counts number of entries of a text string in a solver input file.
   !>
@@ -226,17 +329,31 @@ contains
     integer         , intent(out) :: ierr
 
     !! Local variables
-    integer            :: numEntries
+    integer            :: i, numEntries
+    logical            :: isEntry
     character(len=256) :: chline, entryUpper
 
     !! --- Logic section ---
 
     numEntries = 0
     entryUpper = iuToUpper(string)
+    isEntry = entryUpper(1:1) == '&'
+
+    if (file == indexedFile .and. isEntry) then
+       !! Use the entry index instead of searching through the file
+       do i = 1, nIndexed
+          if (entryNames(i) == entryUpper) numEntries = entryCounts(i)
+       end do
+       rewind(file,IOSTAT=ierr)
+       return
+    end if
 
     rewind(file,IOSTAT=ierr)
     do while (ierr == 0)
        read(file,'(a)',IOSTAT=ierr) chline
+       if (isEntry .and. ierr == 0) then
+          if (scan(chline,'&') < 1) cycle ! Quick skip of data lines
+       end if
        if (ierr == 0 .and. iuToUpper(chline) == entryUpper) then
           numEntries = numEntries + 1
        else if (ierr > 0) then
@@ -298,6 +415,7 @@ contains
 
     !! Local variables
     integer            :: stat
+    logical            :: isEntry
     character(len=256) :: chline, entryUpper
 
     !! --- Logic section ---
@@ -307,9 +425,13 @@ contains
 
     stat = 0
     entryUpper = iuToUpper(string)
+    isEntry = entryUpper(1:1) == '&'
 
     do while (stat == 0)
        read(file,'(a)',IOSTAT=stat) chline
+       if (isEntry .and. stat == 0) then
+          if (scan(chline,'&') < 1) cycle ! Quick skip of data lines
+       end if
        if (stat == 0 .and. iuToUpper(chline) == entryUpper) then
           backspace(file,IOSTAT=stat)
           if (stat == 0) return
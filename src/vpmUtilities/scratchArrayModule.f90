@@ -29,6 +29,10 @@ module scratchArrayModule
   real(sp), save, private, allocatable, target :: sscr(:) !< Single precision
   real(dp), save, private, allocatable, target :: dscr(:) !< Double precision
 
+  !! Each thread has its own scratch arrays, such that they can be used
+  !! within parallel regions (e.g., in the parallel system matrix assembly)
+  !$omp threadprivate(iscr, lscr, sscr, dscr)
+
   !> @brief Returns a pointer to a real scratch array.
   interface realScratchArray
      module procedure singleScratchArray
@@ -68,12 +72,14 @@ contains
        return
     end if
 
+    !$omp critical (logAllocMem)
     if (ierr /= 0) then
        ierr = allocationError('ScratchArrayModule::allocateIscr')
        if (doLogMem) call logAllocMem ('allocateIscr',oldSize,-nw,nbi_p)
     else if (doLogMem) then
        call logAllocMem ('allocateIscr',oldSize,nw,nbi_p)
     end if
+    !$omp end critical (logAllocMem)
 
   end subroutine allocateIscr
 
@@ -109,12 +115,14 @@ contains
        return
     end if
 
+    !$omp critical (logAllocMem)
     if (ierr /= 0) then
        ierr = allocationError('ScratchArrayModule::allocateLscr')
        if (doLogMem) call logAllocMem ('allocateLscr',oldSize,-nw,nbi_p)
     else if (doLogMem) then
        call logAllocMem ('allocateLscr',oldSize,nw,nbi_p)
     end if
+    !$omp end critical (logAllocMem)
 
   end subroutine allocateLscr
 
@@ -151,12 +159,14 @@ contains
        return
     end if
 
+    !$omp critical (logAllocMem)
     if (ierr /= 0) then
        ierr = allocationError('ScratchArrayModule::allocateSscr')
        if (doLogMem) call logAllocMem ('allocateSscr',oldSize,-nw,nbs_p)
     else if (doLogMem) then
        call logAllocMem ('allocateSscr',oldSize,nw,nbs_p)
     end if
+    !$omp end critical (logAllocMem)
 
   end subroutine allocateSscr
 
@@ -190,12 +200,14 @@ contains
        return
     end if
 
+    !$omp critical (logAllocMem)
     if (ierr /= 0) then
        ierr = allocationError('ScratchArrayModule::allocateDscr')
        if (doLogMem) call logAllocMem ('allocateDscr',oldSize,-nw,nbd_p)
     else if (doLogMem) then
        call logAllocMem ('allocateDscr',oldSize,nw,nbd_p)
     end if
+    !$omp end critical (logAllocMem)
 
   end subroutine allocateDscr
 
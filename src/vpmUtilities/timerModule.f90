@@ -76,11 +76,15 @@ contains
   !> @brief Starts timer for the specified module.
   subroutine startTimer (iMod)
 
+    !$ use omp_lib, only : omp_get_thread_num
+
     integer , intent(in) :: iMod
     real(sp), external   :: CLKSEC, CPUSEC
 
     !! --- Logic section ---
 
+    !$ if (omp_get_thread_num() > 0) return ! Time the master thread only
+
     if (iMod > 0 .and. iMod <= size(timer)) then
        if (.not. timer(iMod)%isStarted) then
           timer(iMod)%isStarted = .true.
@@ -96,11 +100,15 @@ contains
   !> @brief Stops timer for the specified module.
   subroutine stopTimer (iMod)
 
+    !$ use omp_lib, only : omp_get_thread_num
+
     integer , intent(in) :: iMod
     real(sp), external   :: CLKSEC, CPUSEC
 
     !! --- Logic section ---
 
+    !$ if (omp_get_thread_num() > 0) return ! Time the master thread only
+
     if (iMod > 0 .and. iMod <= size(timer)) then
        if (timer(iMod)%isStarted) then
           timer(iMod)%isStarted = .false.